@@ -0,0 +1,63 @@
+"""
+Check of the default questionnaire (utils.configuration_config_mdt): the idx, names and data lists
+are of the same length, every idx is unique and the autosum formulas compile without errors.
+The compilation and a full evaluation of the formulas are timed as well.
+
+    python benchmarks/default_form.py
+
+The exit status is 1 if the default questionnaire is broken, so the script can be run as a check.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from utils.configuration_config_mdt import ConfigurationMDTH  # noqa: E402
+from utils.formula import FormulaEngine  # noqa: E402
+
+RUNS = 100
+
+
+def check() -> list:
+    """
+    Check the default questionnaire
+    :return: list of the problems found, empty if there are none
+    """
+    problems = []
+    lengths = {'idx': len(ConfigurationMDTH.idx), 'names': len(ConfigurationMDTH.names),
+               'data': len(ConfigurationMDTH.data)}
+    if len(set(lengths.values())) != 1:
+        problems.append('lists of different length: ' + ', '.join(f'{name} {n}' for name, n in lengths.items()))
+
+    duplicates = sorted({idx for idx in ConfigurationMDTH.idx if ConfigurationMDTH.idx.count(idx) > 1})
+    if duplicates:
+        problems.append(f'duplicated idx: {", ".join(duplicates)}')
+
+    rows = ConfigurationMDTH.create_configuration_config_mdt().upload[1:]
+    problems.extend(str(error) for error in FormulaEngine(rows).errors)
+    return problems
+
+
+def main() -> int:
+    problems = check()
+    rows = ConfigurationMDTH.create_configuration_config_mdt().upload[1:]
+    print(f'{len(rows)} rows')
+
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        engine = FormulaEngine(rows)
+    compiled = (time.perf_counter() - start) / RUNS * 1000
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        engine.evaluate(lambda idx: 1)
+    evaluated = (time.perf_counter() - start) / RUNS * 1000
+    print(f'compile: {compiled:.3f} ms, evaluate: {evaluated:.3f} ms ({len(engine.formulas)} formulas)')
+
+    for problem in problems:
+        print(f'FAIL: {problem}')
+    return int(bool(problems))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Import-time budget of the start-up: imports main (the start menu and the splash screen) in a fresh
+interpreter with ``python -X importtime`` and fails when a data or graph backend is imported
+or when the import takes longer than the budget.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/import_time.py [--budget MS] [--top N]
+
+The exit status is 1 on a regression, so the script can be run as a check.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+MODULE = 'main'
+# cumulative import time of MODULE in milliseconds, PySide6 itself takes about half of it
+BUDGET_MS = 500
+# backends which have to be imported lazily, when a file is opened or the main window is created
+FORBIDDEN = ('pandas', 'numpy', 'pyqtgraph', 'PyPDF2', 'pdfplumber', 'docx', 'openpyxl', 'fpdf')
+
+
+def import_times(module: str) -> dict:
+    """
+    Import a module in a fresh interpreter
+    :param module: name of the module
+    :return: dict cumulative import time in microseconds by module name
+    """
+    environment = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, env=environment, capture_output=True, text=True)
+    if result.returncode:
+        raise RuntimeError(f'import {module} failed:\n{result.stderr}')
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget', type=float, default=BUDGET_MS, help='budget in milliseconds')
+    parser.add_argument('--top', type=int, default=10, help='number of the slowest imports shown')
+    args = parser.parse_args()
+
+    times = import_times(MODULE)
+    total_ms = times[MODULE] / 1000
+    print(f'import {MODULE}: {total_ms:.1f} ms (budget {args.budget:.0f} ms), {len(times)} modules')
+    for name, cumulative in sorted(times.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f'{cumulative / 1000:10.1f} ms  {name}')
+
+    failed = False
+    imported = sorted({name.split('.')[0] for name in times}.intersection(FORBIDDEN))
+    if imported:
+        print(f'FAIL: imported at start-up: {", ".join(imported)}')
+        failed = True
+    if total_ms > args.budget:
+        print(f'FAIL: import {MODULE} takes {total_ms:.1f} ms, over the budget of {args.budget:.0f} ms')
+        failed = True
+    return int(failed)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
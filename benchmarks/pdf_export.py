@@ -0,0 +1,79 @@
+"""
+Benchmark of the pdf export: per-export font setup and per-row set_font (as save_to_pdf did before)
+against the shared template of utils.pdf_render.
+
+    python benchmarks/pdf_export.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+import fpdf.fpdf  # noqa: E402
+
+from utils import pdf_render  # noqa: E402
+from utils.snapshot import AnswerSnapshot  # noqa: E402
+
+ROWS = (1, 100, 10_000)
+REPEAT = 3
+
+
+def make_snapshot(rows: int) -> AnswerSnapshot:
+    items = [{'idx': f'{i}.1', 'name': f'Показатель {i}'} for i in range(rows)]
+    return AnswerSnapshot.create(items, [str(i) for i in range(rows)], [['1', 'Итого', str(rows)]])
+
+
+def export_per_row_setup(snapshot: AnswerSnapshot, output: str) -> None:
+    regular_path, bold_path = pdf_render.font_paths()
+    pdf = pdf_render.ExportPDF()
+    pdf.add_page()
+    pdf.add_font('DejaVu', '', regular_path, uni=True)
+    pdf.add_font('DejaVu-Bold', '', bold_path, uni=True)
+    pdf.set_font('DejaVu-Bold', '', 12)
+    pdf.cell(200, 10, txt="Data from Textboxes", ln=True, align='C')
+    for answer in snapshot.rows:
+        pdf.set_font('DejaVu', '', 12)
+        pdf.multi_cell(0, 10, txt=f"{answer.idx} | {answer.name} | {answer.value}")
+    pdf.add_page()
+    pdf.set_font('DejaVu', '', 12)
+    pdf.cell(200, 10, txt="Result Data", ln=True, align='C')
+    for row in snapshot.results:
+        pdf.set_font('DejaVu', '', 12)
+        pdf.multi_cell(0, 10, txt=" | ".join(row))
+    pdf.output(output)
+
+
+def export_template(snapshot: AnswerSnapshot, output: str) -> None:
+    pdf_render.render_snapshot(snapshot).output(output)
+
+
+def measure(function, snapshot: AnswerSnapshot, output: str) -> float:
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function(snapshot, output)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    output = os.path.join(tempfile.mkdtemp(), 'benchmark.pdf')
+
+    start = time.perf_counter()
+    pdf_render.template()
+    print(f'font parsing (once per process): {(time.perf_counter() - start) * 1000:.1f} ms')
+
+    print(f"{'rows':>8} {'per-export setup, ms':>22} {'template, ms':>14}")
+    for rows in ROWS:
+        snapshot = make_snapshot(rows)
+        # the per-export variant parses the fonts on every call, as fpdf's disk cache is disabled
+        fpdf.fpdf.FPDF_CACHE_MODE = 1
+        before = measure(export_per_row_setup, snapshot, output)
+        after = measure(export_template, snapshot, output)
+        print(f'{rows:>8} {before * 1000:>22.1f} {after * 1000:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
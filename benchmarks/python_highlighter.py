@@ -0,0 +1,99 @@
+"""
+Benchmark of the python highlighter on a 20k-line file: the rule-per-keyword highlighter
+(as PythonHighlighter was before) against the single-pass one of gui.tools.subtools.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/python_highlighter.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from PySide6.QtCore import QRegularExpression  # noqa: E402
+from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont  # noqa: E402
+from PySide6.QtWidgets import QApplication, QPlainTextEdit  # noqa: E402
+
+from gui.tools.subtools.python_highlighter import PythonHighlighter, KEYWORDS  # noqa: E402
+
+LINES = 20_000
+SAMPLE = '''class Sample{n}(object):
+    """Docstring of the sample {n}
+    spanning several lines"""
+
+    def method(self, value=None):  # comment with "quotes"
+        if value is not None and value in ('a', "b"):
+            return str(value).strip()
+        for item in range({n}):
+            yield item
+'''
+
+
+class RuleHighlighter(QSyntaxHighlighter):
+    def __init__(self, parent=None):
+        super(RuleHighlighter, self).__init__(parent)
+        keyword_format = QTextCharFormat()
+        keyword_format.setForeground(QColor("#0000FF"))
+        keyword_format.setFontWeight(QFont.Bold)
+        string_format = QTextCharFormat()
+        string_format.setForeground(QColor("#008000"))
+        comment_format = QTextCharFormat()
+        comment_format.setForeground(QColor("#808080"))
+        function_format = QTextCharFormat()
+        function_format.setForeground(QColor("#A020F0"))
+
+        self.rules = [(QRegularExpression(r'\b' + keyword + r'\b'), keyword_format) for keyword in KEYWORDS]
+        self.rules.append((QRegularExpression(r'"[^"\\]*(\\.[^"\\]*)*"'), string_format))
+        self.rules.append((QRegularExpression(r"'[^'\\]*(\\.[^'\\]*)*'"), string_format))
+        self.rules.append((QRegularExpression(r'#[^\n]*'), comment_format))
+        self.rules.append((QRegularExpression(r'\b[A-Za-z_][A-Za-z0-9_]*(?=\()'), function_format))
+
+    def highlightBlock(self, text):
+        for pattern, text_format in self.rules:
+            match_iterator = QRegularExpression(pattern).globalMatch(text)
+            while match_iterator.hasNext():
+                match = match_iterator.next()
+                self.setFormat(match.capturedStart(), match.capturedLength(), text_format)
+
+
+def make_source() -> str:
+    source = []
+    n = 0
+    while len(source) < LINES:
+        source.extend(SAMPLE.format(n=n).splitlines())
+        n += 1
+    return '\n'.join(source[:LINES])
+
+
+def open_file(app: QApplication, source: str, highlighter_class) -> tuple:
+    """
+    :return: tuple of the seconds until the file is shown and until it is fully highlighted
+    """
+    editor = QPlainTextEdit()
+    editor.resize(800, 600)
+    editor.show()
+    start = time.perf_counter()
+    editor.setPlainText(source)
+    highlighter = highlighter_class(editor.document())
+    # the first pass of QSyntaxHighlighter runs from the event loop
+    app.processEvents()
+    shown = time.perf_counter() - start
+    while getattr(highlighter, 'timer', None) is not None and highlighter.timer.isActive():
+        app.processEvents()
+    done = time.perf_counter() - start
+    editor.close()
+    return shown, done
+
+
+def main() -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    source = make_source()
+
+    print(f"{'highlighter':>14} {'shown, ms':>10} {'highlighted, ms':>16}")
+    for name, highlighter_class in (('per rule', RuleHighlighter), ('single pass', PythonHighlighter)):
+        shown, done = open_file(app, source, highlighter_class)
+        print(f'{name:>14} {shown * 1000:>10.1f} {done * 1000:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
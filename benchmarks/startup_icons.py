@@ -0,0 +1,105 @@
+"""
+Benchmark of the icon loading at start-up: the eager configurate_assets (as it was before,
+every icon decoded and smooth-scaled before the first window) against the lazy registries,
+with a cold (empty) and a warm (filled) on-disk cache of the pre-scaled icons.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/startup_icons.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from PySide6 import QtCore  # noqa: E402
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+import main  # noqa: E402
+from utils.assets import IconRegistry  # noqa: E402
+
+RUNS = 20
+# icons shown by the start menu
+START_MENU_ICONS = ('button',)
+
+
+def eager_icon(filename: str) -> QIcon:
+    pixmap = QPixmap(filename)
+    if not pixmap.isNull():
+        return QIcon(pixmap.scaled(30, 30, QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                                   QtCore.Qt.TransformationMode.SmoothTransformation))
+    return QIcon()
+
+
+def eager_assets(assets: dict) -> None:
+    for registry in (assets['icons'], assets['saves_icons']):
+        {name: eager_icon(path) for name, path in registry.paths.items()}
+
+
+def with_cache_dir(assets: dict, cache_dir: str) -> dict:
+    return {name: IconRegistry(registry.paths, registry.resources, cache_dir=cache_dir)
+            for name, registry in assets.items() if isinstance(registry, IconRegistry)}
+
+
+def start_menu(assets: dict, cache_dir: str) -> None:
+    registries = with_cache_dir(assets, cache_dir)
+    for name in START_MENU_ICONS:
+        registries['icons'][name]
+
+
+def all_icons(assets: dict, cache_dir: str) -> None:
+    for registry in with_cache_dir(assets, cache_dir).values():
+        registry.preload()
+
+
+def measure(function, *args, cold_dir: bool = False) -> float:
+    best = float('inf')
+    for _ in range(RUNS):
+        QPixmapCache.clear()
+        if cold_dir:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                start = time.perf_counter()
+                function(*args, cache_dir)
+                best = min(best, time.perf_counter() - start)
+        else:
+            start = time.perf_counter()
+            function(*args)
+            best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def measure_memory(assets: dict, cache_dir: str) -> float:
+    # QPixmapCache is kept between the runs, as it is within one session of the application
+    best = float('inf')
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        all_icons(assets, cache_dir)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main_benchmark() -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    assets = main.configurate_assets()
+    count = sum(len(registry.paths) for registry in with_cache_dir(assets, '').values())
+    print(f'{count} icons, best of {RUNS} runs')
+
+    print(f'eager configurate_assets:          {measure(eager_assets, assets):8.2f} ms')
+    print(f'lazy configurate_assets:           {measure(main.configurate_assets):8.2f} ms')
+    print(f'start menu icons, cold disk cache: {measure(start_menu, assets, cold_dir=True):8.2f} ms')
+    print(f'all icons, cold disk cache:        {measure(all_icons, assets, cold_dir=True):8.2f} ms')
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        all_icons(assets, cache_dir)
+        print(f'start menu icons, warm disk cache: {measure(start_menu, assets, cache_dir):8.2f} ms')
+        print(f'all icons, warm disk cache:        {measure(all_icons, assets, cache_dir):8.2f} ms')
+
+        QPixmapCache.clear()
+        all_icons(assets, cache_dir)
+        print(f'all icons, in memory:              {measure_memory(assets, cache_dir):8.2f} ms')
+    app.quit()
+
+
+if __name__ == '__main__':
+    main_benchmark()
@@ -0,0 +1,47 @@
+"""
+Start-up phase timings recorded by the application (utils.startup.profile): the last start
+against the median of the previous ones. A phase slower than the median by more than the
+tolerance is reported as a regression and the exit status is 1.
+
+    python benchmarks/startup_phases.py [--tolerance PERCENT] [--path FILE]
+"""
+import argparse
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from utils.startup import PROFILE_PATH, StartupProfile  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tolerance', type=float, default=25, help='allowed slowdown in percent')
+    parser.add_argument('--path', default=PROFILE_PATH, help='file of the recorded timings')
+    args = parser.parse_args()
+
+    runs = StartupProfile.load(args.path)
+    if not runs:
+        print(f'no start-ups recorded in {args.path}')
+        return 0
+
+    *previous, last = runs
+    print(f'{len(runs)} start-ups recorded, last at {last["time"]}')
+    print(f'{"phase":<14}{"last, ms":>10}{"median, ms":>12}')
+
+    regressions = []
+    for phase, elapsed in last['phases'].items():
+        history = [run['phases'][phase] for run in previous if phase in run['phases']]
+        median = statistics.median(history) if history else None
+        print(f'{phase:<14}{elapsed:>10.1f}{median if median is not None else float("nan"):>12.1f}')
+        if median and elapsed > median * (1 + args.tolerance / 100):
+            regressions.append(phase)
+
+    if regressions:
+        print(f'FAIL: slower than the median by more than {args.tolerance:.0f}%: {", ".join(regressions)}')
+    return int(bool(regressions))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
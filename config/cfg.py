@@ -2,3 +2,52 @@
 import os
 
 EXE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# rows of a part workbook of the rolling excel export before a new part is started
+EXCEL_ROLLOVER_ROWS = 10000
+
+# extracted pdf pages kept in memory by the pdf viewer and pages extracted ahead of the current one
+PDF_CACHE_PAGES = 32
+PDF_PREFETCH_PAGES = 2
+
+# rows of a csv/excel file read at a time while the table is scrolled
+TABLE_CHUNK_ROWS = 1000
+# chunks of a csv/excel file held by its table, the others are read again when scrolled back to
+TABLE_CACHED_CHUNKS = 8
+
+# text files larger than LARGE_TEXT_BYTES are shown read-only, line by line from a memory map
+LARGE_TEXT_BYTES = 8 * 1024 * 1024
+LINE_INDEX_CHUNK_BYTES = 32 * 1024 * 1024
+
+# output of the python console worker is sent at least every PYCONSOLE_FLUSH_SECONDS or every PYCONSOLE_BATCH_CHARS
+PYCONSOLE_FLUSH_SECONDS = 0.05
+PYCONSOLE_BATCH_CHARS = 8192
+
+# output of a bash console command is shown at least every BASH_FLUSH_SECONDS or every BASH_BATCH_CHARS
+BASH_FLUSH_SECONDS = 0.05
+BASH_BATCH_CHARS = 16384
+# lines kept in the bash console, the oldest are dropped
+BASH_MAX_LINES = 10000
+# seconds after which a bash console command is killed, None to wait for it forever
+BASH_COMMAND_TIMEOUT = None
+# seconds the output of a killed command is still read, a process which left its process group may hold the pipes
+BASH_KILL_SECONDS = 1.0
+
+# files of the application kept between runs (pre-scaled icons, environment probes, start-up timings)
+APP_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'proj-00-234')
+
+# icons are scaled to ICON_SIZE pixels once and kept pre-scaled in ICON_CACHE_DIR between runs
+ICON_SIZE = 30
+ICON_CACHE_DIR = os.path.join(APP_CACHE_DIR, 'icons')
+
+# parsed files (docx tables, pdf page texts) of every project are cached as json in PARSE_CACHE_DIR,
+# the least recently used entries are evicted above PARSE_CACHE_MAX_BYTES
+PARSE_CACHE_DIR = os.path.join(APP_CACHE_DIR, 'parse')
+PARSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# results of the environment probes (e.g. the installed python) are trusted for PROBE_MAX_AGE seconds
+PROBE_MAX_AGE = 7 * 24 * 3600
+# the start-up housekeeping (removal of __pycache__ directories) runs at most every HOUSEKEEPING_INTERVAL seconds
+HOUSEKEEPING_INTERVAL = 24 * 3600
+# phase timings of the last STARTUP_PROFILE_RUNS starts are kept in APP_CACHE_DIR
+STARTUP_PROFILE_RUNS = 50
@@ -1,31 +1,153 @@
+import codecs
+import locale
+import os
+import queue
+import signal
 import subprocess
+import threading
+import time
 
 from PySide6.QtCore import QThread, Signal
 
+from config.cfg import BASH_FLUSH_SECONDS, BASH_BATCH_CHARS, BASH_COMMAND_TIMEOUT, BASH_KILL_SECONDS
+
 
 class CommandThread(QThread):
+    """
+    Run a shell command and stream its output.
+    stdout and stderr are drained at the same time by two reader threads, the output is emitted in
+    batches bounded by BASH_FLUSH_SECONDS and BASH_BATCH_CHARS.
+    """
     outputReceived = Signal(str)
-    commandFinished = Signal()
+    commandFinished = Signal(int)  # exit code
 
-    def __init__(self, command, cwd=None):
+    def __init__(self, command, cwd=None, timeout: float | None = BASH_COMMAND_TIMEOUT):
         super().__init__()
         self.command = command
         self.cwd = cwd
+        self.timeout = timeout
+        self.process: subprocess.Popen | None = None
+        self._killed: threading.Event = threading.Event()
+
+    def kill(self) -> None:
+        """
+        Kill the command and the processes it started
+        :return: None
+        """
+        self._killed.set()
+        process = self.process
+        if process is None:
+            return
+        try:
+            if os.name == 'posix':
+                # the process group outlives the shell while a background job of the command holds the pipes,
+                # so it is signalled as long as they are read, even if the shell has exited
+                if self.isRunning():
+                    os.killpg(process.pid, signal.SIGKILL)
+            elif process.poll() is None:
+                subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except ProcessLookupError:
+            pass
+        except (OSError, subprocess.SubprocessError):
+            if process.poll() is None:
+                process.kill()
 
     def run(self):
-        process = subprocess.Popen(
-            self.command,
-            shell=True,
-            cwd=self.cwd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        for line in iter(process.stdout.readline, ''):
-            self.outputReceived.emit(line)
-        for line in iter(process.stderr.readline, ''):
-            self.outputReceived.emit(line)
-        process.stdout.close()
-        process.stderr.close()
-        process.wait()
-        self.commandFinished.emit()
+        options: dict = {'start_new_session': True} if os.name == 'posix' else \
+            {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+        try:
+            self.process = subprocess.Popen(
+                self.command,
+                shell=True,
+                cwd=self.cwd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+                **options
+            )
+        except OSError as e:
+            self.outputReceived.emit(f'Error: {e}\n')
+            self.commandFinished.emit(-1)
+            return
+
+        chunks: queue.Queue = queue.Queue()
+        readers: list = [threading.Thread(target=self._read, args=(pipe, chunks), daemon=True)
+                         for pipe in (self.process.stdout, self.process.stderr)]
+        for reader in readers:
+            reader.start()
+
+        encoding: str = locale.getpreferredencoding(False)
+        decoders: dict = {pipe: codecs.getincrementaldecoder(encoding)(errors='replace')
+                          for pipe in (self.process.stdout, self.process.stderr)}
+        deadline: float | None = time.monotonic() + self.timeout if self.timeout else None
+        parts: list = []
+        size: int = 0
+        last_emit: float = time.monotonic()
+        open_pipes: int = len(readers)
+        given_up: float | None = None
+
+        while open_pipes:
+            now: float = time.monotonic()
+            if deadline is not None and now >= deadline:
+                deadline = None
+                if not self._killed.is_set():
+                    self.kill()
+                    parts.append(f'\n[Команда остановлена: превышено время ожидания {self.timeout} с]\n')
+
+            # after the kill the pipes may still be held by a process which left the process group,
+            # they are read for BASH_KILL_SECONDS more and then left to the daemon reader threads
+            if given_up is None and self._killed.is_set():
+                given_up = now + BASH_KILL_SECONDS
+            if given_up is not None and now >= given_up:
+                break
+
+            # without pending output there is nothing to flush, the loop sleeps until data or the deadline comes
+            wait: float = max(0.0, BASH_FLUSH_SECONDS - (now - last_emit)) if parts else BASH_FLUSH_SECONDS
+            for limit in (deadline, given_up):
+                if limit is not None:
+                    wait = min(wait, max(0.0, limit - now))
+            try:
+                pipe, data = chunks.get(timeout=wait)
+            except queue.Empty:
+                pipe, data = None, b''
+
+            if pipe is not None:
+                text: str = decoders[pipe].decode(data or b'', final=data is None)
+                if data is None:
+                    open_pipes -= 1
+                if text:
+                    parts.append(text)
+                    size += len(text)
+
+            if parts and (size >= BASH_BATCH_CHARS or time.monotonic() - last_emit >= BASH_FLUSH_SECONDS
+                          or not open_pipes):
+                self.outputReceived.emit(''.join(parts))
+                parts, size = [], 0
+                last_emit = time.monotonic()
+
+        if parts:
+            self.outputReceived.emit(''.join(parts))
+        exit_code: int = self.process.wait()
+        if not open_pipes:
+            self.process.stdout.close()
+            self.process.stderr.close()
+        self.commandFinished.emit(exit_code)
+
+    @staticmethod
+    def _read(pipe, chunks: queue.Queue) -> None:
+        """
+        Read a pipe until the end, the end is reported with None
+        :param pipe: stdout or stderr of the process
+        :param chunks: queue of (pipe, bytes) tuples
+        :return: None
+        """
+        try:
+            while True:
+                data: bytes = pipe.read(65536)
+                if not data:
+                    break
+                chunks.put((pipe, data))
+        finally:
+            chunks.put((pipe, None))
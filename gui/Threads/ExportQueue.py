@@ -0,0 +1,268 @@
+import threading
+from typing import Callable, Dict, List, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from utils.snapshot import AnswerSnapshot
+
+
+class ExportCancelled(Exception):
+    """
+    Raised from the progress callback of a cancelled export job
+    """
+
+
+class ExportSignals(QObject):
+    """
+    Signals of an export job (QRunnable is not a QObject and cannot emit them)
+    """
+    progress = Signal(object, int)  # job, percent
+    done = Signal(object, bool, object)  # job, success, error
+    dropped = Signal(object)  # job removed from the queue before it started
+
+
+class ExportJob(QRunnable):
+    """
+    One call of a ``save_to_*`` / ``append_to_*`` function on a worker thread
+    """
+
+    def __init__(self, name: str, callback: Callable, path: str, snapshot: AnswerSnapshot | None) -> None:
+        """
+        Initialize the export job
+        :param name: name of the callback, e.g. "save_pdf" or "append_pdf"
+        :param callback: export function
+        :param path: path of the project
+        :param snapshot: answer snapshot to export, None for the jobs merging the appended sessions
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self.name: str = name
+        self.callback: Callable = callback
+        self.path: str = path
+        self.snapshot: AnswerSnapshot = snapshot
+        self.targets: Tuple[str, ...] = ExportQueue.targets_of(name, path)
+        self.signals: ExportSignals = ExportSignals()
+        self._cancelled: threading.Event = threading.Event()
+        self._percent: int = -1
+
+    @property
+    def overwrites(self) -> bool:
+        """
+        Check if the job rewrites the whole target file
+        :return: bool True for save jobs, False for append jobs
+        """
+        return self.name.startswith('save')
+
+    def cancel(self) -> None:
+        """
+        Ask the job to stop at the next exported row
+        :return: None
+        """
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self) -> None:
+        """
+        Run the export function and report its result
+        :return: None
+        """
+        if self.is_cancelled():
+            self.signals.done.emit(self, False, ExportCancelled())
+            return
+
+        try:
+            success, error = self.callback(path=self.path, snapshot=self.snapshot, progress=self._report)
+        except Exception as e:
+            success, error = False, e
+        self.signals.done.emit(self, success, error)
+
+    def _report(self, done: int, total: int) -> None:
+        """
+        Progress callback passed to the export function
+        :param done: number of exported rows
+        :param total: total number of rows
+        :return: None
+        """
+        if self.is_cancelled():
+            raise ExportCancelled()
+
+        percent: int = done * 100 // total if total else 100
+        if percent != self._percent:
+            self._percent = percent
+            self.signals.progress.emit(self, percent)
+
+
+class ExportQueue(QObject):
+    """
+    Queue of export jobs run on a thread pool.
+
+    Jobs writing the same file run one after another, jobs writing different
+    files run in parallel. A job writing several files (save_all) waits for every
+    one of them. A new save supersedes the jobs still waiting for the same files,
+    appends are kept in order.
+    """
+    job_started = Signal(str)  # job name
+    job_progress = Signal(str, int)  # job name, percent
+    job_finished = Signal(str)  # job name
+    job_failed = Signal(str, str)  # job name, error message
+    job_cancelled = Signal(str)  # job name
+    queue_empty = Signal()
+
+    def __init__(self, max_workers: int = 2, parent: QObject = None) -> None:
+        """
+        Initialize the export queue
+        :param max_workers: maximum number of jobs running at the same time
+        :param parent: parent object
+        """
+        super().__init__(parent)
+        self.pool: QThreadPool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_workers)
+        self._running: Dict[str, ExportJob] = {}
+        self._pending: List[ExportJob] = []
+
+    @staticmethod
+    def target_of(name: str, path: str) -> str:
+        """
+        Get the key of the file written by an export callback
+        :param name: name of the callback, e.g. "save_pdf"
+        :param path: path of the project
+        :return: str key shared by the save and append callbacks of a format
+        """
+        _, _, file_format = name.partition('_')
+        return f'{path}:{file_format}'
+
+    @staticmethod
+    def targets_of(name: str, path: str) -> Tuple[str, ...]:
+        """
+        Get the keys of every file written by an export callback
+        :param name: name of the callback, e.g. "save_pdf" or "save_all"
+        :param path: path of the project
+        :return: tuple of keys, one per format
+        """
+        if name == 'save_all':
+            from utils.s2f import SAVE_ALL_EXPORTERS
+            return tuple(ExportQueue.target_of(f'save_{file_format}', path) for file_format in SAVE_ALL_EXPORTERS)
+        return ExportQueue.target_of(name, path),
+
+    def submit(self, name: str, callback: Callable, path: str, snapshot: AnswerSnapshot | None) -> ExportJob:
+        """
+        Queue an export job
+        :param name: name of the callback, e.g. "save_pdf" or "append_pdf"
+        :param callback: export function
+        :param path: path of the project
+        :param snapshot: answer snapshot to export, None for the jobs merging the appended sessions
+        :return: ExportJob
+        """
+        return self.enqueue(ExportJob(name, callback, path, snapshot))
+
+    def enqueue(self, job: ExportJob) -> ExportJob:
+        """
+        Queue a job created by the caller, e.g. to connect its signals before it can start
+        :param job: ExportJob
+        :return: ExportJob
+        """
+        job.signals.progress.connect(self._on_job_progress)
+        job.signals.done.connect(self._on_job_done)
+
+        if job.overwrites:
+            # the waiting jobs of the same files would be overwritten anyway
+            for superseded in [waiting for waiting in self._pending if set(waiting.targets) <= set(job.targets)]:
+                self._drop(superseded)
+        self._pending.append(job)
+
+        self._start_next()
+        return job
+
+    def cancel(self, job: ExportJob) -> None:
+        """
+        Cancel a waiting or running job
+        :param job: ExportJob
+        :return: None
+        """
+        if job in self._pending:
+            self._drop(job)
+            self._start_next()
+            self._check_empty()
+        else:
+            job.cancel()
+
+    def cancel_all(self) -> None:
+        """
+        Cancel every waiting and running job
+        :return: None
+        """
+        for job in list(self._pending):
+            self._drop(job)
+        for job in set(self._running.values()):
+            job.cancel()
+        self._check_empty()
+
+    def jobs(self) -> List[ExportJob]:
+        """
+        Get the running and waiting jobs
+        :return: list of ExportJob
+        """
+        return list(dict.fromkeys(self._running.values())) + self._pending
+
+    def is_busy(self) -> bool:
+        return bool(self.jobs())
+
+    def wait(self, msecs: int = -1) -> bool:
+        """
+        Wait for the running jobs to finish
+        :param msecs: timeout in milliseconds, -1 to wait forever
+        :return: bool True if every job has finished
+        """
+        return self.pool.waitForDone(msecs)
+
+    def _drop(self, job: ExportJob) -> None:
+        """
+        Remove a job which has not started from the queue
+        :param job: waiting ExportJob
+        :return: None
+        """
+        self._pending.remove(job)
+        job.cancel()
+        self.job_cancelled.emit(job.name)
+        job.signals.dropped.emit(job)
+
+    def _start_next(self) -> None:
+        """
+        Start the waiting jobs whose files are free, in the order they were queued
+        :return: None
+        """
+        # a file is busy while a job writes it or an earlier job waits for it, so its jobs keep their order
+        busy: set = set(self._running)
+        for job in list(self._pending):
+            if busy.isdisjoint(job.targets):
+                self._pending.remove(job)
+                for target in job.targets:
+                    self._running[target] = job
+                self.job_started.emit(job.name)
+                self.pool.start(job)
+            busy.update(job.targets)
+
+    def _on_job_progress(self, job: ExportJob, percent: int) -> None:
+        if not job.is_cancelled():
+            self.job_progress.emit(job.name, percent)
+
+    def _on_job_done(self, job: ExportJob, success: bool, error: Exception | None) -> None:
+        for target in job.targets:
+            if self._running.get(target) is job:
+                del self._running[target]
+
+        if job.is_cancelled():
+            self.job_cancelled.emit(job.name)
+        elif success:
+            self.job_finished.emit(job.name)
+        else:
+            self.job_failed.emit(job.name, str(error))
+
+        self._start_next()
+        self._check_empty()
+
+    def _check_empty(self) -> None:
+        if not self.is_busy():
+            self.queue_empty.emit()
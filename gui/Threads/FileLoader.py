@@ -0,0 +1,42 @@
+from typing import Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class FileLoadSignals(QObject):
+    """
+    Signals of a file load job (QRunnable is not a QObject and cannot emit them)
+    """
+    loaded = Signal(int, str, object)  # generation, file path, data
+    failed = Signal(int, str, str)  # generation, file path, error message
+
+
+class FileLoadJob(QRunnable):
+    """
+    Parse a file on a worker thread of the pool
+    """
+
+    def __init__(self, generation: int, file_path: str, loader: Callable[[str], list]) -> None:
+        """
+        Initialize the load job
+        :param generation: number of the load request, used to drop stale results
+        :param file_path: path of the file to load
+        :param loader: function parsing the file into the data of the container
+        """
+        super().__init__()
+        self.generation: int = generation
+        self.file_path: str = file_path
+        self.loader: Callable[[str], list] = loader
+        self.signals: FileLoadSignals = FileLoadSignals()
+
+    def run(self) -> None:
+        """
+        Load the file and report the result
+        :return: None
+        """
+        try:
+            data = self.loader(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, self.file_path, str(e))
+        else:
+            self.signals.loaded.emit(self.generation, self.file_path, data)
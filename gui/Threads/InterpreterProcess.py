@@ -0,0 +1,327 @@
+import json
+import os
+import signal
+import sys
+
+from PySide6.QtCore import QObject, QProcess, QProcessEnvironment, Signal
+
+from config.cfg import PYCONSOLE_FLUSH_SECONDS, PYCONSOLE_BATCH_CHARS
+
+# Worker interpreter run with ``python -c``. It reads one json request per line on stdin
+# ({"id": n, "code": line}) and answers with json lines on its original stdout:
+# {"type": "output", "stream": "stdout" | "stderr", "text": ...} and {"type": "done", "id": n, "more": bool}.
+WORKER_SOURCE = r'''
+import code
+import codecs
+import json
+import os
+import sys
+import threading
+import time
+
+FLUSH_SECONDS = %(flush)r
+BATCH_CHARS = %(batch)r
+# written into the forwarded fd 1 to find out when everything written before it has been forwarded
+DRAIN_MARK = b"\0"
+
+# the protocol keeps a private copy of fd 1, fd 1 itself becomes a pipe whose data is sent as stdout:
+# what child processes and C extensions write to fd 1 is shown instead of breaking the protocol
+protocol = os.fdopen(os.dup(1), "w", encoding="utf-8", newline="\n")
+protocol_lock = threading.Lock()
+raw_read, raw_write = os.pipe()
+os.dup2(raw_write, 1)
+os.close(raw_write)
+if os.name == "nt":
+    # child processes inherit the standard handle, not fd 1 of the C runtime
+    import ctypes
+    import msvcrt
+    ctypes.windll.kernel32.SetStdHandle(-11, msvcrt.get_osfhandle(1))
+drained = threading.Event()
+
+
+def send(message):
+    with protocol_lock:
+        protocol.write(json.dumps(message) + "\n")
+        protocol.flush()
+
+
+class Stream:
+    def __init__(self, name):
+        self.name = name
+        self.parts = []
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def write(self, text):
+        text = str(text)
+        with self.lock:
+            self.parts.append(text)
+            self.size += len(text)
+            full = self.size >= BATCH_CHARS
+        if full:
+            self.flush()
+        return len(text)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        with self.lock:
+            if not self.parts:
+                return
+            text = "".join(self.parts)
+            self.parts, self.size = [], 0
+        send({"type": "output", "stream": self.name, "text": text})
+
+    def isatty(self):
+        return False
+
+
+def flush_periodically():
+    while True:
+        time.sleep(FLUSH_SECONDS)
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+def forward_raw_output():
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    while True:
+        data = os.read(raw_read, 65536)
+        if not data:
+            break
+        marks = data.count(DRAIN_MARK)
+        if marks:
+            data = data.replace(DRAIN_MARK, b"")
+        if data:
+            sys.stdout.write(decoder.decode(data))
+        if marks:
+            drained.set()
+
+
+def drain_raw_output():
+    drained.clear()
+    os.write(1, DRAIN_MARK)
+    # a background process flooding fd 1 must not hold the prompt back
+    drained.wait(1)
+
+
+sys.stdout = Stream("stdout")
+sys.stderr = Stream("stderr")
+threading.Thread(target=flush_periodically, daemon=True).start()
+threading.Thread(target=forward_raw_output, daemon=True).start()
+console = code.InteractiveConsole(locals={"__name__": "__console__"})
+
+while True:
+    try:
+        raw = sys.stdin.readline()
+    except KeyboardInterrupt:
+        continue
+    if not raw:
+        break
+
+    request = json.loads(raw)
+    more = False
+    try:
+        more = console.push(request["code"])
+    except KeyboardInterrupt:
+        console.resetbuffer()
+        sys.stderr.write("KeyboardInterrupt\n")
+    finally:
+        try:
+            drain_raw_output()
+        except KeyboardInterrupt:
+            pass
+        sys.stdout.flush()
+        sys.stderr.flush()
+        send({"type": "done", "id": request["id"], "more": more})
+''' % {'flush': PYCONSOLE_FLUSH_SECONDS, 'batch': PYCONSOLE_BATCH_CHARS}
+
+
+class InterpreterProcess(QObject):
+    """
+    Python interpreter running in a separate process.
+    Lines are executed one at a time, the output is read without blocking and emitted in batches.
+    """
+    output = Signal(str, str)  # stream name, text
+    ready = Signal(bool)  # True if the statement goes on in the next line
+    stopped = Signal(int)  # exit code
+
+    def __init__(self, cwd: str = None, parent: QObject = None) -> None:
+        """
+        Initialize the interpreter, the process is started by start
+        :param cwd: working directory of the interpreter
+        :param parent: parent object
+        """
+        super().__init__(parent)
+        self.cwd: str | None = cwd
+        self.process: QProcess | None = None
+        self._buffer: bytes = b''
+        self._request_id: int = 0
+        self._running: int | None = None
+
+    @staticmethod
+    def executable() -> str:
+        """
+        Get the python interpreter of the worker
+        :return: str path or name of the interpreter
+        """
+        # a bundled build has no interpreter of its own, the one installed in the system is used
+        return 'python' if getattr(sys, 'frozen', False) else sys.executable
+
+    @property
+    def busy(self) -> bool:
+        return self._running is not None
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.state() != QProcess.ProcessState.NotRunning
+
+    def start(self) -> None:
+        """
+        Start the worker process
+        :return: None
+        """
+        if self.is_running():
+            return
+
+        environment: QProcessEnvironment = QProcessEnvironment.systemEnvironment()
+        environment.insert('PYTHONIOENCODING', 'utf-8')
+        environment.insert('PYTHONUNBUFFERED', '1')
+
+        self._buffer = b''
+        self._running = None
+        self.process = QProcess(self)
+        self.process.setProcessEnvironment(environment)
+        if self.cwd and os.path.isdir(self.cwd):
+            self.process.setWorkingDirectory(self.cwd)
+        self.process.readyReadStandardOutput.connect(self._on_ready_read)
+        self.process.readyReadStandardError.connect(self._on_ready_read_error)
+        self.process.finished.connect(self._on_finished)
+        self.process.errorOccurred.connect(self._on_error)
+        self.process.start(self.executable(), ['-u', '-c', WORKER_SOURCE])
+
+    def execute(self, line: str) -> bool:
+        """
+        Send a line to the interpreter
+        :param line: line of python code
+        :return: bool False if the interpreter is still executing the previous line
+        """
+        if self.busy:
+            return False
+        if not self.is_running():
+            self.start()
+
+        self._request_id += 1
+        self._running = self._request_id
+        request: bytes = (json.dumps({'id': self._request_id, 'code': line}) + '\n').encode('utf-8')
+        self.process.write(request)
+        return True
+
+    def interrupt(self) -> None:
+        """
+        Interrupt the running line with KeyboardInterrupt, the interpreter is restarted where it cannot be signalled
+        :return: None
+        """
+        if not self.busy or not self.is_running():
+            return
+        if os.name == 'posix':
+            os.kill(self.process.processId(), signal.SIGINT)
+        else:
+            self.restart()
+
+    def restart(self) -> None:
+        """
+        Start a new interpreter, the variables of the previous one are lost
+        :return: None
+        """
+        self.stop()
+        self.start()
+
+    def stop(self) -> None:
+        """
+        Stop the worker process
+        :return: None
+        """
+        if self.process is None:
+            return
+
+        process: QProcess = self.process
+        self.process = None
+        process.readyReadStandardOutput.disconnect(self._on_ready_read)
+        process.readyReadStandardError.disconnect(self._on_ready_read_error)
+        process.finished.disconnect(self._on_finished)
+        process.errorOccurred.disconnect(self._on_error)
+        if process.state() != QProcess.ProcessState.NotRunning:
+            process.closeWriteChannel()
+            if not process.waitForFinished(500):
+                process.kill()
+                process.waitForFinished(1000)
+        process.deleteLater()
+        self._finish_running()
+
+    def _on_ready_read(self) -> None:
+        """
+        Read the messages of the worker, the output of one read is emitted at once
+        :return: None
+        """
+        self._buffer += bytes(self.process.readAllStandardOutput())
+        *lines, self._buffer = self._buffer.split(b'\n')
+
+        stream: str | None = None
+        parts: list = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError:
+                message = None
+            if not isinstance(message, dict) or 'type' not in message:
+                # not a message of the worker, e.g. the output of a process started by the user code
+                message = {'type': 'output', 'stream': 'stdout',
+                           'text': line.decode('utf-8', errors='replace') + '\n'}
+
+            if message['type'] == 'output':
+                if message['stream'] != stream and parts:
+                    self.output.emit(stream, ''.join(parts))
+                    parts = []
+                stream = message['stream']
+                parts.append(message['text'])
+            elif message['type'] == 'done':
+                if parts:
+                    self.output.emit(stream, ''.join(parts))
+                    stream, parts = None, []
+                if message['id'] == self._running:
+                    self._running = None
+                    self.ready.emit(message['more'])
+
+        if parts:
+            self.output.emit(stream, ''.join(parts))
+
+    def _on_ready_read_error(self) -> None:
+        # errors of the interpreter itself, e.g. a failed start-up
+        text: str = bytes(self.process.readAllStandardError()).decode('utf-8', errors='replace')
+        if text:
+            self.output.emit('stderr', text)
+
+    def _on_error(self, error: QProcess.ProcessError) -> None:
+        if error != QProcess.ProcessError.FailedToStart or self.process is None:
+            return
+        self.process.deleteLater()
+        self.process = None
+        self.output.emit('stderr', f'Failed to start {self.executable()}\n')
+        self._finish_running()
+
+    def _on_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        if self.process is not None:
+            self._on_ready_read()
+            self.process.deleteLater()
+        self.process = None
+        self.stopped.emit(exit_code)
+        self._finish_running()
+
+    def _finish_running(self) -> None:
+        if self._running is not None:
+            self._running = None
+            self.ready.emit(False)
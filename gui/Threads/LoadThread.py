@@ -1,19 +1,20 @@
-import sys
-import time
-from PySide6.QtCore import Qt, QThread, Signal, QEventLoop
-from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QProgressBar, QPushButton
-from time import perf_counter
+import inspect
+from typing import Any, List
 
-from gui.Threads.CallbackThread import CallbackThread
+from PySide6.QtCore import QObject, QThread, Signal
 
 
 class LoaderThread(QThread):
     """
-    LoaderThread is a thread that runs a function in a separate thread
+    LoaderThread is a thread that runs a function in a separate thread.
+
+    A generator function reports its progress through its yields: a ``(done, total)`` tuple
+    updates the progress, a string is a status message, any other value is ignored.
     """
     progress_update = Signal(int)  # Сигнал для обновления прогресса
     task_completed = Signal()  # Сигнал для завершения задачи
     task_string_signal = Signal(str)
+    task_failed = Signal(str)  # error message
 
     def __init__(self, function_to_run: callable, *args, **kwargs) -> None:
         """
@@ -23,34 +24,100 @@ class LoaderThread(QThread):
         self.task = function_to_run
         self.args = args
         self.kwargs = kwargs
+        self.progress: int = 0
+
     def run(self) -> None:
         """
-        Runs the function in the separate thread and updates the progress bar
+        Runs the function in the separate thread and reports its progress as it goes
         :return: None
         """
+        try:
+            result = self.task(*self.args, **self.kwargs)
+            if inspect.isgenerator(result):
+                for event in result:
+                    self._report(event)
+        except Exception as e:
+            self.task_failed.emit(str(e))
 
-        elapsed_time = self._calculate_emulate_time_running()
-        for i in range(101):
-            QThread.msleep(int(elapsed_time * 10))  # Задержка пропорционально времени выполнения
-            self._update_progress(i)
-
+        self._update_progress(100)
         self.task_completed.emit()
 
+    def _report(self, event: Any) -> None:
+        """
+        Reports a value yielded by the task
+        :param event: (done, total) tuple or status message
+        :return: None
+        """
+        if isinstance(event, tuple) and len(event) == 2:
+            done, total = event
+            self._update_progress(min(100, done * 100 // total) if total else 100)
+        elif isinstance(event, str):
+            self.task_string_signal.emit(event)
+
     def _update_progress(self, progress: int) -> None:
         """
         Updates the progress bar with the given progress value
         :param progress: the progress value
         :return: None
         """
-        self.progress_update.emit(progress)
+        if progress != self.progress:
+            self.progress = progress
+            self.progress_update.emit(progress)
+
+
+class LoaderGroup(QObject):
+    """
+    Independent tasks run at the same time, each in its own LoaderThread.
+    The progress is the mean progress of the tasks, the group is completed when every task is.
+    """
+    progress_update = Signal(int)
+    task_completed = Signal()
+    task_string_signal = Signal(str)
+    task_failed = Signal(str)
+
+    def __init__(self, tasks: List[tuple], parent: QObject = None) -> None:
+        """
+        Initializes the group
+        :param tasks: list of tuples of a function and its positional arguments
+        :param parent: parent object
+        """
+        super().__init__(parent)
+        self.threads: List[LoaderThread] = []
+        for function_to_run, *args in tasks:
+            thread: LoaderThread = LoaderThread(function_to_run, *args)
+            thread.progress_update.connect(self._on_progress)
+            thread.task_string_signal.connect(self.task_string_signal)
+            thread.task_failed.connect(self.task_failed)
+            thread.task_completed.connect(self._on_completed)
+            self.threads.append(thread)
+        self._remaining: int = len(self.threads)
+        self._progress: int = 0
+
+    def start(self) -> None:
+        """
+        Starts every task
+        :return: None
+        """
+        if not self.threads:
+            self.task_completed.emit()
+        for thread in self.threads:
+            thread.start()
 
-    def _calculate_emulate_time_running(self) -> float:
+    def wait(self) -> None:
         """
-        Calculates the elapsed time of the function in seconds. Returns the elapsed time in seconds
-        :return: elapsed time in seconds in seconds
+        Waits for every task to finish
+        :return: None
         """
-        start_time = perf_counter()
-        self.task(*self.args, **self.kwargs)
-        end_time = perf_counter()
-        elapsed_time = end_time - start_time
-        return elapsed_time
+        for thread in self.threads:
+            thread.wait()
+
+    def _on_progress(self, _progress: int) -> None:
+        progress: int = sum(thread.progress for thread in self.threads) // len(self.threads)
+        if progress != self._progress:
+            self._progress = progress
+            self.progress_update.emit(progress)
+
+    def _on_completed(self) -> None:
+        self._remaining -= 1
+        if not self._remaining:
+            self.task_completed.emit()
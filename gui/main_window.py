@@ -16,6 +16,7 @@ from gui.widgets.customs.CustomPyConsole import CustomPyConsole
 from gui.widgets.customs.CustomTestWidget import CustomTestWidget
 from gui.widgets.customs.CustomTitleBar import CustomTitleBar
 from utils.s2f import check_main_dirs
+from utils.startup import python_installed
 
 
 class Ui_MainWindow(QtWidgets.QMainWindow):
@@ -267,10 +268,13 @@ class Ui_MainWindow(QtWidgets.QMainWindow):
         self.container.get_textboxes.connect(self.test_widget.updateIcons)
         self.container.show_tests.connect(self.test_widget.loadTests)
 
-        self.file_widget = CustomFileManager(kwargs.get('path'), _MainWindow)
+        self.file_widget = CustomFileManager(kwargs.get('path'), _MainWindow, self.container.export_queue)
 
         self.file_widget.file_selected.connect(self.container.update_content)
         self.file_widget.filepath_selected.connect(self.update_current_open_file)
+        self.file_widget.loading_started.connect(self.container.show_loading)
+        self.file_widget.loading_finished.connect(self.container.hide_loading)
+        self.file_widget.loading_failed.connect(self.container.on_loading_failed)
         self.change_directory_signal.connect(self.file_widget.change_directory)
         self.load_open_file_signal.connect(self.file_widget.load_file)
         self.container.need_to_reset.connect(lambda: self.file_widget.load_file(self.current_open_file))
@@ -353,13 +357,8 @@ class Ui_MainWindow(QtWidgets.QMainWindow):
         self.container.resend_data()
 
     def check_python_installed(self):
-        try:
-            subprocess.check_output(['python', '--version'])
-            return True
-        except subprocess.CalledProcessError:
-            return False
-        except FileNotFoundError:
-            return False
+        # the result is kept between runs, python is run again only when the interpreter has changed
+        return python_installed()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -409,6 +408,9 @@ class Ui_MainWindow(QtWidgets.QMainWindow):
 
     def closeEvent(self, event):
         self.save_file()
+        self.bash_console.shutdown()
+        if self.pyconsole:
+            self.pyconsole.shutdown()
         event.accept()
 
     def save_file(self):
@@ -422,9 +424,10 @@ class Ui_MainWindow(QtWidgets.QMainWindow):
                 with open(self.current_open_file, "r", encoding="utf-8") as f:
                     data_file = json.load(f)
 
-                for it, (data_idx, data_ptr) in enumerate(zip(data_file, self.container.all_textboxes)):
-                    if data_ptr.text().isdigit() or data_ptr.text() != '':
-                        data_idx['data'] = data_ptr.text()
+                answers = self.container.form_model.answers if self.container.form_model else []
+                for it, (data_idx, answer) in enumerate(zip(data_file, answers)):
+                    if answer.isdigit() or answer != '':
+                        data_idx['data'] = answer
 
                 with open(self.current_open_file, "w", encoding="utf-8") as f:
                     json.dump(data_file, f, ensure_ascii=False, indent=4)
@@ -563,6 +566,14 @@ class Ui_MainWindow(QtWidgets.QMainWindow):
 
             menu_button.setMenu(menu)
 
+        save_all_button = QPushButton(self.icons.get('menu_save_as', QtGui.QIcon()), "")
+        save_all_button.setObjectName('save_all')
+        save_all_button.setFixedSize(50, 40)
+        save_all_button.setSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        save_all_button.clicked.connect(self.container.save_all)
+        save_all_button.setToolTip('Сохранить во всех форматах')
+        self.right_toolbar_layout.addWidget(save_all_button)
+
     def new_file(self):
         options = QFileDialog.Options()
         file_path, _ = QFileDialog.getSaveFileName(self, "Create New File", "", "All Files (*.mdth)", options=options)
@@ -665,7 +676,7 @@ class Ui_MainWindow(QtWidgets.QMainWindow):
             self.title_bar.update_current_workspace(directory_path)
 
     def reset(self, path=None):
-        self.file_widget = CustomFileManager(path, self)
+        self.file_widget = CustomFileManager(path, self, self.container.export_queue)
         self.container.reset()
 
     def graph_double_click_event(self, event):
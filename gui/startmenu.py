@@ -2,13 +2,13 @@ import json
 import os
 
 from PySide6 import QtWidgets, QtCore, QtGui
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import QPoint
 from PySide6.QtWidgets import QMessageBox, QMainWindow, QWidget, QApplication, QLabel, QVBoxLayout, QHBoxLayout
 
-from gui.Threads.LoadThread import LoaderThread
-from gui.main_window import Ui_MainWindow
-from gui.widgets.customs.CustomLoadingWindow import LoadingWindow
+from config.cfg import EXE_DIR, HOUSEKEEPING_INTERVAL
+from gui.Threads.LoadThread import LoaderGroup
 from utils.s2f import check_main_dirs
+from utils.startup import probes, profile
 from utils.tools import check_configuration, remove_pycache_dirs
 
 
@@ -23,7 +23,9 @@ class Ui_StartMenu(QMainWindow):
         """
         super().__init__()
         # self.setWindowFlags(Qt.FramelessWindowHint)  # Remove the default title bar
-        self._run_setup()
+        self.loader_group = None
+        self._pycache_due = False
+        self._setup_failed = False
         self.title_bar = None
         self.setMaximumWidth(600)
         self.setMaximumHeight(800)
@@ -241,6 +243,9 @@ class Ui_StartMenu(QMainWindow):
         :param from_file: Whether the main window is from file or from main window.
         :return: None
         """
+        # the main window brings in the data and graph backends, the start menu is shown without them
+        from gui.main_window import Ui_MainWindow
+
         try:
             self.main_window = Ui_MainWindow(assets=self.assets.copy(), **{'path': project_path, 'ft': file_type})
             if from_file:
@@ -259,40 +264,35 @@ class Ui_StartMenu(QMainWindow):
             self.close()
             self.assets = None
 
-    def _run_setup(self) -> None:
-        self._thread_check_configuration()
-
-    def _thread_check_configuration(self) -> None:
+    def run_setup(self) -> None:
         """
-        Checks if the configuration file exists and creates it if it doesn't.
+        Runs the start-up housekeeping in the background: checks the configuration file and,
+        at most every HOUSEKEEPING_INTERVAL, removes the cache directories.
+        Started once the first window is painted, so it does not delay it.
         :return: None
         """
-        self.loader_window = LoadingWindow(self)  # Create instance of LoadingWindow
-        self.loader_window.setWindowModality(Qt.WindowModal)
-        self.loader_window.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
-        self.loader_window.show()
-        self.loader_thread = LoaderThread(check_configuration)
-        self.loader_thread.progress_update.connect(self.loader_window.update_progress)
-        self.loader_thread.task_completed.connect(self.on_check_configuration_completed)
-        self.loader_thread.start()
-
-    def _thread_remove_cache_dirs(self) -> None:
+        if self.loader_group is not None:
+            return
+
+        tasks = [(check_configuration,)]
+        self._pycache_due = probes.due('remove_pycache_dirs', HOUSEKEEPING_INTERVAL)
+        if self._pycache_due:
+            tasks.append((remove_pycache_dirs, EXE_DIR))
+        self.loader_group = LoaderGroup(tasks, self)
+        self.loader_group.task_failed.connect(self.on_setup_failed)
+        self.loader_group.task_completed.connect(self.on_setup_completed)
+        self.loader_group.start()
+
+    def on_setup_failed(self, error: str) -> None:
         """
-        Removes the cache directory from the main window.
+        Shows the error of a failed start-up task, the housekeeping is then retried on the next start
+        :param error: error message of the task
         :return: None
         """
-        self.loader_window = LoadingWindow(self)  # Create instance of LoadingWindow
-        self.loader_window.setWindowModality(Qt.WindowModal)
-        self.loader_window.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
-        self.loader_window.show()
-        self.loader_thread = LoaderThread(remove_pycache_dirs)
-        self.loader_thread.progress_update.connect(self.loader_window.update_progress)
-        self.loader_thread.task_completed.connect(self.on_remove_cache_dirs_completed)
-        self.loader_thread.start()
-
-    def on_remove_cache_dirs_completed(self):
-        self.loader_window.close()
-
-    def on_check_configuration_completed(self):
-        self.loader_window.close()
-        self._thread_remove_cache_dirs()
+        self._setup_failed = True
+        QMessageBox.warning(self, "Ошибка", f"Не удалось выполнить подготовку к запуску\n{error}")
+
+    def on_setup_completed(self):
+        if self._pycache_due and not self._setup_failed:
+            probes.done('remove_pycache_dirs')
+        profile.mark('housekeeping')
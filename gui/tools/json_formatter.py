@@ -5,7 +5,7 @@ from PySide6.QtWidgets import QTextEdit
 
 class JsonFormatter:
     @classmethod
-    def format_json(cls, text_edit: QTextEdit, text: str):
+    def format_json(cls, text_edit: QTextEdit, text: str) -> bool:
         try:
             if isinstance(text, bytes):
                 text = text.decode('utf-8')
@@ -14,6 +14,7 @@ class JsonFormatter:
 
             text_edit.clear()
             text_edit.append(formatted_json)
+            return True
 
-        except json.JSONDecodeError as e:
-            text_edit.append(f"Invalid JSON data: {e}")
+        except json.JSONDecodeError:
+            return False
@@ -7,15 +7,18 @@ from gui.tools.subtools.python_highlighter import PythonHighlighter
 class PythonFormatter:
     @classmethod
     def format_python(cls, text_edit: QTextEdit, text: str):
+        # CustomTextEdit wraps the editor which holds the document
+        editor = getattr(text_edit, 'text_edit', text_edit)
         try:
-            text_edit.clear()
+            editor.clear()
 
-            text_edit.setFont(QFont("Courier", 10))
+            editor.setFont(QFont("Courier", 10))
 
-            text_edit.setPlainText(text)
+            editor.setPlainText(text)
 
-            cls.highlighter = PythonHighlighter(text_edit.document())
+            # attached after the text is set, the highlighter starts from the first screen
+            cls.highlighter = PythonHighlighter(editor.document())
 
         except Exception as e:
-            text_edit.clear()
-            text_edit.append(f"Error processing Python code: {str(e)}")
+            editor.clear()
+            editor.setPlainText(f"Error processing Python code: {str(e)}")
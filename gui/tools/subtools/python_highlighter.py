@@ -1,9 +1,45 @@
-from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont
-from PySide6.QtCore import Qt, QRegularExpression
+from PySide6.QtCore import QRegularExpression, QTimer
+from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont, QTextDocument, QTextBlock
+
+KEYWORDS = [
+    'and', 'as', 'assert', 'break', 'class', 'continue', 'def', 'del', 'elif', 'else',
+    'except', 'False', 'finally', 'for', 'from', 'global', 'if', 'import', 'in', 'is',
+    'lambda', 'None', 'nonlocal', 'not', 'or', 'pass', 'raise', 'return', 'True', 'try',
+    'while', 'with', 'yield'
+]
+
+# one pass over a line: the leftmost token wins, so quotes in comments and hashes in strings are not mistaken
+TOKENS = QRegularExpression(
+    r'(?<keyword>\b(?:' + '|'.join(KEYWORDS) + r')\b)'
+    r'|(?<triple>"""|' + r"''')"
+    r'|(?<string>"[^"\\]*(?:\\.[^"\\]*)*"|' + r"'[^'\\]*(?:\\.[^'\\]*)*')"
+    r'|(?<comment>#.*)'
+    r'|(?<function>\b[A-Za-z_][A-Za-z0-9_]*(?=\())'
+)
+TRIPLE_END = {
+    1: QRegularExpression(r'(?<!\\)"""'),
+    2: QRegularExpression(r"(?<!\\)'''"),
+}
+
+# states of a block
+NORMAL = 0
+IN_DOUBLE_TRIPLE = 1
+IN_SINGLE_TRIPLE = 2
+PENDING = -2
+
+# number of blocks highlighted at a time after the first screen
+BLOCKS_PER_STEP = 500
 
 
 class PythonHighlighter(QSyntaxHighlighter):
-    def __init__(self, parent=None):
+    """
+    Python syntax highlighter.
+    Each line is scanned once with a precompiled pattern, triple-quoted strings are carried over lines
+    by the block state. Only the first blocks are highlighted when the document is attached, the rest
+    is highlighted in steps from the event loop so a large file is shown at once.
+    """
+
+    def __init__(self, parent=None, blocks_per_step: int = BLOCKS_PER_STEP):
         super(PythonHighlighter, self).__init__(parent)
 
         keyword_format = QTextCharFormat()
@@ -20,32 +56,102 @@ class PythonHighlighter(QSyntaxHighlighter):
         function_format = QTextCharFormat()
         function_format.setForeground(QColor("#A020F0"))
 
-        keywords = [
-            'and', 'as', 'assert', 'break', 'class', 'continue', 'def', 'del', 'elif', 'else',
-            'except', 'False', 'finally', 'for', 'from', 'global', 'if', 'import', 'in', 'is',
-            'lambda', 'None', 'nonlocal', 'not', 'or', 'pass', 'raise', 'return', 'True', 'try',
-            'while', 'with', 'yield'
-        ]
+        self.formats = {
+            'keyword': keyword_format,
+            'string': string_format,
+            'comment': comment_format,
+            'function': function_format,
+        }
+        self.string_format = string_format
 
-        self.rules = []
+        self.blocks_per_step = blocks_per_step
+        # blocks after this one are left pending until the timer reaches them
+        self.highlighted_until = blocks_per_step
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.highlight_step)
+        if self.document() is not None:
+            self.timer.start()
 
-        keyword_patterns = [QRegularExpression(r'\b' + keyword + r'\b') for keyword in keywords]
-        for pattern in keyword_patterns:
-            self.rules.append((pattern, keyword_format))
+    def setDocument(self, document: QTextDocument) -> None:
+        self.highlighted_until = self.blocks_per_step
+        super(PythonHighlighter, self).setDocument(document)
+        if document is not None:
+            self.timer.start()
 
-        self.rules.append((QRegularExpression(r'"[^"\\]*(\\.[^"\\]*)*"'), string_format))
-        self.rules.append((QRegularExpression(r"'[^'\\]*(\\.[^'\\]*)*'"), string_format))
+    def highlight_step(self) -> None:
+        """
+        Highlight the next pending blocks
+        :return: None
+        """
+        document = self.document()
+        if document is None or self.highlighted_until + 1 >= document.blockCount():
+            self.timer.stop()
+            return
 
-        self.rules.append((QRegularExpression(r'#[^\n]*'), comment_format))
+        first: QTextBlock = document.findBlockByNumber(self.highlighted_until + 1)
+        self.highlighted_until += self.blocks_per_step
+        # the following blocks are rehighlighted as long as their state changes, up to the new limit
+        self.rehighlightBlock(first)
 
-        self.rules.append((QRegularExpression(r'\b[A-Za-z_][A-Za-z0-9_]*(?=\()'), function_format))
+    def highlight_all(self) -> None:
+        """
+        Highlight the whole document now
+        :return: None
+        """
+        self.timer.stop()
+        self.highlighted_until = float('inf')
+        self.rehighlight()
 
     def highlightBlock(self, text):
-        for pattern, format in self.rules:
-            expression = QRegularExpression(pattern)
-            match_iterator = expression.globalMatch(text)
-            while match_iterator.hasNext():
-                match = match_iterator.next()
-                start = match.capturedStart()
-                length = match.capturedLength()
-                self.setFormat(start, length, format)
\ No newline at end of file
+        if self.currentBlock().blockNumber() > self.highlighted_until:
+            self.setCurrentBlockState(PENDING)
+            return
+
+        self.setCurrentBlockState(NORMAL)
+        position = 0
+        state = self.previousBlockState()
+        if state in TRIPLE_END:
+            position = self._close_triple(text, 0, state)
+            if position < 0:
+                return
+
+        length = len(text)
+        while position < length:
+            match = TOKENS.match(text, position)
+            if not match.hasMatch():
+                break
+
+            start = match.capturedStart()
+            if match.capturedStart('triple') >= 0:
+                state = IN_DOUBLE_TRIPLE if match.captured('triple') == '"""' else IN_SINGLE_TRIPLE
+                end = self._close_triple(text, match.capturedEnd(), state)
+                self.setFormat(start, (length if end < 0 else end) - start, self.string_format)
+                if end < 0:
+                    return
+                position = end
+                continue
+
+            for name, text_format in self.formats.items():
+                if match.capturedStart(name) >= 0:
+                    self.setFormat(start, match.capturedLength(), text_format)
+                    break
+            position = max(match.capturedEnd(), start + 1)
+
+    def _close_triple(self, text, start, state):
+        """
+        Find the end of a triple-quoted string and format it
+        :param text: text of the block
+        :param start: position where the string continues
+        :param state: IN_DOUBLE_TRIPLE or IN_SINGLE_TRIPLE
+        :return: position after the closing quotes or -1 if the string goes on in the next block
+        """
+        match = TRIPLE_END[state].match(text, start)
+        if not match.hasMatch():
+            self.setFormat(start, len(text) - start, self.string_format)
+            self.setCurrentBlockState(state)
+            return -1
+
+        end = match.capturedEnd()
+        self.setFormat(start, end - start, self.string_format)
+        return end
@@ -5,7 +5,7 @@ from xml.dom.minidom import parseString
 
 class XmlFormatter:
     @classmethod
-    def format_xml(cls, text_edit: QTextEdit, text: str):
+    def format_xml(cls, text_edit: QTextEdit, text: str) -> bool:
         try:
             tree = ET.ElementTree(ET.fromstring(text))
 
@@ -16,7 +16,7 @@ class XmlFormatter:
 
             text_edit.clear()
             text_edit.append(formatted_xml)
+            return True
 
-        except ET.ParseError as e:
-            text_edit.clear()
-            text_edit.append(f"Invalid XML: {str(e)}")
+        except ET.ParseError:
+            return False
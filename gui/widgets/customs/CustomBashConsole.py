@@ -4,10 +4,12 @@ import platform
 from PySide6.QtCore import Qt
 from PySide6.QtGui import (
     QTextCursor,
-    QKeyEvent
+    QKeyEvent,
+    QKeySequence
 )
 from PySide6.QtWidgets import QPlainTextEdit
 
+from config.cfg import BASH_MAX_LINES, BASH_KILL_SECONDS
 from gui.Threads.CommandThread import CommandThread
 
 
@@ -22,6 +24,8 @@ class CustomBashConsole(QPlainTextEdit):
         super().__init__(parent)
         self.setWindowTitle('Bash Console')
         self.setReadOnly(False)
+        # the oldest lines are dropped so a long output does not slow the console down
+        self.setMaximumBlockCount(BASH_MAX_LINES)
         self.cwd: str = path
         self.prompt: str = f'{path}$ '
         self.insertPlainText(self.prompt)
@@ -50,6 +54,13 @@ class CustomBashConsole(QPlainTextEdit):
         :param event: QKeyEvent
         :return: None
         """
+        if self.is_running():
+            if event.key() == Qt.Key.Key_C and event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+                self.kill_command()
+            elif event.matches(QKeySequence.StandardKey.Copy):
+                super().keyPressEvent(event)
+            return
+
         if event.key() in [Qt.Key.Key_Return, Qt.Key.Key_Enter]:
             cursor = self.textCursor()
             cursor.movePosition(QTextCursor.MoveOperation.End)
@@ -90,18 +101,46 @@ class CustomBashConsole(QPlainTextEdit):
             self.insertPlainText(f'\nError: {e}\n')
         self.insertPlainText(self.prompt)
 
+    def is_running(self) -> bool:
+        """
+        Check if a command is running.
+        :return: bool
+        """
+        return self.commandThread is not None and self.commandThread.isRunning()
+
+    def kill_command(self) -> None:
+        """
+        Kill the running command.
+        :return: None
+        """
+        if self.is_running():
+            self.commandThread.kill()
+
+    def shutdown(self) -> None:
+        """
+        Kill the running command and wait for its thread.
+        :return: None
+        """
+        if self.is_running():
+            self.commandThread.kill()
+            # the thread stops reading BASH_KILL_SECONDS after the kill at the latest
+            self.commandThread.wait(round((BASH_KILL_SECONDS + 1) * 1000))
+
     def append_output(self, text: str) -> None:
         """
-        Append text to the end of the output.
+        Append a batch of output to the end of the console.
         :param text: string text to be appended
         :return: None
         """
+        self.moveCursor(QTextCursor.MoveOperation.End)
         self.insertPlainText(text)
 
-    def command_finished(self) -> None:
+    def command_finished(self, exit_code: int = 0) -> None:
         """
-        Set the console to read only.
+        Show the prompt and make the console editable again.
+        :param exit_code: exit code of the command
         :return: None
         """
+        self.moveCursor(QTextCursor.MoveOperation.End)
         self.insertPlainText(self.prompt)
         self.setReadOnly(False)
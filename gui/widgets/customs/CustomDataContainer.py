@@ -1,19 +1,15 @@
-import json
-import re
+import os
 import threading
 from typing import List, Any
 
-from PySide6 import QtCore
-
 from PySide6.QtCore import (
     Qt,
-    QEvent,
-    Signal, Slot, QSize, QRect
+    Signal, Slot, QSize, QRect, QModelIndex
 )
 
 from PySide6.QtGui import (
     QPixmap,
-    QFont, QIntValidator, QIcon, QStandardItem, QStandardItemModel, QPainter
+    QFont, QIcon, QStandardItem, QStandardItemModel, QPainter
 )
 from PySide6.QtWidgets import (
     QWidget,
@@ -21,24 +17,33 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QLabel,
     QFrame,
-    QGridLayout,
-    QLineEdit,
     QTableWidget,
     QTableWidgetItem,
     QMessageBox,
     QHeaderView,
-    QPushButton, QHBoxLayout, QComboBox, QListView, QStyledItemDelegate
+    QPushButton, QHBoxLayout, QComboBox, QListView, QStyledItemDelegate, QTableView, QAbstractItemView, QScrollBar,
+    QProgressBar
 )
 
 from gui.Threads.CallbackThread import CallbackThread
+from gui.Threads.ExportQueue import ExportQueue
 from gui.Threads.LoadThread import LoaderThread
 from gui.tools.json_formatter import JsonFormatter
 from gui.tools.python_formatter import PythonFormatter
 from gui.tools.txt_formatter import TxtFormatter
 from gui.tools.xml_formatter import XmlFormatter
+from gui.widgets.customs.CustomLargeTextViewer import CustomLargeTextViewer
 from gui.widgets.customs.CustomLoadingWindow import LoadingWindow
+from gui.widgets.customs.CustomPdfViewer import CustomPdfViewer
+from gui.widgets.customs.CustomQuestionnaireModel import QuestionnaireModel, QuestionnaireDelegate
+from gui.widgets.customs.CustomTableModel import StreamingTableModel
 from gui.widgets.customs.CustomTextEdit import CustomTextEdit
+from gui.widgets.customs.CustomWordViewer import CustomWordViewer
 
+from utils import content_type
+from utils.formula import FormulaEngine
+from utils.snapshot import AnswerSnapshot
+from utils.table_reader import TableReader
 from utils.s2f import (
     save_to_word,
     save_to_excel,
@@ -47,8 +52,8 @@ from utils.s2f import (
     save_to_json,
     save_to_html,
     save_to_txt,
-    save_to_xml, append_to_excel, append_to_word, append_to_pdf, append_to_csv, append_to_json, append_to_html,
-    append_to_txt, append_to_xml, load_mdth_file
+    save_to_xml, append_to_excel, append_to_word, append_to_pdf, append_to_csv, append_to_html,
+    append_to_txt, append_to_xml, load_mdth_file, export_all, append_to_jsonl, compact_json_log
 )
 
 
@@ -79,7 +84,7 @@ class CustomDataContainer(QWidget):
     """
     Custom data container for custom data
     """
-    get_textboxes = Signal(list)  # list of textboxes
+    get_textboxes = Signal(list)  # list of question states
     show_tests = Signal(list)  # list of tests
     send_values = Signal(list)  # list of values
     need_to_reset = Signal()
@@ -117,14 +122,19 @@ class CustomDataContainer(QWidget):
         self.data = data if data else []
         self.result_data = []
         self.calculations = {}
-        self.textboxes = []
-        self.name_textboxes = []
-        self.all_textboxes = []
-        self.hidden_textboxes = []
+        self.form_model = None
+        self.form_view = None
+        self.formula_engine = None
+        self.live_mode = True
+        self.result_rows = {}
         self.save_callbacks = self._setup_save_callbacks()
         self.append_callbacks = self._setup_append_callbacks()
+        self.export_queue = ExportQueue(parent=self)
+        self.export_progress = None
+        self.cancel_export_button = None
+        self.loading_progress = None
         self.setupUi(file_type)
-        self.get_textboxes.emit(self.name_textboxes)
+        self.get_textboxes.emit(self.test_states())
 
     def setupUi(self, file_type: str = None) -> None:
         """
@@ -133,6 +143,13 @@ class CustomDataContainer(QWidget):
         """
         main_layout = QVBoxLayout()
 
+        self.loading_progress = QProgressBar()
+        self.loading_progress.setRange(0, 0)
+        self.loading_progress.setFixedHeight(6)
+        self.loading_progress.setTextVisible(False)
+        self.loading_progress.setVisible(False)
+        main_layout.addWidget(self.loading_progress)
+
         self.result_table = QTableWidget()
         self.scroll_area = QScrollArea()
         self.scroll_content = QWidget()
@@ -174,6 +191,15 @@ class CustomDataContainer(QWidget):
         self.combo_box.currentIndexChanged.connect(self.on_combobox_changed)
         self.result_container = self._initalize_result_block()
 
+        self.export_progress = QProgressBar()
+        self.export_progress.setRange(0, 100)
+        self.export_progress.setVisible(False)
+        self.cancel_export_button = self._create_button('Отменить экспорт', self.export_queue.cancel_all)
+        self.export_queue.job_started.connect(self.on_export_started)
+        self.export_queue.job_progress.connect(self.on_export_progress)
+        self.export_queue.job_failed.connect(self.on_export_failed)
+        self.export_queue.queue_empty.connect(self.on_export_queue_empty)
+
         widget = QFrame()
         layout = QVBoxLayout()
         sub_widget = QWidget()
@@ -182,6 +208,8 @@ class CustomDataContainer(QWidget):
         sub_layout.addWidget(self.reset_button)
         sub_layout.addWidget(self.continue_button)
         sub_layout.addWidget(self.combo_box)
+        sub_layout.addWidget(self.export_progress)
+        sub_layout.addWidget(self.cancel_export_button)
         widget.setLayout(layout)
         layout.addWidget(sub_widget)
         main_layout.addWidget(self.scroll_area)
@@ -201,8 +229,7 @@ class CustomDataContainer(QWidget):
         try:
             event: object = sender.objectName() if isinstance(sender, QPushButton) else sender.objectName
             if event in self.save_callbacks:
-                self.save_callbacks[event](path=self.current_workspace, data=self.data, textboxes=self.all_textboxes,
-                                           result_data=self.result_data)
+                self.export_queue.submit(event, self.save_callbacks[event], self.current_workspace, self.snapshot())
             else:
                 QMessageBox.critical(self, 'Ошибка', "ErrorKey")
         except Exception as e:
@@ -217,13 +244,88 @@ class CustomDataContainer(QWidget):
         try:
             event = self.combo_box.currentText()
             if event in self.append_callbacks:
-                self.append_callbacks[event](path=self.current_workspace, data=self.data, textboxes=self.all_textboxes,
-                                             result_data=self.result_data)
+                self.export_queue.submit(event, self.append_callbacks[event], self.current_workspace,
+                                         self.snapshot())
             else:
                 QMessageBox.critical(self, 'Ошибка', "ErrorKey")
         except Exception as e:
             QMessageBox.critical(self, 'Ошибка', str(e))
 
+    def save_all(self) -> None:
+        """
+        Save custom data container to every format at once
+        :return: None
+        """
+        self.check_main_dirs(self.current_workspace)
+        try:
+            self.export_queue.submit('save_all', export_all, self.current_workspace, self.snapshot())
+        except Exception as e:
+            QMessageBox.critical(self, 'Ошибка', str(e))
+
+    def show_loading(self, file_path: str) -> None:
+        """
+        Show that a file is being loaded, the current content stays until it is ready
+        :param file_path: str path of the file
+        :return: None
+        """
+        self.loading_progress.setToolTip(f'Загрузка: {os.path.basename(file_path)}')
+        self.loading_progress.setVisible(True)
+
+    def hide_loading(self) -> None:
+        """
+        Hide the loading indicator
+        :return: None
+        """
+        self.loading_progress.setVisible(False)
+
+    def on_loading_failed(self, file_path: str, error: str) -> None:
+        """
+        Report a file which could not be loaded
+        :param file_path: str path of the file
+        :param error: str error message
+        :return: None
+        """
+        self.hide_loading()
+        QMessageBox.critical(self, 'Ошибка', f'{os.path.basename(file_path)}: {error}')
+
+    def on_export_started(self, name: str) -> None:
+        """
+        Show the progress of an export job which has started
+        :param name: str name of the export callback
+        :return: None
+        """
+        self.export_progress.setFormat(f'{name}: %p%')
+        self.export_progress.setValue(0)
+        self.export_progress.setVisible(True)
+        self.cancel_export_button.setVisible(True)
+
+    def on_export_progress(self, name: str, percent: int) -> None:
+        """
+        Update the progress of an export job
+        :param name: str name of the export callback
+        :param percent: int progress of the job
+        :return: None
+        """
+        self.export_progress.setFormat(f'{name}: %p%')
+        self.export_progress.setValue(percent)
+
+    def on_export_failed(self, name: str, error: str) -> None:
+        """
+        Report an export job which has failed
+        :param name: str name of the export callback
+        :param error: str error message
+        :return: None
+        """
+        QMessageBox.critical(self, 'Ошибка', f'{name}: {error}')
+
+    def on_export_queue_empty(self) -> None:
+        """
+        Hide the export progress once every job has finished
+        :return: None
+        """
+        self.export_progress.setVisible(False)
+        self.cancel_export_button.setVisible(False)
+
     def reset(self) -> None:
         """
         Reset the custom data container
@@ -231,10 +333,8 @@ class CustomDataContainer(QWidget):
         """
         self.data: List = []
         self.result_data: List = []
-        self.textboxes: List = []
-        self.name_textboxes: List = []
-        self.all_textboxes: List = []
-        self.hidden_textboxes: List = []
+        self.formula_engine = None
+        self.result_rows: dict = {}
         self.is_show_block: bool = False
 
         self.result_table.setVisible(False)
@@ -246,7 +346,7 @@ class CustomDataContainer(QWidget):
         self.result_table.hide()
 
         self.update_ui(True)
-        self.scroll_area.verticalScrollBar().setValue(0)
+        self.content_scroll_bar().setValue(0)
 
     def continue_work(self) -> None:
         """
@@ -257,10 +357,8 @@ class CustomDataContainer(QWidget):
 
         self.data: List = []
         self.result_data: List = []
-        self.textboxes: List = []
-        self.name_textboxes: List = []
-        self.all_textboxes: List = []
-        self.hidden_textboxes: List = []
+        self.formula_engine = None
+        self.result_rows: dict = {}
         self.is_show_block: bool = False
 
         self.result_table.setVisible(False)
@@ -272,7 +370,7 @@ class CustomDataContainer(QWidget):
         self.result_table.hide()
 
         self.need_to_reset.emit()
-        self.scroll_area.verticalScrollBar().setValue(0)
+        self.content_scroll_bar().setValue(0)
 
     def check_scroll_position(self) -> None:
         """
@@ -280,7 +378,7 @@ class CustomDataContainer(QWidget):
         :return: None
         """
 
-        scroll_bar: QScrollArea.verticalScrollBar = self.scroll_area.verticalScrollBar()
+        scroll_bar: QScrollBar = self.content_scroll_bar()
         max_scroll: int = scroll_bar.maximum()
         current_scroll: int = scroll_bar.value()
         try:
@@ -299,6 +397,15 @@ class CustomDataContainer(QWidget):
         except Exception as e:
             print(e)
 
+    def content_scroll_bar(self) -> QScrollBar:
+        """
+        Get the scroll bar of the displayed content, the form view has its own one
+        :return: QScrollBar vertical scroll bar
+        """
+        if self.form_view is not None:
+            return self.form_view.verticalScrollBar()
+        return self.scroll_area.verticalScrollBar()
+
     def toggle_result_block(self) -> None:
         """
         Toggle the result block
@@ -322,12 +429,14 @@ class CustomDataContainer(QWidget):
         self.update_result_data()
 
         self._value = []
+        self.result_rows = {}
 
         self.result_table.setRowCount(len(self.result_data))
         self.result_table.setColumnCount(len(self.result_data[0]) if self.result_data else 0)
         for row, row_data in enumerate(self.result_data):
+            self.result_rows[row_data[0]] = row
             if len(row_data) >= 3:
-                self._value.append(row_data[2])
+                self._value.append(row_data[2] if row_data[2].isdigit() else "0")
             for column, value in enumerate(row_data):
                 item: QTableWidgetItem = QTableWidgetItem(str(value))
                 item.setFlags(Qt.ItemFlag.ItemIsEnabled)
@@ -335,6 +444,29 @@ class CustomDataContainer(QWidget):
         self.result_table.resizeColumnsToContents()
         self.send_values.emit(self._value)
 
+    def on_answer_changed(self, idx: str) -> None:
+        """
+        Live recalculation of the autosum cells depending on a changed answer.
+        Only the changed cells are pushed into the result table and the graph.
+        :param idx: str idx of the changed row
+        :return: None
+        """
+        if not self.live_mode or not self.formula_engine or not self.result_rows:
+            return
+
+        changed: dict = self.formula_engine.update(idx, self.get_input_value)
+        for cell, result in changed.items():
+            row: int | None = self.result_rows.get(cell)
+            if row is None:
+                continue
+            text: str = str(result) if result is not None else "Ошибка"
+            self.result_data[row][2] = text
+            self.result_table.item(row, 2).setText(text)
+            self._value[row] = text if text.isdigit() else "0"
+
+        if changed:
+            self.send_values.emit(self._value)
+
     def resend_data(self) -> None:
         if self._value:
             self.send_values.emit(self._value)
@@ -353,56 +485,14 @@ class CustomDataContainer(QWidget):
         """
         self.result_container.hide()
 
-    def evaluate_formula(self, components: str) -> int:
+    def get_input_value(self, idx: str) -> int:
         """
-        Evaluate a formula by replacing placeholders with actual values.
-        :param components: str formula components
-        :return: int result of formula evaluation
+        Get the int value of an input row by its idx.
+        :param idx: str idx of the row
+        :return: int value of the answer, 0 if empty or not a number
         """
-
-        def get_value_from_textbox(_component: str) -> int | None:
-            """
-            get the value from the textbox and return the value
-            :param _component: str component name or textbox name
-            :return: int value of the textbox
-            """
-            for textbox in reversed(self.textboxes):
-                if textbox.objectName() == _component:
-                    return int(textbox.text()) if textbox.text().isdigit() else 0
-            return None
-
-        def get_value_from_hidden_textbox(_component: str) -> int | None:
-            """
-            get the value from the hidden textbox and return the value
-            :param _component: str component name or textbox name
-            :return: int value of the textbox
-            """
-            for hidden_textbox in reversed(self.hidden_textboxes):
-                if hidden_textbox.objectName() == _component:
-                    if not hidden_textbox.text():
-                        formula = next(
-                            (calc["data"].split('=')[1] for row, calc in self.calculations.items() if
-                             calc["idx"] == component),
-                            None
-                        )
-                        if formula:
-                            hidden_textbox.setText(str(self.evaluate_formula(formula)))
-                    return int(hidden_textbox.text()) if hidden_textbox.text().isdigit() else 0
-            return None
-
-        result: int = 0
-        try:
-            for component in components.split('+'):
-                component: str = component.strip()
-                value: int = get_value_from_textbox(component)
-                if value is None:
-                    value: int = get_value_from_hidden_textbox(component)
-                if value is not None:
-                    result += value
-            return result
-        except Exception as e:
-            print(f"Error evaluating formula: {e}")
-            return 0
+        answer: str = self.form_model.answer(idx) if self.form_model else ""
+        return int(answer) if answer.isdigit() else 0
 
     def update_result_data(self) -> None:
         """
@@ -410,6 +500,7 @@ class CustomDataContainer(QWidget):
         :return: None
         """
         self.result_data: list = []
+        values: dict = self.formula_engine.evaluate(self.get_input_value) if self.formula_engine else {}
 
         for row, item in self.calculations.items():
             row_data: list = []
@@ -418,9 +509,8 @@ class CustomDataContainer(QWidget):
             row_data.append(number)
             row_data.append(indicator)
 
-            if item["data"].startswith("(Автосумма)\n"):
-                formula: str = item["data"].split('=')[1]
-                result: int = self.evaluate_formula(formula)
+            if FormulaEngine.is_autosum(item["data"]):
+                result: int | None = values.get(number)
                 row_data.append(str(result) if result is not None else "Ошибка")
 
             self.result_data.append(row_data)
@@ -431,7 +521,28 @@ class CustomDataContainer(QWidget):
         :return: None
         """
 
-        self.get_textboxes.emit(self.name_textboxes)
+        self.get_textboxes.emit(self.test_states())
+
+    def test_states(self) -> list:
+        """
+        Get the state of every question of the form for the test widget.
+        :return: list of [idx, row, done, in progress] for each input row
+        """
+        if not self.form_model:
+            return []
+
+        current_row: int = self.form_view.currentIndex().row() if self.form_view is not None else -1
+        return [[idx, row, self.form_model.answers[row] != '', row == current_row]
+                for idx, row in self.form_model.input_rows.items()]
+
+    def snapshot(self) -> AnswerSnapshot:
+        """
+        Take an immutable snapshot of the answers and results of the form for the exporters.
+        :return: AnswerSnapshot, empty if no form is loaded
+        """
+        if not self.form_model:
+            return AnswerSnapshot((), ())
+        return AnswerSnapshot.create(self.form_model.rows, self.form_model.answers, self.result_data)
 
     def load_default_content(self, layout: QVBoxLayout) -> None:
         """
@@ -447,108 +558,76 @@ class CustomDataContainer(QWidget):
         if not data_ptr:
             raise Exception("Не удалось получить данные")
 
-        grid_layout: QGridLayout = QGridLayout()
-        grid_layout.setColumnStretch(1, 1)
-
-        for row, item in enumerate(data_ptr):
-            number: str = item["idx"]
-            indicator: str = item["name"]
-
-            number_label: QLabel = QLabel(number)
-            indicator_label: QLabel = QLabel(indicator)
-            indicator_label.setWordWrap(True)
-            if self._is_valid_string(item["idx"]):
-                indicator_label.setAlignment(Qt.AlignRight)
-            else:
-                indicator_label.setAlignment(Qt.AlignLeft)
-
-            grid_layout.addWidget(number_label, row, 0)
-            grid_layout.addWidget(indicator_label, row, 1)
-            int_validator = QIntValidator(0, 1000)
-            answer_textbox: QLineEdit = QLineEdit()
-            self.all_textboxes.append(answer_textbox)
-            answer_textbox.setObjectName(f"{number}")
-
-            if item["data"].startswith("(Автосумма)\n"):
-                answer_textbox.setDisabled(True)
-                self.calculations[f"{number}"] = item
-                self.hidden_textboxes.append(answer_textbox)
-                continue
-
-            if item["data"] != " ":
-                if item["data"] == "(Ввод числа)" or item["data"] == "(Ввод текста)":
-                    answer_textbox.setPlaceholderText(item["data"])
-                else:
-                    answer_textbox.setText(item["data"])
-
-                if item["data"] == "(Ввод числа)":
-                    answer_textbox.setValidator(int_validator)
-
-                answer_textbox.installEventFilter(self)
-                answer_textbox.textChanged.connect(self.on_text_changed)
-                self.name_textboxes.append([number_label, answer_textbox])
-                self.textboxes.append(answer_textbox)
-
-                grid_layout.addWidget(answer_textbox, row, 2)
-
-        self.show_tests.emit(self.name_textboxes)
-        layout.addLayout(grid_layout)
-
-    def _is_valid_string(self, s):
-        pattern = r'^[\-\!\\"№;%\[\]/=_\.,\+]*$'
-        return bool(re.match(pattern, s))
-
-    def set_scrollbar_value(self, obj: object) -> None:
-        """
-        Set the scrollbar value on object
-        :param obj: object to set the scrollbar value
+        self.formula_engine = FormulaEngine(data_ptr)
+        if self.formula_engine.errors:
+            QMessageBox.warning(self, 'Ошибка в формулах',
+                                "\n".join(str(error) for error in self.formula_engine.errors))
+
+        for item in data_ptr:
+            if FormulaEngine.is_autosum(item["data"]):
+                self.calculations[f"{item['idx']}"] = item
+
+        self.form_model = QuestionnaireModel(data_ptr, self)
+        self.form_model.answer_changed.connect(self.on_text_changed)
+        self.form_model.answer_changed.connect(lambda _row, _idx: self.on_answer_changed(_idx))
+
+        delegate: QuestionnaireDelegate = QuestionnaireDelegate(self)
+        delegate.navigate.connect(self.move_to_next_input)
+
+        self.form_view = QTableView()
+        self.form_view.setModel(self.form_model)
+        self.form_view.setItemDelegateForColumn(QuestionnaireModel.COLUMN_ANSWER, delegate)
+        self.form_view.setEditTriggers(QAbstractItemView.EditTrigger.CurrentChanged |
+                                       QAbstractItemView.EditTrigger.DoubleClicked |
+                                       QAbstractItemView.EditTrigger.AnyKeyPressed)
+        self.form_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.form_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.form_view.setWordWrap(True)
+        self.form_view.verticalHeader().setVisible(False)
+        self.form_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.form_view.verticalHeader().setDefaultSectionSize(40)
+        self.form_view.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+        self.form_view.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.form_view.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
+        self.form_view.setColumnWidth(0, 80)
+        self.form_view.setColumnWidth(2, 200)
+        self.form_view.selectionModel().currentRowChanged.connect(self.on_text_changed)
+        self.form_view.verticalScrollBar().valueChanged.connect(self.check_scroll_position)
+
+        self.show_tests.emit([[idx, row] for idx, row in self.form_model.input_rows.items()])
+        layout.addWidget(self.form_view)
+
+    def move_to_next_input(self, direction: int) -> None:
+        """
+        Move the current cell to the next editable answer, wrapping around the form.
+        :param direction: int 1 to move down, -1 to move up
         :return: None
         """
-        self.scroll_area.ensureWidgetVisible(obj)
+        if self.form_view is None or not self.form_model.input_rows:
+            return
 
-    def eventFilter(self, source: QWidget, event: QEvent) -> bool | int:
+        row_count: int = self.form_model.rowCount()
+        start_row: int = self.form_view.currentIndex().row()
+        row: int = start_row
+        for _ in range(row_count):
+            row = (row + direction) % row_count
+            if self.form_model.is_input(row):
+                self.set_scrollbar_value(row)
+                return
+
+    def set_scrollbar_value(self, row: int) -> None:
         """
-        Event filter for textboxes.
-        :param source: QWidget source
-        :param event: QEvent event
-        :return: bool
+        Scroll to an answer of the form and start editing it
+        :param row: int row of the form to show
+        :return: None
         """
-        if not isinstance(event, QEvent):
-            return False
-
-        if event.type() == QtCore.QEvent.Type.FocusIn:
-            self.get_textboxes.emit(self.name_textboxes)
-
-        if event.type() == QEvent.Type.KeyPress and isinstance(source, QLineEdit):
-            current_index: int = self.textboxes.index(source)
-
-            def find_next_enabled_index(start_index: int, direction: int) -> int:
-                """
-                find next enabled textbox index.
-                """
-                index: int = start_index
-                while True:
-                    index = (index + direction) % len(self.textboxes)
-                    if self.textboxes[index].isEnabled():
-                        return index
-                    if index == start_index:
-                        return -1  # No enabled textbox found
-
-            if event.key() in {Qt.Key.Key_Return, Qt.Key.Key_Enter, Qt.Key.Key_Down}:
-                next_index: int = find_next_enabled_index(current_index, 1)
-                if next_index != -1:
-                    self.textboxes[next_index].setFocus()
-                    self.scroll_area.ensureWidgetVisible(self.textboxes[next_index])
-                return True
-
-            elif event.key() == Qt.Key.Key_Up:
-                previous_index: int = find_next_enabled_index(current_index, -1)
-                if previous_index != -1:
-                    self.textboxes[previous_index].setFocus()
-                    self.scroll_area.ensureWidgetVisible(self.textboxes[previous_index])
-                return True
+        if self.form_view is None:
+            return
 
-        return super().eventFilter(source, event)
+        index: QModelIndex = self.form_model.index(row, QuestionnaireModel.COLUMN_ANSWER)
+        self.form_view.scrollTo(index)
+        self.form_view.setFocus()
+        self.form_view.setCurrentIndex(index)
 
     def update_content(self, data: list) -> None:
         """
@@ -599,128 +678,107 @@ class CustomDataContainer(QWidget):
                 elif first_key == 'mdth':
                     self.load_default_content(self.scroll_layout)
                 elif first_key == 'pdf':
-                    self.load_text_content(self.scroll_layout, 'pdf')
+                    self.load_pdf_content(self.scroll_layout)
+                elif first_key == 'text':
+                    self.load_text_content(self.scroll_layout)
+                elif first_key == 'large_text':
+                    self.load_large_text_content(self.scroll_layout)
                 else:
                     self.load_table_content(self.scroll_layout, self.data)
             else:
                 self.load_text_content(self.scroll_layout)
 
-    def load_text_content(self, layout: QVBoxLayout, key: str = None) -> None:
+    def load_text_content(self, layout: QVBoxLayout) -> None:
         """
         Load text content from a list of dictionaries.
         :param layout: QVBoxLayout layout to add widgets
-        :param key: key of text to load from
         :return: None
         """
 
-        def format_and_add_content(_text_edit: CustomTextEdit, _content) -> None:
+        def format_and_add_content(_text_edit: CustomTextEdit, _content, _content_type: str = None) -> None:
             """
-            Format text content and add it to layout. If key is None, add all content.
+            Format text content and add it to layout. The content is parsed only by the chosen formatter.
             :param _text_edit: Text edit widget
             :param _content: Text content
+            :param _content_type: (Optional) content type detected when the file was loaded
             :return: None
             """
-            if self._is_json(_content):
-                self._format_json(_text_edit, _content)
-            elif self._is_xml(_content):
-                self._format_xml(_text_edit, _content)
-            elif self._is_python(_content):
+            _content_type = _content_type or content_type.detect(_content)
+            if _content_type == content_type.JSON and self._format_json(_text_edit, _content):
+                return
+            if _content_type == content_type.XML and self._format_xml(_text_edit, _content):
+                return
+            if _content_type == content_type.PYTHON:
                 self._format_python(_text_edit, _content)
-            else:
-                self._format_txt(_text_edit, _content)
+                return
+            self._format_txt(_text_edit, _content)
 
         text_edit: CustomTextEdit = CustomTextEdit()
 
-        if key == 'pdf':
-            for item in self.data[0].get('pdf'):
-                TxtFormatter.format_pdf(text_edit, item)
-        else:
-            for item in self.data:
-                if isinstance(item, list):
-                    for subitem in item:
-                        format_and_add_content(text_edit, subitem)
-                else:
-                    format_and_add_content(text_edit, item)
+        for item in self.data:
+            if isinstance(item, dict):
+                format_and_add_content(text_edit, item.get('text', ''), item.get('content_type'))
+            elif isinstance(item, list):
+                for subitem in item:
+                    format_and_add_content(text_edit, subitem)
+            else:
+                format_and_add_content(text_edit, item)
 
         text_edit.set_cursor_position(0)
         text_edit.text_edit.verticalScrollBar().setValue(0)
         layout.addWidget(text_edit)
 
-    def _clear_content_block(self) -> None:
+    def load_pdf_content(self, layout: QVBoxLayout) -> None:
         """
-        Clear content block.
+        Load a pdf document into a paginated viewer.
+        :param layout: QVBoxLayout layout to add widgets
         :return: None
         """
-        for i in reversed(range(self.scroll_layout.count())):
-            if isinstance(self.scroll_layout.itemAt(i), QGridLayout):
-                for item in reversed(range(self.scroll_layout.itemAt(i).count())):
-                    widget = self.scroll_layout.itemAt(i).itemAt(item).widget()
-                    if widget:
-                        widget.setParent(None)
-            else:
-                widget = self.scroll_layout.itemAt(i).widget()
-                if widget:
-                    widget.setParent(None)
+        layout.addWidget(CustomPdfViewer(self.data[0].get('pdf')))
 
-    @staticmethod
-    def _is_json(text: str) -> bool:
+    def load_large_text_content(self, layout: QVBoxLayout) -> None:
         """
-        Check if the given text is a valid JSON.
-        :param text: str text to be checked
-        :return: bool True if the text is a valid JSON, False otherwise
+        Load a large text file into a read-only viewer showing only the visible lines.
+        :param layout: QVBoxLayout layout to add widgets
+        :return: None
         """
-        try:
-            json.loads(text)
-            return True
-        except ValueError:
-            return False
+        layout.addWidget(CustomLargeTextViewer(self.data[0].get('large_text')))
 
-    @staticmethod
-    def _is_xml(text: str) -> bool:
-        """
-        Check if the given text is a valid XML.
-        :param text: str text to be checked
-        :return: bool True if the text is a valid XML, False otherwise
-        """
-        import xml.etree.ElementTree as ElementTree
-        try:
-            ElementTree.fromstring(text)
-            return True
-        except ElementTree.ParseError:
-            return False
-
-    @staticmethod
-    def _is_python(text: str) -> bool:
+    def _clear_content_block(self) -> None:
         """
-        Check if the given text is a valid Python code.
-        :param text: str text to be checked
-        :return: bool True if the text is a valid Python code, False otherwise
+        Clear content block.
+        :return: None
         """
-        try:
-            compile(text, '<string>', 'exec')
-            return True
-        except SyntaxError:
-            return False
+        self.form_view = None
+        self.form_model = None
+        for i in reversed(range(self.scroll_layout.count())):
+            widget = self.scroll_layout.itemAt(i).widget()
+            if isinstance(widget, (CustomPdfViewer, CustomLargeTextViewer)):
+                widget.close_document()
+            elif isinstance(widget, QTableView) and isinstance(widget.model(), StreamingTableModel):
+                widget.model().close()
+            if widget:
+                widget.setParent(None)
 
     @staticmethod
-    def _format_json(text_edit: CustomTextEdit, text: str) -> None:
+    def _format_json(text_edit: CustomTextEdit, text: str) -> bool:
         """
         Formated and append text to container data block
         :param text_edit: CustomTextEdit text edit to format text
         :text: str text to be formatted to formatted text
-        :return: None
+        :return: bool False if the text could not be parsed
         """
-        JsonFormatter.format_json(text_edit, text)
+        return JsonFormatter.format_json(text_edit, text)
 
     @staticmethod
-    def _format_xml(text_edit: CustomTextEdit, text: str) -> None:
+    def _format_xml(text_edit: CustomTextEdit, text: str) -> bool:
         """
         Formated and append text to container data block
         :param text_edit: CustomTextEdit text edit to format text
         :text: str text to be formatted to formatted text
-        :return: None
+        :return: bool False if the text could not be parsed
         """
-        XmlFormatter.format_xml(text_edit, text)
+        return XmlFormatter.format_xml(text_edit, text)
 
     @staticmethod
     def _format_python(text_edit: CustomTextEdit, text: str) -> None:
@@ -763,88 +821,41 @@ class CustomDataContainer(QWidget):
         :param data: list or dict data to display in table layout
         :return: None
         """
-        if data and data[0].get('dataword', None):
-            layout.addWidget(self._display_word_content(data))
-        elif data:
-            layout.addWidget(self._display_excel_data(data))
-
-    @staticmethod
-    def _display_word_content(data: list | dict) -> QTableWidget:
-        """
-        Display data in Word format
-        :param data: list or dict data
-        :return: QTableWidget: QTableWidget with data in Word format
-        """
-        table_widget: QTableWidget = QTableWidget()
-        if not data:
-            return table_widget
-
-        for table_data in data[0].get('dataword', None):
-            headers = table_data[1]
-            table_widget.setColumnCount(len(headers))
-            table_widget.setHorizontalHeaderLabels(headers)
-            table_widget.setRowCount(len(table_data) - 1)  # Number of data rows excluding header
-            table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-            table_widget.setFont(QFont("Arial", 10))
-            table_widget.setStyleSheet(
-                "QTableWidget { background-color: #f4f4f4; color: black; border: none; } "
-                "QHeaderView::section { background-color: #d4d4d4; color: black; padding: 5px; border: none; } "
-                "QTableWidget::item { padding: 5px; color: black;}"
-            )
-
-            for row_idx, row_data in enumerate(table_data[2:], 1):  # Start from index 1 to skip header
-                for col_idx, col_value in enumerate(row_data):
-                    item = QTableWidgetItem(str(col_value))
-                    item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                    table_widget.setItem(row_idx - 1, col_idx, item)  # row_idx - 1 because of skipping header
-
-        return table_widget
+        if data and data[0].get('dataword', None) is not None:
+            layout.addWidget(CustomWordViewer(data[0]['dataword']))
+        elif data and data[0].get('table', None):
+            layout.addWidget(self._display_table(data[0]['table']))
 
     @staticmethod
-    def _display_excel_data(data: list | dict) -> QTableWidget:
-        """
-        Display data in Excel format
-        :param data: list or dict data
-        :return: QTableWidget: QTableWidget with data in Excel format
-        """
-        table_widget: QTableWidget = QTableWidget()
-        if not data:
-            return table_widget
-
-        for row_idx, row_data in enumerate(data):
-            headers: list = row_data.keys()
-            table_widget.setColumnCount(len(headers))
-            table_widget.setHorizontalHeaderLabels(headers)
-            table_widget.setRowCount(len(data))
-
-            table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-            table_widget.setFont(QFont("Arial", 10))
-            table_widget.setStyleSheet(
-                """
-                QTableWidget {
-                    background-color: #f4f4f4;
-                    color: black;
-                    border: none;
-                }
-                QHeaderView::section {
-                    background-color: #d4d4d4;
-                    padding: 5px;
-                    border: none;
-                }
-                QTableWidget::item {
-                    padding: 5px;
-                }
-                """
-            )
-
-            for col_idx, (col_name, col_value) in enumerate(row_data.items()):
-                if str(col_value) == 'nan':
-                    col_value = ''
-                item: QTableWidgetItem = QTableWidgetItem(str(col_value))
-                item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                table_widget.setItem(row_idx, col_idx, item)
-
-        return table_widget
+    def _display_table(reader: TableReader) -> QTableView:
+        """
+        Display a csv or excel file, its rows are read while the table is scrolled
+        :param reader: opened reader of the file
+        :return: QTableView: QTableView with the rows of the file
+        """
+        table_view: QTableView = QTableView()
+        table_view.setModel(StreamingTableModel(reader, table_view))
+        table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table_view.setFont(QFont("Arial", 10))
+        table_view.setStyleSheet(
+            """
+            QTableView {
+                background-color: #f4f4f4;
+                color: black;
+                border: none;
+            }
+            QHeaderView::section {
+                background-color: #d4d4d4;
+                padding: 5px;
+                border: none;
+            }
+            QTableView::item {
+                padding: 5px;
+            }
+            """
+        )
+        return table_view
 
     @staticmethod
     def _create_button(name: str, callback: callable = None, set_visible: bool = False,
@@ -907,6 +918,7 @@ class CustomDataContainer(QWidget):
             'save_pdf': save_to_pdf,
             'save_csv': save_to_csv,
             'save_json': save_to_json,
+            'compact_json': compact_json_log,
             'save_html': save_to_html,
             'save_txt': save_to_txt,
             'save_xml': save_to_xml,
@@ -923,7 +935,7 @@ class CustomDataContainer(QWidget):
             'append_excel': append_to_excel,
             'append_pdf': append_to_pdf,
             'append_csv': append_to_csv,
-            'append_json': append_to_json,
+            'append_json': append_to_jsonl,
             'append_html': append_to_html,
             'append_txt': append_to_txt,
             'append_xml': append_to_xml,
@@ -1,21 +1,35 @@
 import os
 import shutil
+from functools import partial
+from typing import Any, Callable
 
-import pandas as pd
-import pdfplumber
 from PySide6 import (
     QtWidgets,
     QtCore,
 )
 from PySide6.QtCore import (
     Signal,
-    QModelIndex, Slot
+    QModelIndex, Slot, QThreadPool
 )
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QMessageBox
-from docx import Document
 
-from utils.s2f import load_mdth_file
+from config.cfg import LARGE_TEXT_BYTES
+from gui.Threads.ExportQueue import ExportJob, ExportQueue
+from gui.Threads.FileLoader import FileLoadJob
+from utils import content_type
+from utils.docx_tables import read_tables, restore_tables
+from utils.parse_cache import ParseCache
+from utils.pdf_document import LazyPdfDocument
+from utils.s2f import load_mdth_file, merge_pdf_sessions, merge_excel_parts
+from utils.table_reader import TableReader
+from utils.text_index import MappedTextFile
+
+# exports into which the appended sessions are merged when they are opened: file name -> (job name, merge function)
+MERGED_EXPORTS: dict = {
+    'Untitled.pdf': ('merge_pdf', merge_pdf_sessions),
+    'Untitled.xlsx': ('merge_excel', merge_excel_parts),
+}
 
 
 class CustomFileManager(QtWidgets.QWidget):
@@ -24,13 +38,31 @@ class CustomFileManager(QtWidgets.QWidget):
     """
     file_selected = Signal(list)  # Сигнал для выбора файла
     filepath_selected = Signal(str)  # Сигнал для выбора пути файла
+    loading_started = Signal(str)  # path of the file being loaded
+    loading_finished = Signal()
+    loading_failed = Signal(str, str)  # path of the file, error message
 
-    def __init__(self, path: str = None, parent=None) -> None:
+    def __init__(self, path: str = None, parent=None, export_queue: ExportQueue = None) -> None:
         """
         Initialize the CustomFileManager widget.
+        :param path: (Optional) path of the project
+        :param parent: (Optional) parent widget
+        :param export_queue: (Optional) queue of the export jobs of the project, the appended sessions
+            are merged on it so no append writes them at the same time
         """
         super().__init__(parent)
         self.setWindowTitle('File Manager')
+        self.load_pool: QThreadPool = QThreadPool(self)
+        self.load_pool.setMaxThreadCount(1)
+        self._load_generation: int = 0
+        self.parse_cache: ParseCache | None = ParseCache() if path else None
+        self.export_queue: ExportQueue = export_queue
+        if export_queue is None:
+            # the failed merges of a shared queue are reported by its owner, the ones of an own queue here
+            self.export_queue = ExportQueue(parent=self)
+            self.export_queue.job_failed.connect(
+                lambda name, error: QMessageBox.warning(self, "Warning", f"{name}: {error}"))
+        self._merges: dict = {}  # merge job -> (generation, path of the file)
 
         layout: QtWidgets.QVBoxLayout = QtWidgets.QVBoxLayout(self)
 
@@ -73,8 +105,7 @@ class CustomFileManager(QtWidgets.QWidget):
         :return: None
         """
         if file_path:
-            self.filepath_selected.emit(file_path)
-            self.file_selected.emit(self._load_data(file_path))
+            self.start_loading(file_path)
 
     def select_file(self, index: QModelIndex) -> None:
         """
@@ -89,8 +120,99 @@ class CustomFileManager(QtWidgets.QWidget):
             return
 
         if file_path:
-            self.filepath_selected.emit(file_path)
-            self.file_selected.emit(self._load_data(file_path))
+            self.start_loading(file_path)
+
+    def start_loading(self, file_path: str) -> None:
+        """
+        Load the file on the worker pool, the result of a previous load still running is dropped.
+        The appended sessions of an export are merged into it on the export queue first.
+        :param file_path: path of the file to be loaded
+        :return: None
+        """
+        self._load_generation += 1
+        # loads which have not started yet are superseded by this one
+        self.load_pool.clear()
+        self.loading_started.emit(file_path)
+
+        merge = MERGED_EXPORTS.get(os.path.basename(file_path))
+        if merge is None:
+            self._start_load_job(self._load_generation, file_path)
+            return
+
+        name, callback = merge
+        job: ExportJob = ExportJob(name, callback, os.path.dirname(os.path.dirname(file_path)), None)
+        # connected before the job is queued, a merge with nothing to merge finishes at once
+        job.signals.done.connect(self._on_merge_done)
+        job.signals.dropped.connect(self._on_merge_dropped)
+        self._merges[job] = (self._load_generation, file_path)
+        self.export_queue.enqueue(job)
+
+    def _start_load_job(self, generation: int, file_path: str) -> None:
+        """
+        Parse the file on the worker pool
+        :param generation: number of the load request
+        :param file_path: path of the file to be loaded
+        :return: None
+        """
+        if generation != self._load_generation:
+            return
+
+        job: FileLoadJob = FileLoadJob(generation, file_path, partial(self._load_data, cache=self.parse_cache))
+        job.signals.loaded.connect(self._on_file_loaded)
+        job.signals.failed.connect(self._on_file_failed)
+        self.load_pool.start(job)
+
+    @Slot(object, bool, object)
+    def _on_merge_done(self, job: ExportJob, success: bool, error: Exception | None) -> None:
+        """
+        Load the export once the appended sessions are merged into it.
+        A failed merge is reported through job_failed of the export queue and the export is shown as it is.
+        :param job: merge job
+        :param success: True if the sessions have been merged
+        :param error: error of a failed merge
+        :return: None
+        """
+        generation, file_path = self._merges.pop(job, (None, None))
+        if file_path is not None:
+            self._start_load_job(generation, file_path)
+
+    @Slot(object)
+    def _on_merge_dropped(self, job: ExportJob) -> None:
+        # superseded by a save of the same export, which rewrites it without the sessions
+        generation, file_path = self._merges.pop(job, (None, None))
+        if file_path is not None:
+            self._start_load_job(generation, file_path)
+
+    @Slot(int, str, object)
+    def _on_file_loaded(self, generation: int, file_path: str, data: list) -> None:
+        """
+        Show the loaded file unless another file has been selected in the meantime.
+        :param generation: number of the load request
+        :param file_path: path of the loaded file
+        :param data: parsed data of the file
+        :return: None
+        """
+        if generation != self._load_generation:
+            self._close_data(data)
+            return
+
+        self.loading_finished.emit()
+        self.filepath_selected.emit(file_path)
+        self.file_selected.emit(data)
+
+    @Slot(int, str, str)
+    def _on_file_failed(self, generation: int, file_path: str, error: str) -> None:
+        """
+        Report a file which could not be loaded unless another file has been selected in the meantime.
+        :param generation: number of the load request
+        :param file_path: path of the file
+        :param error: error message
+        :return: None
+        """
+        if generation != self._load_generation:
+            return
+
+        self.loading_failed.emit(file_path, error)
 
     def open_menu(self, position: QtCore.QPoint) -> None:
         """
@@ -173,6 +295,7 @@ class CustomFileManager(QtWidgets.QWidget):
         :return: None
         """
         self.tree.setRootIndex(self.model.index(path))
+        self.parse_cache = ParseCache() if path else None
 
     def copy_item(self) -> None:
         """
@@ -191,10 +314,52 @@ class CustomFileManager(QtWidgets.QWidget):
             return
 
     @staticmethod
-    def _load_data(file_path: str) -> list:
+    def _close_data(data: list) -> None:
+        """
+        Close the documents opened for data which will not be shown.
+        :param data: parsed data of a file
+        :return: None
+        """
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            if isinstance(item.get('pdf'), LazyPdfDocument):
+                item['pdf'].close()
+            elif isinstance(item.get('table'), TableReader):
+                item['table'].close()
+            elif isinstance(item.get('large_text'), MappedTextFile):
+                item['large_text'].close()
+
+    @staticmethod
+    def _cached(cache: ParseCache | None, file_path: str, parse: Callable[[str], list], part: str = '',
+                restore: Callable[[Any], list] = None) -> list:
+        """
+        Parse the file unless its parsed data is in the cache.
+        :param cache: on-disk cache of the parsed files or None
+        :param file_path: path of the file to be parsed
+        :param parse: function parsing the file
+        :param part: (Optional) name of the parsed representation in the cache
+        :param restore: (Optional) function rebuilding the parsed data from its json form in the cache
+        :return: parsed data of the file
+        """
+        data = cache.get(file_path, part) if cache else None
+        if data is not None and restore is not None:
+            try:
+                data = restore(data)
+            except (TypeError, ValueError):
+                data = None
+        if data is None:
+            data = parse(file_path)
+            if cache:
+                cache.put(file_path, data, part)
+        return data
+
+    @staticmethod
+    def _load_data(file_path: str, cache: ParseCache = None) -> list:
         """
         Load the file to the widget.
         :param file_path: path of the file to be loaded
+        :param cache: (Optional) on-disk cache of the parsed files
         :return: None
         """
         data = []
@@ -204,32 +369,21 @@ class CustomFileManager(QtWidgets.QWidget):
             data = [{"mdth": load_mdth_file(file_path)}]
         elif file_ext.endswith(('.png', '.jpg', '.bmp')):
             data = [{'image_path': file_path}]
-        elif file_ext.endswith('.csv'):
-            data = pd.read_csv(file_path).to_dict(orient='records')
-        elif file_ext.endswith('.xlsx') or file_ext.endswith('.xls'):
-            data = pd.read_excel(file_path).to_dict(orient='records')
+        elif file_ext.endswith(('.csv', '.xlsx', '.xls')):
+            # the rows are read by the table model while the table is scrolled
+            data = [{"table": TableReader(file_path)}]
         elif file_ext.endswith('.docx'):
-            doc: Document = Document(file_path)
-            data_temp: list = []
-            for table in doc.tables:
-                table_data: list = []
-                for row in table.rows:
-                    row_data: list = []
-                    for cell in row.cells:
-                        row_data.append(cell.text)
-                    table_data.append(row_data)
-                data_temp.append(table_data)
-            data = [{"dataword": data_temp}]
+            data = [{"dataword": CustomFileManager._cached(cache, file_path, read_tables, 'tables', restore_tables)}]
 
         elif file_ext.endswith('.pdf'):
-            with pdfplumber.open(file_path) as pdf:
-                tmp: list = []
-                for page in pdf.pages:
-                    tmp.append(page.extract_text())
-
-                data = [{"pdf": tmp}]
+            # the pages are extracted by the viewer when they are shown
+            data = [{"pdf": LazyPdfDocument(file_path, parse_cache=cache)}]
+        elif os.path.getsize(file_path) > LARGE_TEXT_BYTES:
+            # the lines are indexed and read by the viewer
+            data = [{"large_text": MappedTextFile(file_path)}]
         else:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data.append(f.read())
+                text: str = f.read()
+            data = [{"text": text, "content_type": content_type.detect(text, file_path)}]
 
         return data
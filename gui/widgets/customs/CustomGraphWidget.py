@@ -1,6 +1,9 @@
-import pyqtgraph as pg
 from PySide6.QtWidgets import QVBoxLayout, QWidget
 
+from utils.lazy_import import lazy_import
+
+pg = lazy_import('pyqtgraph')
+
 
 class CustomGraphWidget(QWidget):
     """
@@ -0,0 +1,209 @@
+from typing import Any
+
+from PySide6.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Signal,
+    Slot
+)
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QTableView,
+    QHeaderView,
+    QAbstractItemView,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QSpinBox
+)
+
+from utils.text_index import MappedTextFile
+
+
+class IndexSignals(QObject):
+    """
+    Signals of the line index job
+    """
+    progress = Signal(int)  # number of indexed lines
+    finished = Signal(int)  # number of lines
+    failed = Signal(str)  # error message
+
+
+class IndexJob(QRunnable):
+    """
+    Index the lines of a file on a worker thread
+    """
+
+    def __init__(self, text_file: MappedTextFile, signals: IndexSignals) -> None:
+        super().__init__()
+        self.text_file: MappedTextFile = text_file
+        self.signals: IndexSignals = signals
+
+    def run(self) -> None:
+        try:
+            count: int = self.text_file.build_index(self.signals.progress.emit)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(count)
+
+
+class LargeTextModel(QAbstractTableModel):
+    """
+    Table model of the indexed lines of a mapped file, a line is decoded only when it is shown
+    """
+
+    def __init__(self, text_file: MappedTextFile, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self.text_file: MappedTextFile = text_file
+        self._row_count: int = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else 1
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Vertical:
+            return section + 1
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self.text_file.line(index.row())
+
+    def set_row_count(self, count: int) -> None:
+        """
+        Show the lines indexed since the last update
+        :param count: number of indexed lines
+        :return: None
+        """
+        if count > self._row_count:
+            self.beginInsertRows(QModelIndex(), self._row_count, count - 1)
+            self._row_count = count
+            self.endInsertRows()
+
+
+class CustomLargeTextViewer(QWidget):
+    """
+    Read-only viewer of a large text file.
+    Lines are shown while the file is indexed in the background and only the visible ones are read.
+    """
+
+    def __init__(self, text_file: MappedTextFile, parent: QWidget = None) -> None:
+        """
+        Initialize the viewer and start indexing the file
+        :param text_file: mapped file to show
+        :param parent: parent widget
+        """
+        super().__init__(parent)
+        self.text_file: MappedTextFile = text_file
+        self.model: LargeTextModel = LargeTextModel(text_file, self)
+
+        self.view: QTableView = QTableView()
+        self.view.setModel(self.model)
+        self.view.setFont(QFont("Courier", 10))
+        self.view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.view.setShowGrid(False)
+        self.view.setWordWrap(False)
+        self.view.horizontalHeader().hide()
+        self.view.horizontalHeader().setStretchLastSection(True)
+        # every line has the same height, the view does not measure the lines it does not show
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.view.verticalHeader().setDefaultSectionSize(self.view.fontMetrics().height() + 2)
+
+        self.line_box: QSpinBox = QSpinBox()
+        self.line_box.setRange(1, 1)
+        self.line_box.editingFinished.connect(lambda: self.go_to_line(self.line_box.value() - 1))
+
+        self.search_edit: QLineEdit = QLineEdit()
+        self.search_edit.setPlaceholderText('Поиск')
+        self.search_edit.returnPressed.connect(self.find_next)
+        self.search_button: QPushButton = QPushButton('Найти')
+        self.search_button.clicked.connect(self.find_next)
+
+        self.status_label: QLabel = QLabel('Индексация...')
+
+        toolbar: QHBoxLayout = QHBoxLayout()
+        toolbar.addWidget(QLabel('Строка'))
+        toolbar.addWidget(self.line_box)
+        toolbar.addWidget(self.search_edit)
+        toolbar.addWidget(self.search_button)
+        toolbar.addWidget(self.status_label)
+
+        layout: QVBoxLayout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(toolbar)
+        layout.addWidget(self.view)
+
+        self.pool: QThreadPool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.signals: IndexSignals = IndexSignals(self)
+        self.signals.progress.connect(self.on_index_progress)
+        self.signals.finished.connect(self.on_index_finished)
+        self.signals.failed.connect(self.on_index_failed)
+        self.pool.start(IndexJob(text_file, self.signals))
+
+    def go_to_line(self, number: int) -> None:
+        """
+        Scroll to a line and select it
+        :param number: line number, starting from 0
+        :return: None
+        """
+        if not 0 <= number < self.model.rowCount():
+            return
+        index: QModelIndex = self.model.index(number, 0)
+        self.view.setCurrentIndex(index)
+        self.view.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtTop)
+
+    def find_next(self) -> None:
+        """
+        Select the next line containing the searched text
+        :return: None
+        """
+        text: str = self.search_edit.text()
+        if not text:
+            return
+
+        current: int = self.view.currentIndex().row()
+        number: int = self.text_file.find(text, current + 1)
+        if number < 0:
+            self.status_label.setText('Не найдено')
+            return
+        self.go_to_line(number)
+        self.line_box.setValue(number + 1)
+
+    def close_document(self) -> None:
+        """
+        Stop the indexing and close the file
+        :return: None
+        """
+        self.text_file.close()
+        self.pool.waitForDone()
+
+    @Slot(int)
+    def on_index_progress(self, count: int) -> None:
+        self.model.set_row_count(count)
+        self.line_box.setMaximum(max(1, count))
+        self.status_label.setText(f'Индексация... {count} строк')
+
+    @Slot(int)
+    def on_index_finished(self, count: int) -> None:
+        self.model.set_row_count(count)
+        self.line_box.setMaximum(max(1, count))
+        self.status_label.setText(f'{count} строк')
+
+    @Slot(str)
+    def on_index_failed(self, error: str) -> None:
+        self.status_label.setText(f'Ошибка: {error}')
@@ -1,45 +1,101 @@
+from PySide6.QtCore import QRect, QSize, Qt
 from PySide6.QtGui import (
-    QFont,
-    Qt,
-    QResizeEvent
+    QColor,
+    QPainter,
+    QPaintEvent,
+    QTextBlock
 )
-from PySide6.QtWidgets import QPlainTextEdit
+from PySide6.QtWidgets import QPlainTextEdit, QWidget
 
 
-class CustomLineNumberArea(QPlainTextEdit):
+class CustomLineNumberArea(QWidget):
     """
-    Class to handle the line number area
+    Class to handle the line number area.
+    The numbers of the visible blocks of the editor are painted, nothing is stored per line.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
+    PADDING: int = 5
+
+    def __init__(self, editor: QPlainTextEdit, *args, **kwargs) -> None:
         """
         Initialise the class of the line number area
+        :param editor: text edit whose lines are numbered
         """
         super().__init__(*args, **kwargs)
-        self.setReadOnly(True)
-        self.setStyleSheet("background-color: #e0e0e0; color: #555555;padding-left: 5px;")
-        self.setFont(QFont("Courier New", 12))
-        self.setFixedWidth(65)
-        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.editor: QPlainTextEdit = editor
+        self.background: QColor = QColor("#e0e0e0")
+        self.foreground: QColor = QColor("#555555")
+        self.update_width()
+
+    def sizeHint(self) -> QSize:
+        return QSize(self.area_width(), 0)
+
+    def area_width(self) -> int:
+        """
+        Get the width needed by the number of the last line
+        :return: int width in pixels
+        """
+        digits: int = len(str(max(1, self.editor.blockCount())))
+        return self.PADDING * 2 + self.editor.fontMetrics().horizontalAdvance('9') * max(digits, 3)
+
+    def update_width(self) -> None:
+        """
+        Fit the width of the area to the number of lines
+        :return: None
+        """
+        width: int = self.area_width()
+        if width != self.width():
+            self.setFixedWidth(width)
 
-    def update_scroll(self, value: int) -> None:
+    def update_scroll(self, dy: int = 0) -> None:
         """
-        Update the scroll bar
+        Follow the scrolling of the editor
+        :param dy: number of pixels scrolled, 0 to repaint the whole area
         :return: None
         """
-        scrollbar = self.verticalScrollBar()
-        scrollbar.setValue(value)
+        if dy:
+            self.scroll(0, dy)
+        else:
+            self.update()
 
-    def update_line_number_area(self, value: int) -> None:
+    def update_rows(self, y: int, height: int) -> None:
         """
-        Update the line number area
+        Repaint the numbers next to an updated part of the editor
+        :param y: top of the updated part in the editor viewport
+        :param height: height of the updated part
         :return: None
         """
-        self.setPlainText(str(value))
+        self.update(0, y + self._viewport_offset(), self.width(), height)
 
-    def resizeEvent(self, event: QResizeEvent) -> None:
+    def _viewport_offset(self) -> int:
         """
-        Resize the line number area
+        Get the vertical offset of the editor viewport in the area, the area is laid out next to the editor
+        :return: int offset in pixels
+        """
+        return self.editor.viewport().mapTo(self.editor, self.editor.viewport().rect().topLeft()).y() \
+            + self.editor.y() - self.y()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Paint the numbers of the blocks visible in the editor
         :return: None
         """
-        super().resizeEvent(event)
+        painter: QPainter = QPainter(self)
+        painter.fillRect(event.rect(), self.background)
+        painter.setPen(self.foreground)
+        painter.setFont(self.editor.font())
+
+        offset: int = self._viewport_offset()
+        block: QTextBlock = self.editor.firstVisibleBlock()
+        top: float = self.editor.blockBoundingGeometry(block).translated(self.editor.contentOffset()).top() + offset
+        line_height: int = self.editor.fontMetrics().height()
+        bottom_limit: int = event.rect().bottom()
+
+        while block.isValid() and top <= bottom_limit:
+            bottom: float = top + self.editor.blockBoundingRect(block).height()
+            if block.isVisible() and bottom >= event.rect().top():
+                painter.drawText(QRect(0, int(top), self.width() - self.PADDING, line_height),
+                                 Qt.AlignmentFlag.AlignRight, str(block.blockNumber() + 1))
+            block = block.next()
+            top = bottom
+        painter.end()
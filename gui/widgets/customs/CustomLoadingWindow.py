@@ -55,6 +55,13 @@ class LoadingWindow(QWidget):
         self.label.setText(f"Processing data... {value}%")
         self.progress_bar.setValue(value)
 
+    def update_message(self, text: str) -> None:
+        """
+        Shows the status message of the running task
+        :param text: The status message
+        """
+        self.progress_bar.setFormat(text if len(text) <= 40 else f"...{text[-37:]}")
+
     def display_time(self, elapsed_time: float) -> None:
         """
         Displays the time elapsed since the start of the loading process
@@ -0,0 +1,173 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QPushButton,
+    QSpinBox,
+    QLabel,
+    QPlainTextEdit
+)
+
+from config.cfg import PDF_PREFETCH_PAGES
+from utils.pdf_document import LazyPdfDocument
+
+
+class PageSignals(QObject):
+    """
+    Signals of the page extraction jobs
+    """
+    page_ready = Signal(int, str)  # page number, text
+    page_failed = Signal(int, str)  # page number, error message
+
+
+class PageJob(QRunnable):
+    """
+    Extract the text of one page on a worker thread
+    """
+
+    def __init__(self, document: LazyPdfDocument, number: int, signals: PageSignals) -> None:
+        super().__init__()
+        self.document: LazyPdfDocument = document
+        self.number: int = number
+        self.signals: PageSignals = signals
+
+    def run(self) -> None:
+        try:
+            text: str = self.document.page_text(self.number)
+        except Exception as e:
+            self.signals.page_failed.emit(self.number, str(e))
+        else:
+            self.signals.page_ready.emit(self.number, text)
+
+
+class CustomPdfViewer(QWidget):
+    """
+    Paginated viewer of a pdf document.
+    Only the current page and the pages around it are extracted, in the background.
+    """
+
+    def __init__(self, document: LazyPdfDocument, prefetch: int = PDF_PREFETCH_PAGES, parent=None) -> None:
+        """
+        Initialize the viewer
+        :param document: document to show
+        :param prefetch: number of pages extracted ahead of and behind the current page
+        :param parent: parent widget
+        """
+        super().__init__(parent)
+        self.document: LazyPdfDocument = document
+        self.prefetch: int = prefetch
+        self.current_page: int = 0
+        self._pending: set = set()
+
+        self.pool: QThreadPool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.signals: PageSignals = PageSignals(self)
+        self.signals.page_ready.connect(self.on_page_ready)
+        self.signals.page_failed.connect(self.on_page_failed)
+
+        self.prev_button: QPushButton = QPushButton('<')
+        self.prev_button.setFixedWidth(40)
+        self.prev_button.clicked.connect(lambda: self.show_page(self.current_page - 1))
+        self.next_button: QPushButton = QPushButton('>')
+        self.next_button.setFixedWidth(40)
+        self.next_button.clicked.connect(lambda: self.show_page(self.current_page + 1))
+
+        self.page_box: QSpinBox = QSpinBox()
+        self.page_box.setRange(1, max(1, document.page_count))
+        self.page_box.editingFinished.connect(lambda: self.show_page(self.page_box.value() - 1))
+        self.page_count_label: QLabel = QLabel(f'из {document.page_count}')
+
+        self.text_edit: QPlainTextEdit = QPlainTextEdit()
+        self.text_edit.setReadOnly(True)
+
+        navigation: QHBoxLayout = QHBoxLayout()
+        navigation.addWidget(self.prev_button)
+        navigation.addWidget(QLabel('Страница'))
+        navigation.addWidget(self.page_box)
+        navigation.addWidget(self.page_count_label)
+        navigation.addWidget(self.next_button)
+        navigation.addStretch()
+
+        layout: QVBoxLayout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(navigation)
+        layout.addWidget(self.text_edit)
+
+        if document.page_count:
+            self.show_page(0)
+        else:
+            self.text_edit.setPlainText('Документ не содержит страниц')
+            self._update_navigation()
+
+    def show_page(self, number: int) -> None:
+        """
+        Show a page, extracting it in the background if needed
+        :param number: page number, starting from 0
+        :return: None
+        """
+        if not 0 <= number < self.document.page_count:
+            return
+
+        self.current_page = number
+        self._update_navigation()
+
+        # the jobs still queued for the previous position would run before the requested page
+        self.pool.clear()
+        self._pending.clear()
+
+        text: str | None = self.document.cached_text(number)
+        if text is not None:
+            self._set_text(text)
+        else:
+            self.text_edit.setPlainText('Загрузка страницы...')
+            self._request(number, priority=1)
+
+        for offset in range(1, self.prefetch + 1):
+            for neighbour in (number + offset, number - offset):
+                if 0 <= neighbour < self.document.page_count and self.document.cached_text(neighbour) is None:
+                    self._request(neighbour)
+
+    def close_document(self) -> None:
+        """
+        Stop the extraction and close the document
+        :return: None
+        """
+        self.pool.clear()
+        self.pool.waitForDone()
+        self.document.close()
+
+    @Slot(int, str)
+    def on_page_ready(self, number: int, text: str) -> None:
+        self._pending.discard(number)
+        if number == self.current_page:
+            self._set_text(text)
+
+    @Slot(int, str)
+    def on_page_failed(self, number: int, error: str) -> None:
+        self._pending.discard(number)
+        if number == self.current_page:
+            self.text_edit.setPlainText(f'Ошибка: {error}')
+
+    def _request(self, number: int, priority: int = 0) -> None:
+        """
+        Queue the extraction of a page unless it is already queued
+        :param number: page number, starting from 0
+        :param priority: (Optional) jobs of a higher priority run first
+        :return: None
+        """
+        if number in self._pending:
+            return
+        self._pending.add(number)
+        self.pool.start(PageJob(self.document, number, self.signals), priority)
+
+    def _set_text(self, text: str) -> None:
+        self.text_edit.setPlainText(text)
+        self.text_edit.verticalScrollBar().setValue(0)
+
+    def _update_navigation(self) -> None:
+        self.page_box.blockSignals(True)
+        self.page_box.setValue(self.current_page + 1)
+        self.page_box.blockSignals(False)
+        self.prev_button.setEnabled(self.current_page > 0)
+        self.next_button.setEnabled(self.current_page + 1 < self.document.page_count)
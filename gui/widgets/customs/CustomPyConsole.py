@@ -1,18 +1,22 @@
 import sys
-from typing import TextIO
 
 from PySide6.QtGui import (
     QTextCursor,
-    QKeyEvent
+    QKeyEvent,
+    QContextMenuEvent,
+    QShowEvent,
+    QKeySequence
 )
-from PySide6.QtWidgets import QPlainTextEdit
+from PySide6.QtWidgets import QPlainTextEdit, QMenu
 from PySide6.QtCore import Qt
-import code
+
+from gui.Threads.InterpreterProcess import InterpreterProcess
 
 
 class CustomPyConsole(QPlainTextEdit):
     """
     Class for Custom PyConsole widget.
+    Commands are executed by an interpreter in a separate process, the widget stays responsive while they run.
     """
 
     def __init__(self, path: str, parent=None) -> None:
@@ -29,7 +33,10 @@ class CustomPyConsole(QPlainTextEdit):
         self.number_of_lines: int = 0
         self.historyIndex: int = -1
 
-        self.interpreter: code.InteractiveConsole = code.InteractiveConsole(locals={})
+        self.interpreter: InterpreterProcess = InterpreterProcess(path, self)
+        self.interpreter.output.connect(self.on_output)
+        self.interpreter.ready.connect(self.on_ready)
+        self.interpreter.stopped.connect(self.on_stopped)
         self.display_system_info()
 
     def display_system_info(self) -> None:
@@ -53,6 +60,13 @@ class CustomPyConsole(QPlainTextEdit):
         :param event: QKeyEvent
         :return: None
         """
+        if self.interpreter.busy:
+            if event.key() == Qt.Key.Key_C and event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+                self.interrupt()
+            elif event.matches(QKeySequence.StandardKey.Copy):
+                super().keyPressEvent(event)
+            return
+
         if event.key() in [Qt.Key.Key_Return, Qt.Key.Key_Enter]:
             cursor: QTextCursor = self.textCursor()
             cursor.movePosition(QTextCursor.MoveOperation.End)
@@ -87,31 +101,103 @@ class CustomPyConsole(QPlainTextEdit):
 
     def run_command(self, command: str) -> None:
         """
-        Execute the given command on the console. If the command is empty, the console will be cleared.
+        Execute the given command on the console. The output is shown while the command runs.
         :param command: str
         :return: None
         """
+        self.moveCursor(QTextCursor.MoveOperation.End)
         self.insertPlainText('\n')
-        old_stdout: TextIO = sys.stdout
-        old_stderr: TextIO = sys.stderr
-        sys.stdout = self
-        sys.stderr = self
-        try:
-            self.interpreter.push(command)
-        finally:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
+        if self.interpreter.execute(command):
+            self.setReadOnly(True)
 
-        self.number_of_lines += 1
-        self.prompt_style = f"{self.path} [{self.number_of_lines}]$ "
-        self.insertPlainText(self.prompt_style)
+    def interrupt(self) -> None:
+        """
+        Interrupt the running command.
+        :return: None
+        """
+        self.interpreter.interrupt()
+
+    def restart(self) -> None:
+        """
+        Restart the interpreter, the defined variables are lost.
+        :return: None
+        """
+        busy: bool = self.interpreter.busy
+        self.write('\n--- Интерпретатор перезапущен ---\n')
+        self.interpreter.restart()
+        if not busy:
+            self.on_ready(False)
+
+    def shutdown(self) -> None:
+        """
+        Stop the interpreter process.
+        :return: None
+        """
+        self.interpreter.stop()
+
+    def on_output(self, stream: str, text: str) -> None:
+        """
+        Show a batch of output of the interpreter.
+        :param stream: "stdout" or "stderr"
+        :param text: str
+        :return: None
+        """
+        self.write(text)
+
+    def on_ready(self, more: bool) -> None:
+        """
+        Show the prompt once the interpreter is ready for the next line.
+        :param more: True if the statement goes on in the next line
+        :return: None
+        """
+        self.setReadOnly(False)
+        if more:
+            self.prompt_style = '... '
+        else:
+            self.number_of_lines += 1
+            self.prompt_style = f"{self.path} [{self.number_of_lines}]$ "
+        self.write(self.prompt_style)
+
+    def on_stopped(self, exit_code: int) -> None:
+        """
+        Report the end of the interpreter, a new one is started with the next command.
+        :param exit_code: exit code of the interpreter
+        :return: None
+        """
+        self.write(f'\n--- Интерпретатор завершён (код {exit_code}) ---\n')
+        if not self.interpreter.busy:
+            # the prompt of a running command is shown once the command is reported as finished
+            self.write(self.prompt_style)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """
+        Start the interpreter when the console is shown for the first time.
+        :param event: QShowEvent
+        :return: None
+        """
+        super().showEvent(event)
+        self.interpreter.start()
+
+    def contextMenuEvent(self, event: QContextMenuEvent) -> None:
+        """
+        Show the context menu with the interpreter actions.
+        :param event: QContextMenuEvent
+        :return: None
+        """
+        menu: QMenu = self.createStandardContextMenu()
+        menu.addSeparator()
+        interrupt_action = menu.addAction('Прервать выполнение (Ctrl+C)', self.interrupt)
+        interrupt_action.setEnabled(self.interpreter.busy)
+        menu.addAction('Перезапустить интерпретатор', self.restart)
+        menu.exec(event.globalPos())
 
     def write(self, text: str) -> None:
         """
-        Write the given text to the console.
+        Write the given text to the end of the console.
         :param text: str
         :return: None
         """
+        self.moveCursor(QTextCursor.MoveOperation.End)
         self.insertPlainText(text)
 
     def writelines(self, lines: list) -> None:
@@ -135,5 +221,5 @@ class CustomPyConsole(QPlainTextEdit):
         Clear the console.
         :return: None
         """
-        self.clear()
+        super().clear()
 
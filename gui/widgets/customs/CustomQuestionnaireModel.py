@@ -0,0 +1,179 @@
+import re
+from typing import Any, List
+
+from PySide6.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QEvent,
+    QObject,
+    Signal
+)
+from PySide6.QtGui import QColor, QIntValidator
+from PySide6.QtWidgets import QStyledItemDelegate, QLineEdit, QWidget, QStyleOptionViewItem
+
+from utils.formula import FormulaEngine
+
+
+class QuestionnaireModel(QAbstractTableModel):
+    """
+    Table model of a questionnaire (``mdth`` rows).
+    Answers are kept as plain strings, no widget is created per row.
+    """
+    answer_changed = Signal(int, str)  # row, idx
+
+    INPUT_NUMBER: str = "(Ввод числа)"
+    INPUT_TEXT: str = "(Ввод текста)"
+    COLUMN_ANSWER: int = 2
+
+    headers: List[str] = ['№ п/п', 'Показатель', 'Ответ']
+
+    def __init__(self, rows: List[dict], parent: QObject = None) -> None:
+        """
+        Initialize the questionnaire model
+        :param rows: list of dicts with "idx", "name" and "data" keys
+        :param parent: parent object
+        """
+        super().__init__(parent)
+        self.rows: List[dict] = rows
+        self.answers: List[str] = []
+        self.input_rows: dict = {}
+        self._inputs: List[bool] = []
+
+        for row, item in enumerate(rows):
+            data: str = item.get("data", "")
+            is_input: bool = data != " " and not FormulaEngine.is_autosum(data)
+            self._inputs.append(is_input)
+            if is_input:
+                self.input_rows[item.get("idx", "")] = row
+            self.answers.append(data if is_input and data not in (self.INPUT_NUMBER, self.INPUT_TEXT) else "")
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row: int = index.row()
+        column: int = index.column()
+        item: dict = self.rows[row]
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == 0:
+                return item.get("idx", "")
+            if column == 1:
+                return item.get("name", "")
+            if role == Qt.ItemDataRole.DisplayRole and not self.answers[row] and self._inputs[row]:
+                return self.placeholder(row)
+            return self.answers[row]
+
+        if role == Qt.ItemDataRole.ForegroundRole and column == self.COLUMN_ANSWER and not self.answers[row]:
+            return QColor("#9e9e9e")
+
+        if role == Qt.ItemDataRole.ToolTipRole and column == 1:
+            return item.get("name", "")
+
+        if role == Qt.ItemDataRole.TextAlignmentRole and column == 1:
+            if self._is_valid_string(item.get("idx", "")):
+                return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == self.COLUMN_ANSWER and self._inputs[index.row()]:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.EditRole or not (self.flags(index) & Qt.ItemFlag.ItemIsEditable):
+            return False
+
+        row: int = index.row()
+        value: str = str(value) if value is not None else ""
+        if self.answers[row] == value:
+            return True
+
+        self.answers[row] = value
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        self.answer_changed.emit(row, self.rows[row].get("idx", ""))
+        return True
+
+    def is_input(self, row: int) -> bool:
+        """
+        Check if the row expects an answer
+        :param row: int row of the model
+        :return: bool True if the row is editable
+        """
+        return self._inputs[row]
+
+    def is_number(self, row: int) -> bool:
+        """
+        Check if the row expects a number
+        :param row: int row of the model
+        :return: bool True if the row is a number input
+        """
+        return self.rows[row].get("data") == self.INPUT_NUMBER
+
+    def placeholder(self, row: int) -> str:
+        """
+        Get the placeholder text of an input row
+        :param row: int row of the model
+        :return: str placeholder, empty if the row has none
+        """
+        data: str = self.rows[row].get("data", "")
+        return data if data in (self.INPUT_NUMBER, self.INPUT_TEXT) else ""
+
+    def answer(self, idx: str) -> str:
+        """
+        Get the answer of an input row by its idx
+        :param idx: str idx of the row
+        :return: str answer, empty if the row is not an input
+        """
+        row: int | None = self.input_rows.get(idx)
+        return self.answers[row] if row is not None else ""
+
+    @staticmethod
+    def _is_valid_string(s: str) -> bool:
+        pattern = r'^[\-\!\\"№;%\[\]/=_\.,\+]*$'
+        return bool(re.match(pattern, s))
+
+
+class QuestionnaireDelegate(QStyledItemDelegate):
+    """
+    Editing delegate of the questionnaire answers.
+    An editor is created only for the cell being edited and commits on every keystroke.
+    """
+    navigate = Signal(int)  # direction of the next row to edit
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> QWidget:
+        editor: QLineEdit = QLineEdit(parent)
+        model: QuestionnaireModel = index.model()
+        editor.setPlaceholderText(model.placeholder(index.row()))
+        if model.is_number(index.row()):
+            editor.setValidator(QIntValidator(0, 1000, editor))
+        editor.textEdited.connect(lambda _text: self.commitData.emit(editor))
+        return editor
+
+    def eventFilter(self, editor: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.KeyPress and isinstance(editor, QLineEdit):
+            if event.key() in {Qt.Key.Key_Return, Qt.Key.Key_Enter, Qt.Key.Key_Down}:
+                self.commitData.emit(editor)
+                self.navigate.emit(1)
+                return True
+            if event.key() == Qt.Key.Key_Up:
+                self.commitData.emit(editor)
+                self.navigate.emit(-1)
+                return True
+        return super().eventFilter(editor, event)
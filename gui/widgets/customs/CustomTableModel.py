@@ -0,0 +1,108 @@
+from typing import Any, Dict, List
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject
+
+from config.cfg import TABLE_CACHED_CHUNKS
+from utils.table_reader import Columns, TableReader
+
+
+class StreamingTableModel(QAbstractTableModel):
+    """
+    Read-only table model of a csv or excel file.
+    Rows are read from the file in chunks as the view is scrolled and kept column by column.
+    At most TABLE_CACHED_CHUNKS chunks are held, the farthest one from the shown rows is dropped
+    and read again from the file when it is scrolled back to.
+    """
+
+    def __init__(self, reader: TableReader, parent: QObject = None) -> None:
+        """
+        Initialize the table model
+        :param reader: opened reader of the file
+        :param parent: parent object
+        """
+        super().__init__(parent)
+        self.reader: TableReader = reader
+        self.headers: List[str] = reader.columns
+        self._chunk_rows: int = reader.chunk_rows
+        self._chunks: Dict[int, Columns] = {}
+        self._row_count: int = 0
+        self.fetchMore()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return section + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        number, row = divmod(index.row(), self._chunk_rows)
+        chunk: Columns | None = self._chunk(number)
+        if chunk is None or index.column() >= len(chunk) or row >= len(chunk[index.column()]):
+            return None
+        return chunk[index.column()][row]
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self.reader.exhausted
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """
+        Read the next chunk of the file into the model
+        :param parent: parent index, always invalid for a table
+        :return: None
+        """
+        if parent.isValid():
+            return
+
+        chunk: Columns | None = self.reader.read_chunk()
+        if not chunk or not chunk[0]:
+            return
+
+        first: int = self._row_count
+        self.beginInsertRows(QModelIndex(), first, first + len(chunk[0]) - 1)
+        self._keep(first // self._chunk_rows, chunk)
+        self._row_count += len(chunk[0])
+        self.endInsertRows()
+
+    def close(self) -> None:
+        """
+        Close the file, the rows held are dropped
+        :return: None
+        """
+        self.reader.close()
+        self._chunks.clear()
+
+    def _chunk(self, number: int) -> Columns | None:
+        """
+        Get a chunk, reading it again from the file if it was dropped
+        :param number: number of the chunk
+        :return: list of the columns of the chunk or None if it can not be read
+        """
+        chunk: Columns | None = self._chunks.get(number)
+        if chunk is None:
+            chunk = self.reader.read_chunk_at(number)
+            if chunk is not None:
+                self._keep(number, chunk)
+        return chunk
+
+    def _keep(self, number: int, chunk: Columns) -> None:
+        """
+        Hold a chunk, dropping the farthest ones from it over TABLE_CACHED_CHUNKS
+        :param number: number of the chunk
+        :param chunk: list of the columns of the chunk
+        :return: None
+        """
+        self._chunks[number] = chunk
+        while len(self._chunks) > TABLE_CACHED_CHUNKS:
+            del self._chunks[max(self._chunks, key=lambda held: abs(held - number))]
@@ -1,11 +1,11 @@
-from PySide6.QtCore import Qt, Slot, Signal
+from PySide6.QtCore import Slot, Signal
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, \
-    QAbstractItemView, QTableWidgetItem, QLineEdit
+    QAbstractItemView, QTableWidgetItem
 
 
 class CustomTestWidget(QWidget):
-    set_scrollbar_value = Signal(QLineEdit)
+    set_scrollbar_value = Signal(int)
 
     def __init__(self, test_names=None, icons=None, parent=None):
         super().__init__(parent)
@@ -38,12 +38,12 @@ class CustomTestWidget(QWidget):
         for name in self.test_items:
             self.addTestItem(name)
 
-    def addTestItem(self, name):
+    def addTestItem(self, name: str):
         row_position = self.table_widget.rowCount()
         self.table_widget.insertRow(row_position)
 
         text_item = QTableWidgetItem()
-        text_item.setText(name.text())
+        text_item.setText(name)
         text_item.setIcon(QIcon(self.icons[1]))
         self.table_widget.setItem(row_position, 0, text_item)
 
@@ -54,32 +54,24 @@ class CustomTestWidget(QWidget):
             self.addTestItem(name)
 
     def on_cell_double_clicked(self, row, column):
-        if not hasattr(self, 'label_to_textbox_map'):
+        if not hasattr(self, 'label_to_row_map'):
             return
 
         item = self.table_widget.item(row, column)
-        if item:
-            var = self.label_to_textbox_map[item.text()]
-            var.setFocus(Qt.FocusReason.OtherFocusReason)
-            self.set_scrollbar_value.emit(var)
+        if item and item.text() in self.label_to_row_map:
+            self.set_scrollbar_value.emit(self.label_to_row_map[item.text()])
 
     @Slot(list)
     def updateIcons(self, data):
-        self.label_to_textbox_map = {label.text(): textbox for label, textbox in data}
+        self.label_to_row_map = {label: row for label, row, _, _ in data}
+        states = {label: (done, in_progress) for label, _, done, in_progress in data}
         for row in range(self.table_widget.rowCount()):
             icon_item = self.table_widget.item(row, 0)
-            if icon_item.text() in self.label_to_textbox_map:
-                if self.is_test_done(self.label_to_textbox_map[icon_item.text()]):
+            if icon_item.text() in states:
+                done, in_progress = states[icon_item.text()]
+                if done:
                     icon_item.setIcon(QIcon(self.icons[0]))  # Done icon
-                elif self.is_test_in_progress(self.label_to_textbox_map[icon_item.text()]):
+                elif in_progress:
                     icon_item.setIcon(QIcon(self.icons[2]))  # Not done icon
                 else:
                     icon_item.setIcon(QIcon(self.icons[1]))  # In-progress icon
-
-    def is_test_done(self, test_name: QLineEdit):
-        if test_name:
-            return test_name.text() != ''
-
-    def is_test_in_progress(self, test_name: QLineEdit):
-        if test_name:
-            return test_name.hasFocus()
@@ -1,10 +1,11 @@
+from PySide6.QtCore import QRect
 from PySide6.QtGui import (
     QFont,
     QTextCursor
 )
 from PySide6.QtWidgets import (
     QWidget,
-    QTextEdit,
+    QPlainTextEdit,
     QHBoxLayout
 )
 
@@ -23,37 +24,38 @@ class CustomTextEdit(QWidget):
         super().__init__(*args, **kwargs)
 
         self.text_edit = self._create_text_edit()
-        self.line_number_area = self._create_line_number_area()
+        self.line_number_area = self._create_line_number_area(self.text_edit)
 
-        self.update_line_numbers()
-
-        self.text_edit.textChanged.connect(self.update_line_numbers)
-        self.text_edit.verticalScrollBar().valueChanged.connect(self.sync_scroll)
+        # the gutter is repainted for the visible lines only, when lines are added or removed and on scrolling
+        self.text_edit.blockCountChanged.connect(self.update_line_numbers)
+        self.text_edit.updateRequest.connect(self.sync_scroll)
 
         self.setLayout(self._create_layout(self, self.line_number_area, self.text_edit))
 
-    def update_line_numbers(self) -> None:
+    def update_line_numbers(self, *_) -> None:
         """
         Update line number area with custom text edit widget content
         """
-        line_count: int = self.text_edit.document().blockCount()
-        line_numbers: str = "\n".join(map(str, range(1, line_count + 1)))
-        self.line_number_area.setPlainText(line_numbers)
+        self.line_number_area.update_width()
+        self.line_number_area.update()
 
     def append(self, _text: str) -> None:
         """
         Append text to text edit widget content
         :param _text: text to append to text edit widget
         """
-        self.text_edit.append(_text)
-        self.update_line_numbers()
+        self.text_edit.appendPlainText(_text)
 
-    def sync_scroll(self) -> None:
+    def sync_scroll(self, rect: QRect = None, dy: int = 0) -> None:
         """
-        Sync scroll bar of line number area with text edit widget
+        Sync line number area with the scrolled or updated part of the text edit widget
+        :param rect: updated rectangle of the text edit viewport
+        :param dy: number of pixels scrolled
         """
-        value: int = self.text_edit.verticalScrollBar().value()
-        self.line_number_area.update_scroll(value)
+        if dy or rect is None:
+            self.line_number_area.update_scroll(dy)
+        else:
+            self.line_number_area.update_rows(rect.y(), rect.height())
 
     def set_cursor_position(self, _position: int) -> None:
         """
@@ -69,37 +71,35 @@ class CustomTextEdit(QWidget):
         Clear text edit widget content  and set cursor position to 0
         """
         self.text_edit.clear()
-        self.update_line_numbers()
         cursor: QTextCursor = self.text_edit.textCursor()
         cursor.setPosition(0)
         self.text_edit.setTextCursor(cursor)
 
     @staticmethod
-    def _create_text_edit() -> QTextEdit:
+    def _create_text_edit() -> QPlainTextEdit:
         """
         Create custom text edit widget with line number area
-        :return QTextEdit: custom text edit widget with line number area
+        :return QPlainTextEdit: custom text edit widget with line number area
         """
-        text_edit: QTextEdit = QTextEdit()
+        text_edit: QPlainTextEdit = QPlainTextEdit()
         text_edit.setObjectName("base")
         text_edit.setReadOnly(False)
         text_edit.setFont(QFont("Arial", 12))
         text_edit.setStyleSheet(
-            "QTextEdit { border: none; background-color: #f4f4f4; color: black; }")
+            "QPlainTextEdit { border: none; background-color: #f4f4f4; color: black; }")
         return text_edit
 
     @staticmethod
-    def _create_line_number_area() -> CustomLineNumberArea:
+    def _create_line_number_area(text_edit: QPlainTextEdit) -> CustomLineNumberArea:
         """
         Create custom line number area with custom text edit widget with line number area
+        :param text_edit: custom text edit widget whose lines are numbered
         :return CustomLineNumberArea: custom line number area with custom text edit widget with line number area
         """
-        line_number_area: CustomLineNumberArea = CustomLineNumberArea()
-        line_number_area.setFont(QFont("Courier New", 12))
-        return line_number_area
+        return CustomLineNumberArea(text_edit)
 
     @staticmethod
-    def _create_layout(obj: QWidget, line_number_area: CustomLineNumberArea, text_edit: QTextEdit) -> QHBoxLayout:
+    def _create_layout(obj: QWidget, line_number_area: CustomLineNumberArea, text_edit: QPlainTextEdit) -> QHBoxLayout:
         """
         Create custom layout with custom text edit widget with line number area and custom text edit widget with line number area
         :param obj: custom text edit widget with line number area and custom text edit widget with line number area
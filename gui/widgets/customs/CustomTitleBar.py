@@ -337,6 +337,13 @@ class CustomTitleBar(QWidget):
                 self.callbacks.get('save')
             ),
 
+            self._create_action(
+                "json (session log)",
+                "compact_json",
+                self.saves_icons.get('save_json'),
+                self.callbacks.get('save')
+            ),
+
             self._create_action(
                 "html",
                 "save_html",
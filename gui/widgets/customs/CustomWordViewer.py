@@ -0,0 +1,102 @@
+from typing import Any, List
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QTabWidget, QTableView, QHeaderView, QAbstractItemView, QWidget, QLabel
+
+from utils.docx_tables import WordTable
+
+
+class WordTableModel(QAbstractTableModel):
+    """
+    Read-only table model of a word table, the first row of the table is the header
+    """
+
+    def __init__(self, table: WordTable, parent: QObject = None) -> None:
+        """
+        Initialize the table model
+        :param table: table of the document
+        :param parent: parent object
+        """
+        super().__init__(parent)
+        self.table: WordTable = table
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else max(0, self.table.row_count - 1)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.table.width
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.table.cell(0, section)
+        return section + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self.table.cell(index.row() + 1, index.column())
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+
+class CustomWordViewer(QTabWidget):
+    """
+    Viewer of the tables of a word document, one tab per table.
+    The view of a table is created the first time its tab is shown.
+    """
+
+    def __init__(self, tables: List[WordTable], parent: QWidget = None) -> None:
+        """
+        Initialize the viewer
+        :param tables: tables of the document
+        :param parent: parent widget
+        """
+        super().__init__(parent)
+        self.tables: List[WordTable] = tables
+        self.setDocumentMode(True)
+
+        if not tables:
+            self.addTab(QLabel('Документ не содержит таблиц'), 'Таблицы')
+            return
+
+        for number, table in enumerate(tables, 1):
+            self.addTab(QWidget(), f'Таблица {number}')
+            self.setTabToolTip(number - 1, f'{table.row_count} строк, {table.width} столбцов')
+
+        self.currentChanged.connect(self._show_table)
+        self._show_table(0)
+
+    def _show_table(self, index: int) -> None:
+        """
+        Create the view of a table unless it already exists
+        :param index: index of the tab
+        :return: None
+        """
+        if index < 0 or isinstance(self.widget(index), QTableView):
+            return
+
+        table_view: QTableView = QTableView()
+        table_view.setModel(WordTableModel(self.tables[index], table_view))
+        table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table_view.setFont(QFont("Arial", 10))
+        table_view.setStyleSheet(
+            "QTableView { background-color: #f4f4f4; color: black; border: none; } "
+            "QHeaderView::section { background-color: #d4d4d4; color: black; padding: 5px; border: none; } "
+            "QTableView::item { padding: 5px; color: black;}"
+        )
+
+        placeholder: QWidget = self.widget(index)
+        title: str = self.tabText(index)
+        tooltip: str = self.tabToolTip(index)
+        self.blockSignals(True)
+        self.removeTab(index)
+        self.insertTab(index, table_view, title)
+        self.setTabToolTip(index, tooltip)
+        self.setCurrentIndex(index)
+        self.blockSignals(False)
+        placeholder.deleteLater()
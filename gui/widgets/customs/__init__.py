@@ -6,7 +6,12 @@ from . import (
     CustomLineNumberArea,
     CustomBashConsole,
     CustomFileManager,
-    CustomDataContainer
+    CustomDataContainer,
+    CustomQuestionnaireModel,
+    CustomPdfViewer,
+    CustomTableModel,
+    CustomWordViewer,
+    CustomLargeTextViewer
 )
 
 __all__ = [
@@ -17,7 +22,12 @@ __all__ = [
     'CustomLineNumberArea',
     'CustomBashConsole',
     'CustomFileManager',
-    'CustomDataContainer'
+    'CustomDataContainer',
+    'CustomQuestionnaireModel',
+    'CustomPdfViewer',
+    'CustomTableModel',
+    'CustomWordViewer',
+    'CustomLargeTextViewer'
 ]
 
 __version__ = '0.1.0'
@@ -11,6 +11,7 @@ class SplashScreen(QLabel):
     Splash screen class.
     """
     _finished = Signal()
+    painted = Signal()  # emitted once, after the first paint of the splash screen
 
     def __init__(self, movie_file: str) -> None:
         """
@@ -26,6 +27,7 @@ class SplashScreen(QLabel):
         self.resize(650, 500)
         self.center()
         self.setScaledContents(True)
+        self._painted: bool = False
 
     def start(self) -> None:
         """
@@ -34,6 +36,17 @@ class SplashScreen(QLabel):
         """
         self.movie.start()
 
+    def paintEvent(self, event) -> None:
+        """
+        Paint the splash screen, the first paint is reported once the event loop is free again.
+        :param event: paint event.
+        :return: None.
+        """
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            QTimer.singleShot(0, self.painted.emit)
+
     def check_if_finished(self) -> None:
         """
         Handle splash screen finished.
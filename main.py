@@ -1,7 +1,11 @@
+import multiprocessing
 import os
 import sys
 from typing import LiteralString
 
+# imported first of all, the start-up phases are timed from its import
+from utils.startup import profile
+
 from PySide6.QtWidgets import QApplication, QMessageBox
 
 from config.cfg import EXE_DIR
@@ -24,54 +28,57 @@ def get_resource_path(relative_path) -> LiteralString | str | bytes:
 def configurate_assets() -> dict:
     """
     Configures the application assets.
+    The icons are loaded by the registries when they are first used.
     :return: dict containing the icons to be used in the application.
     """
-    from config.cfg import EXE_DIR
-    from utils.loaders import load_icon
-    path_to_assets = get_resource_path('assets')
-
-    icons = {
-        'hidden_folder': load_icon(get_resource_path(os.path.join('assets', 'folder', 'hidden_folder.png'))),
-        'open_clear_folder': load_icon(get_resource_path(os.path.join('assets', 'folder', 'open_clear_folder.png'))),
-        'open_full_folder': load_icon(get_resource_path(os.path.join('assets', 'folder', 'open_full_folder.png'))),
-        'bash': load_icon(get_resource_path(os.path.join('assets', 'console', 'bash.png'))),
-        'py': load_icon(get_resource_path(os.path.join('assets', 'console', 'py.png'))),
-        'test_btn': load_icon(get_resource_path(os.path.join('assets', 'test', 'button.png'))),
-        'success_question': load_icon(get_resource_path(os.path.join('assets', 'test', 'qs.png'))),
-        'failed_question': load_icon(get_resource_path(os.path.join('assets', 'test', 'qc.png'))),
-        'process_question': load_icon(get_resource_path(os.path.join('assets', 'folder', 'qp.png'))),
-        'menu_exit': load_icon(get_resource_path(os.path.join('assets', 'main', 'menu_exit.png'))),
-        'menu_file': load_icon(get_resource_path(os.path.join('assets', 'main', 'menu_file.png'))),
-        'menu_new': load_icon(get_resource_path(os.path.join('assets', 'main', 'menu_new.png'))),
-        'button': load_icon(get_resource_path(os.path.join('assets', 'default', 'button.png'))),
-        'menu_new_file': load_icon(get_resource_path(os.path.join('assets', 'main', 'menu_new_file.png'))),
-        'menu_new_project': load_icon(get_resource_path(os.path.join('assets', 'main', 'menu_new_project.png'))),
-        'menu_open': load_icon(get_resource_path(os.path.join('assets', 'main', 'menu_open.png'))),
-        'menu_open_file': load_icon(get_resource_path(os.path.join('assets', 'main', 'menu_open_file.png'))),
-        'menu_open_project': load_icon(get_resource_path(os.path.join('assets', 'main', 'menu_open_project.png'))),
-        'menu_save': load_icon(get_resource_path(os.path.join('assets', 'main', 'menu_save.png'))),
-        'menu_save_as': load_icon(get_resource_path(os.path.join('assets', 'main', 'menu_save_as.png'))),
-        'main_menu': load_icon(get_resource_path(os.path.join('assets', 'main', 'main_menu.png'))),
-        'menu_txt': load_icon(get_resource_path(os.path.join('assets', 'main', 'menu_txt.png'))),
-        'minimize': load_icon(get_resource_path(os.path.join('assets', 'title', 'minimize.png'))),
-        'maximize': load_icon(get_resource_path(os.path.join('assets', 'title', 'maximize.png'))),
-        'close': load_icon(get_resource_path(os.path.join('assets', 'title', 'close.png'))),
-        'title_main': load_icon(get_resource_path(os.path.join('assets', 'title_main'))),
-        'graph': load_icon(get_resource_path(os.path.join('assets', 'folder', 'graph.png'))),
-        'bar_chart': load_icon(get_resource_path(os.path.join('assets', 'default', 'bar_chart.png'))),
-        'function_f_graph': load_icon(get_resource_path(os.path.join('assets', 'default', 'function_f_graph.png'))),
-        'start_screen_pixmap': get_resource_path(os.path.join('assets', 'start_screen.jpg')),
-    }
-    saves_icons = {
-        'save_word': load_icon(get_resource_path(os.path.join('assets', 'save2', 'sword.png'))),
-        'save_excel': load_icon(get_resource_path(os.path.join('assets', 'save2', 'sexcel.png'))),
-        'save_pdf': load_icon(get_resource_path(os.path.join('assets', 'save2', 'spdf.png'))),
-        'save_csv': load_icon(get_resource_path(os.path.join('assets', 'save2', 'scsv.png'))),
-        'save_json': load_icon(get_resource_path(os.path.join('assets', 'save2', 'sjson.png'))),
-        'save_html': load_icon(get_resource_path(os.path.join('assets', 'save2', 'shtml.png'))),
-        'save_txt': load_icon(get_resource_path(os.path.join('assets', 'save2', 'stxt.png'))),
-        'save_xml': load_icon(get_resource_path(os.path.join('assets', 'save2', 'sxml.png'))),
-    }
+    from utils.assets import IconRegistry
+
+    def asset(*parts: str) -> str:
+        return get_resource_path(os.path.join('assets', *parts))
+
+    icons = IconRegistry({
+        'hidden_folder': asset('folder', 'hidden_folder.png'),
+        'open_clear_folder': asset('folder', 'open_clear_folder.png'),
+        'open_full_folder': asset('folder', 'open_full_folder.png'),
+        'bash': asset('console', 'bash.png'),
+        'py': asset('console', 'py.png'),
+        'test_btn': asset('test', 'button.png'),
+        'success_question': asset('test', 'qs.png'),
+        'failed_question': asset('test', 'qc.png'),
+        'process_question': asset('folder', 'qp.png'),
+        'menu_exit': asset('main', 'menu_exit.png'),
+        'menu_file': asset('main', 'menu_file.png'),
+        'menu_new': asset('main', 'menu_new.png'),
+        'button': asset('default', 'button.png'),
+        'menu_new_file': asset('main', 'menu_new_file.png'),
+        'menu_new_project': asset('main', 'menu_new_project.png'),
+        'menu_open': asset('main', 'menu_open.png'),
+        'menu_open_file': asset('main', 'menu_open_file.png'),
+        'menu_open_project': asset('main', 'menu_open_project.png'),
+        'menu_save': asset('main', 'menu_save.png'),
+        'menu_save_as': asset('main', 'menu_save_as.png'),
+        'main_menu': asset('main', 'main_menu.png'),
+        'menu_txt': asset('main', 'menu_txt.png'),
+        'minimize': asset('title', 'minimize.png'),
+        'maximize': asset('title', 'maximize.png'),
+        'close': asset('title', 'close.png'),
+        'title_main': asset('title_main'),
+        'graph': asset('folder', 'graph.png'),
+        'bar_chart': asset('default', 'bar_chart.png'),
+        'function_f_graph': asset('default', 'function_f_graph.png'),
+    }, resources={
+        'start_screen_pixmap': asset('start_screen.jpg'),
+    })
+    saves_icons = IconRegistry({
+        'save_word': asset('save2', 'sword.png'),
+        'save_excel': asset('save2', 'sexcel.png'),
+        'save_pdf': asset('save2', 'spdf.png'),
+        'save_csv': asset('save2', 'scsv.png'),
+        'save_json': asset('save2', 'sjson.png'),
+        'save_html': asset('save2', 'shtml.png'),
+        'save_txt': asset('save2', 'stxt.png'),
+        'save_xml': asset('save2', 'sxml.png'),
+    })
 
     btn_name = {
         'save_word': 'Сохранить как Word',
@@ -90,6 +97,17 @@ def configurate_assets() -> dict:
     }
 
 
+def on_quit(start_menu: Ui_StartMenu) -> None:
+    """
+    Wait for the start-up housekeeping and record the timings of the start-up.
+    :param start_menu: start menu running the housekeeping
+    :return: None
+    """
+    if start_menu.loader_group is not None:
+        start_menu.loader_group.wait()
+    profile.save()
+
+
 # def main() -> None:
 #     """
 #     Main function.
@@ -121,14 +139,22 @@ def main() -> None:
     Main function.
     :return: None
     """
+    profile.mark('imports')
     app = QApplication(sys.argv)
     assets = configurate_assets()
+    profile.mark('assets')
 
     splash_screen = SplashScreen(os.path.join(EXE_DIR, os.path.join('assets', 'start_screen.gif')))
     splash_screen.show()
     splash_screen.start()
 
     main_window = Ui_StartMenu(assets)
+    profile.mark('start_menu')
+
+    # the housekeeping runs in the background once the splash screen is on the screen
+    splash_screen.painted.connect(lambda: profile.mark('first_paint'))
+    splash_screen.painted.connect(main_window.run_setup)
+    app.aboutToQuit.connect(lambda: on_quit(main_window))
 
     try:
         if len(sys.argv) > 1:
@@ -139,6 +165,7 @@ def main() -> None:
             splash_screen.finished.connect(lambda: main_window.open_main_window(file_path, from_file=True))
         else:
             splash_screen.finished.connect(main_window.show)
+        splash_screen.finished.connect(lambda: profile.mark('window'))
 
         sys.exit(app.exec())
 
@@ -148,4 +175,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # export_all runs the exporters in spawned processes, which a frozen build has to handle
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,78 @@
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+from PySide6.QtGui import QIcon
+
+from config.cfg import ICON_SIZE, ICON_CACHE_DIR
+from utils.loaders import load_scaled_pixmap
+
+
+class IconRegistry(Mapping):
+    """
+    Icons of the application resolved on first use.
+    Only the paths are known when the registry is created, an icon is loaded when it is first
+    looked up and kept for the next lookups. Other resources (e.g. paths of images shown as they are)
+    are returned unchanged.
+    """
+
+    def __init__(self, paths: dict, resources: dict = None, size: int = ICON_SIZE,
+                 cache_dir: str | None = ICON_CACHE_DIR) -> None:
+        """
+        Initialize the registry
+        :param paths: paths of the icon files by name
+        :param resources: (Optional) other resources by name
+        :param size: (Optional) size of the icons in pixels
+        :param cache_dir: (Optional) directory of the pre-scaled icons, None to keep them in memory only
+        """
+        self.paths: dict = dict(paths)
+        self.resources: dict = dict(resources or {})
+        self.size: int = size
+        self.cache_dir: str | None = cache_dir
+        self._icons: dict = {}
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self.resources:
+            return self.resources[name]
+
+        icon: QIcon | None = self._icons.get(name)
+        if icon is None:
+            pixmap = load_scaled_pixmap(self.paths[name], self.size, self.cache_dir)
+            icon = QIcon() if pixmap.isNull() else QIcon(pixmap)
+            self._icons[name] = icon
+        return icon
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.paths
+        yield from self.resources
+
+    def __len__(self) -> int:
+        return len(self.paths) + len(self.resources)
+
+    def __contains__(self, name: object) -> bool:
+        # answered without loading the icon
+        return name in self.paths or name in self.resources
+
+    @property
+    def loaded(self) -> int:
+        """
+        Number of icons loaded so far
+        :return: int
+        """
+        return len(self._icons)
+
+    def copy(self) -> 'IconRegistry':
+        """
+        Copy the registry, the icons already loaded are shared
+        :return: IconRegistry
+        """
+        registry: IconRegistry = IconRegistry(self.paths, self.resources, self.size, self.cache_dir)
+        registry._icons = dict(self._icons)
+        return registry
+
+    def preload(self) -> None:
+        """
+        Load all the icons
+        :return: None
+        """
+        for name in self.paths:
+            self[name]
@@ -16,15 +16,14 @@ class ConfigurationMDTH:
         '4.1.4nc', '4.1.5', '4.1.5c', '4.1.5nc', '4.1.6', '4.1.6c',
         '4.1.6nc', '4.1.7', '4.1.7c', '4.1.7nc', '4.1.8', '4.1.8c', '4.1.8nc',
         '4.2', '4.2.1', '4.2.2', '4.2.3', '4.2.4', '4.2.5', '4.2.6', '4.2.7', '4.2.8',
-        '4.3', '4.3.1', '4.3.2', '4.3.3', '4.3.4', '4.3.5', '4.3.6', '4.3.7', '4.3.8',
+        '4.3', '4.3.1', '4.3.2', '4.3.3', '4.3.4', '4.3.5', '4.3.6',
         '4.4', '4.4.1', '4.4.2', '4.4.3', '4.4.4', '4.4.5', '4.4.6',
-        '4.5', '4.5.1', '4.5.2', '4.5.3', '4.5.4', '4.5.5', '4.5.6',
+        '4.5', '4.5.1', '4.5.2', '4.5.3', '4.5.4', '4.5.5', '4.5.6', '4.5.7', '4.5.8',
         '4.6', '4.6.1', '4.6.2', '4.6.3', '4.6.4', '4.6.5', '4.6.6', '4.6.7', '4.6.8',
-        '4.7', '4.7.1', '4.7.2', '4.7.3', '4.7.4', '4.7.5', '4.7.6', '4.7.7', '4.7.8',
         '5', '5.1', '5.2', '5.3', '5.4',
         '5.5', '5.5p', '5.5.1', '5.5.1p', '5.5.2', '5.5.2p', '5.5.3', '5.5.3p', '5.5.4', '5.5.4p', '5.5.5', '5.5.5p',
         '5.5.6', '5.5.6p',
-        '5.6', '5.6p', '5.6.1p', '5.6.2', '5.6.2p', '5.6.3', '5.6.3p', '5.6.4', '5.6.4p',
+        '5.6', '5.6p', '5.6.1', '5.6.1p', '5.6.2', '5.6.2p', '5.6.3', '5.6.3p', '5.6.4', '5.6.4p',
         '5.7', '5.7p', '5.7.1', '5.7.1p', '5.7.2', '5.7.2p', '5.7.3', '5.7.3p', '5.7.4', '5.7.4p', '5.7.5', '5.7.5p',
         '5.7.6', '5.7.6p', '5.7.7', '5.7.7p',
         '5.8', '5.8p', '5.8d', '5.8.1', '5.8.2', '5.8.3', '5.8.3p', '5.8.4', '5.8.4p', '5.8.5', '5.8.5p',
@@ -36,7 +35,7 @@ class ConfigurationMDTH:
         '6.5', '6.5.1', '6.5.2', '6.5.3', '6.5.4', '6.5.5', '6.5.6', '/',
         '6.6', '6.6.1', '6.6.2', '6.6.3', '6.6.4', '6.6.5', '6.6.6', '|',
         '6.7',  '6.7.1',  '6.7.2',  '6.7.3',  '6.7.4',  '6.7.5',  '6.7.6', '"',
-        '6.8',  '6.8.1',  '6.8.2',  '6.8.3',  '6.8.4',  '6.8.5',  '6.8.6', ']',
+        '6.8',  '!',  '6.8.1',  '6.8.2',  '6.8.3',  '6.8.4',  '6.8.5',  '6.8.6', ']',
     ]
 
     data: List[int] = [
@@ -55,8 +54,8 @@ class ConfigurationMDTH:
         '(Ввод числа)',
         '(Ввод числа)',
         '(Ввод текста)',
-        '(Автосумма)\n=4.1+4.2+4.3+4.4+4.5+4.6+4.7',
-        '(Автосумма)\n=4.1c+4.1mc',
+        '(Автосумма)\n=4.1+4.2+4.3+4.4+4.5+4.6',
+        '(Автосумма)\n=4.1c+4.1nc',
         '(Автосумма)\n=4.1.1c+4.1.2c+4.1.3c+4.1.4c+4.1.5c+4.1.6c+4.1.7c+4.1.8c',
         '(Автосумма)\n=4.1.1nc+4.1.2nc+4.1.3nc+4.1.4nc+4.1.5nc+4.1.6nc+4.1.7nc+4.1.8nc',
         ' ',
@@ -92,9 +91,7 @@ class ConfigurationMDTH:
         '(Ввод числа)',
         '(Ввод числа)',
         '(Ввод числа)',
-        '(Автосумма)\n=4.3.1+4.3.2+4.3.3+4.3.4+4.3.5+4.3.6+4.3.7+4.3.8',
-        '(Ввод числа)',
-        '(Ввод числа)',
+        '(Автосумма)\n=4.3.1+4.3.2+4.3.3+4.3.4+4.3.5+4.3.6',
         '(Ввод числа)',
         '(Ввод числа)',
         '(Ввод числа)',
@@ -108,14 +105,7 @@ class ConfigurationMDTH:
         '(Ввод числа)',
         '(Ввод числа)',
         '(Ввод числа)',
-        '(Автосумма)\n=4.5.1+4.5.2+4.5.3+4.5.4+4.5.5+4.5.6',
-        '(Ввод числа)',
-        '(Ввод числа)',
-        '(Ввод числа)',
-        '(Ввод числа)',
-        '(Ввод числа)',
-        '(Ввод числа)',
-        '(Автосумма)\n=4.6.1+4.6.2+4.6.3+4.6.4+4.6.5+4.6.6+4.6.7+4.6.8',
+        '(Автосумма)\n=4.5.1+4.5.2+4.5.3+4.5.4+4.5.5+4.5.6+4.5.7+4.5.8',
         '(Ввод числа)',
         '(Ввод числа)',
         '(Ввод числа)',
@@ -124,7 +114,7 @@ class ConfigurationMDTH:
         '(Ввод числа)',
         '(Ввод числа)',
         '(Ввод числа)',
-        '(Автосумма)\n=4.7.1+4.7.2+4.7.3+4.7.4+4.7.5+4.7.6+4.7.7+4.7.8',
+        '(Автосумма)\n=4.6.1+4.6.2+4.6.3+4.6.4+4.6.5+4.6.6+4.6.7+4.6.8',
         '(Ввод числа)',
         '(Ввод числа)',
         '(Ввод числа)',
@@ -188,6 +178,7 @@ class ConfigurationMDTH:
         '(Ввод числа)',
         '(Ввод числа)',
         '(Ввод числа)',
+        '(Ввод числа)',
         '(Автосумма)\n=6.1+6.2+6.3+6.4+6.5+6.6+6.7+6.8',
         '(Автосумма)\n=6.1.1+6.1.2+6.1.3+6.1.4+6.1.5+6.1.6',
         '(Ввод числа)',
@@ -253,8 +244,6 @@ class ConfigurationMDTH:
         '(Ввод числа)',
         '(Ввод числа)',
         '(Ввод числа)',
-        '(Ввод числа)',
-        '(Ввод числа)',
         '(Ввод текста)',
     ]
     upload: List[dict]
@@ -391,40 +380,7 @@ class ConfigurationMDTH:
         'социальный педагог', 'инструктор по труду', 'психолог', 'социальный работник', 'иные специалисты',
         'указать какие специалисты', 'в иных организациях', 'указать в каких организациях',
         'специалист по социальной работе', 'социальный педагог', 'инструктор по труду', 'психолог',
-        'социальный работник', 'иные специалисты', 'указать какие специалисты',
-        'в государственных организациях культуры',
-        'специалист по социальной работе',
-        'социальный педагог',
-        'инструктор по труду',
-        'психолог',
-        'социальный работник',
-        'иные специалисты',
-        'указать какие специалисты',
-        'в государственных организациях здравоохранения',
-        'специалист по социальной работе',
-        'социальный педагог',
-        'инструктор по труду',
-        'психолог',
-        'социальный работник',
-        'иные специалисты',
-        'указать какие специалисты',
-        'в социально ориентированных негосударственных организациях',
-        'специалист по социальной работе',
-        'социальный педагог',
-        'инструктор по труду',
-        'психолог',
-        'социальный работник',
-        'иные специалисты',
-        'указать какие специалисты',
-        'в иных организациях',
-        'указать в каких организациях',
-        'специалист по социальной работе',
-        'социальный педагог',
-        'инструктор по труду',
-        'психолог',
-        'социальный работник',
-        'иные специалисты',
-        'указать какие специалисты'
+        'социальный работник', 'иные специалисты', 'указать какие специалисты'
     ]
     file: str
 
@@ -0,0 +1,79 @@
+import os
+import re
+
+JSON: str = 'json'
+XML: str = 'xml'
+PYTHON: str = 'python'
+TEXT: str = 'text'
+
+# number of characters looked at when the extension does not tell the content type
+SNIFF_CHARS: int = 4096
+
+EXTENSIONS: dict = {
+    '.json': JSON,
+    '.jsonl': TEXT,
+    '.xml': XML,
+    '.xsd': XML,
+    '.py': PYTHON,
+    '.pyw': PYTHON,
+    '.txt': TEXT,
+    '.log': TEXT,
+    '.md': TEXT,
+}
+
+_PYTHON_LINE = re.compile(
+    r'^(?:#!.*python|(?:async\s+)?def\s+\w+\s*\(|class\s+\w+\s*[(:]|import\s+[\w.]+|from\s+[\w.]+\s+import\s|'
+    r'if\s+__name__\s*==|@\w+)',
+    re.MULTILINE
+)
+
+
+def sniff(text: str) -> str:
+    """
+    Guess the content type from the beginning of a text, nothing is parsed
+    :param text: text or its beginning
+    :return: str JSON, XML, PYTHON or TEXT
+    """
+    head: str = text[:SNIFF_CHARS].lstrip('﻿ \t\r\n')
+    if not head:
+        return TEXT
+    if head[0] in '{[':
+        return JSON
+    if head[0] == '<' and (head.startswith(('<?xml', '<!--', '<!DOCTYPE')) or re.match(r'<[A-Za-z_]', head)):
+        return XML
+    if _PYTHON_LINE.search(head):
+        return PYTHON
+    return TEXT
+
+# content types of the files already detected, keyed by path, size and modification time
+_detected: dict = {}
+_DETECTED_MAX: int = 256
+
+
+def detect(text: str, file_path: str = None) -> str:
+    """
+    Get the content type of a text from the extension of its file, or from its beginning.
+    The result is cached per file and invalidated when the file changes.
+    :param text: text of the file
+    :param file_path: (Optional) path of the file the text was read from
+    :return: str JSON, XML, PYTHON or TEXT
+    """
+    if not file_path:
+        return sniff(text)
+
+    content_type: str | None = EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+    if content_type:
+        return content_type
+
+    try:
+        stat: os.stat_result = os.stat(file_path)
+    except OSError:
+        return sniff(text)
+
+    key: tuple = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    content_type = _detected.get(key)
+    if content_type is None:
+        if len(_detected) >= _DETECTED_MAX:
+            _detected.clear()
+        content_type = _detected[key] = sniff(text)
+    return content_type
@@ -0,0 +1,139 @@
+import zipfile
+from typing import Iterator, List, NamedTuple
+from xml.etree.ElementTree import iterparse
+
+W: str = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+TABLE: str = W + 'tbl'
+ROW: str = W + 'tr'
+CELL: str = W + 'tc'
+PARAGRAPH: str = W + 'p'
+BODY: str = W + 'body'
+
+
+class WordTable(NamedTuple):
+    """
+    Table of a word document, its cells are kept row by row in one flat tuple
+    """
+    width: int
+    cells: tuple
+
+    @property
+    def row_count(self) -> int:
+        return len(self.cells) // self.width if self.width else 0
+
+    def cell(self, row: int, column: int) -> str:
+        return self.cells[row * self.width + column]
+
+    def row(self, row: int) -> tuple:
+        return self.cells[row * self.width:(row + 1) * self.width]
+
+
+def _paragraph_text(paragraph) -> str:
+    """
+    Get the text of a paragraph the way python-docx does
+    :param paragraph: w:p element
+    :return: str text of the runs, tabs and line breaks of the paragraph
+    """
+    parts: list = []
+    for element in paragraph.iter():
+        if element.tag == W + 't':
+            parts.append(element.text or '')
+        elif element.tag == W + 'tab':
+            parts.append('\t')
+        elif element.tag in (W + 'br', W + 'cr'):
+            parts.append('\n')
+    return ''.join(parts)
+
+
+def _cell_span(cell) -> tuple:
+    """
+    Get the merge properties of a cell
+    :param cell: w:tc element
+    :return: tuple of the number of grid columns and True if the cell continues a vertical merge
+    """
+    span: int = 1
+    continues: bool = False
+    properties = cell.find(W + 'tcPr')
+    if properties is not None:
+        grid_span = properties.find(W + 'gridSpan')
+        if grid_span is not None:
+            span = max(1, int(grid_span.get(W + 'val', '1')))
+        merge = properties.find(W + 'vMerge')
+        if merge is not None:
+            continues = merge.get(W + 'val', 'continue') == 'continue'
+    return span, continues
+
+
+def iter_tables(path: str) -> Iterator[WordTable]:
+    """
+    Read the tables of the body of a docx document one by one.
+    The document xml is parsed as a stream and every parsed table is dropped from the tree.
+    Merged cells repeat their text in every grid column they cover, like ``row.cells`` of python-docx.
+    :param path: path of the docx file
+    :return: iterator of WordTable
+    """
+    with zipfile.ZipFile(path) as archive, archive.open('word/document.xml') as document:
+        depth: int = 0
+        rows: list = []
+        row: list = []
+        above: list = []
+        paragraphs: list = []
+
+        for event, element in iterparse(document, events=('start', 'end')):
+            tag: str = element.tag
+            if event == 'start':
+                if tag == TABLE:
+                    depth += 1
+                    if depth == 1:
+                        rows, above = [], []
+                elif depth == 1 and tag == ROW:
+                    row = []
+                elif depth == 1 and tag == CELL:
+                    paragraphs = []
+                continue
+
+            if tag == PARAGRAPH and depth == 1:
+                # paragraphs of nested tables are not part of the text of the outer cell
+                paragraphs.append(_paragraph_text(element))
+            elif tag == CELL and depth == 1:
+                span, continues = _cell_span(element)
+                column: int = len(row)
+                for offset in range(span):
+                    if continues and column + offset < len(above):
+                        row.append(above[column + offset])
+                    else:
+                        row.append('\n'.join(paragraphs))
+            elif tag == ROW and depth == 1:
+                rows.append(row)
+                above = row
+            elif tag == TABLE:
+                depth -= 1
+                if depth == 0:
+                    element.clear()
+                    width: int = max((len(cells) for cells in rows), default=0)
+                    flat: list = []
+                    for cells in rows:
+                        flat.extend(cells)
+                        flat.extend([''] * (width - len(cells)))
+                    yield WordTable(width, tuple(flat))
+            elif depth == 0 and tag == PARAGRAPH:
+                # text outside of the tables is not kept
+                element.clear()
+
+
+def read_tables(path: str) -> List[WordTable]:
+    """
+    Read every table of the body of a docx document
+    :param path: path of the docx file
+    :return: list of WordTable
+    """
+    return list(iter_tables(path))
+
+
+def restore_tables(value: list) -> List[WordTable]:
+    """
+    Rebuild the tables read by read_tables from their json form, as a list of [width, cells] pairs
+    :param value: list of the tables stored as json
+    :return: list of WordTable
+    """
+    return [WordTable(int(width), tuple(cells)) for width, cells in value]
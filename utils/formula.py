@@ -0,0 +1,177 @@
+from typing import Callable, Dict, List, Tuple
+
+AUTOSUM_PREFIX: str = "(Автосумма)\n"
+
+
+class FormulaError(Exception):
+    """
+    Error raised for a broken autosum formula (unknown reference or cycle)
+    """
+
+
+class FormulaEngine:
+    """
+    Compiled autosum formulas of a questionnaire.
+
+    Every ``(Автосумма)\\n=a+b+c`` row is parsed once into a dependency graph.
+    Cells are evaluated in topological order, so nested autosums are computed
+    exactly once per evaluation and every reference is resolved through a dict.
+    """
+
+    def __init__(self, rows: List[dict]) -> None:
+        """
+        Compile the formulas of the questionnaire rows
+        :param rows: list of dicts with "idx", "name" and "data" keys (``mdth`` content)
+        """
+        self.index: Dict[str, int] = {}
+        self.formulas: Dict[str, Tuple[str, ...]] = {}
+        self.order: List[str] = []
+        self.errors: List[FormulaError] = []
+        self.values: Dict[str, int | None] = {}
+        self.dependents: Dict[str, List[str]] = {}
+        self._downstream: Dict[str, List[str]] = {}
+
+        for row, item in enumerate(rows):
+            idx: str = item.get("idx", "")
+            # the last row wins, as the reversed textbox scan did before
+            self.index[idx] = row
+            data: str = item.get("data", "")
+            if data.startswith(AUTOSUM_PREFIX):
+                self.formulas[idx] = self.parse(data)
+
+        for idx, components in self.formulas.items():
+            for component in components:
+                self.dependents.setdefault(component, []).append(idx)
+
+        self._broken: set = set()
+        self._check_references()
+        self._sort()
+        self._position: Dict[str, int] = {idx: position for position, idx in enumerate(self.order)}
+
+    @staticmethod
+    def is_autosum(data: str) -> bool:
+        """
+        Check if the row data is an autosum formula
+        :param data: str row data
+        :return: bool True if the row is an autosum
+        """
+        return data.startswith(AUTOSUM_PREFIX)
+
+    @staticmethod
+    def parse(data: str) -> Tuple[str, ...]:
+        """
+        Parse an autosum formula into its components
+        :param data: str row data, e.g. "(Автосумма)\\n=3.1+3.2"
+        :return: tuple of referenced idx
+        """
+        _, _, expression = data.partition('=')
+        return tuple(component.strip() for component in expression.split('+') if component.strip())
+
+    def _check_references(self) -> None:
+        """
+        Report references to rows which do not exist in the questionnaire
+        :return: None
+        """
+        for idx, components in self.formulas.items():
+            for component in components:
+                if component not in self.index:
+                    self.errors.append(FormulaError(f"Row {idx}: unknown reference '{component}'"))
+                    self._broken.add(idx)
+
+    def _sort(self) -> None:
+        """
+        Topologically sort the autosum cells in row order, reporting cycles
+        :return: None
+        """
+        state: Dict[str, bool] = {}  # False while visiting, True once sorted
+        for idx in self.formulas:
+            self._visit(idx, state, [])
+
+    def _visit(self, idx: str, state: Dict[str, bool], stack: List[str]) -> None:
+        """
+        Depth-first visit of a cell, appending it after its dependencies
+        :param idx: str idx of the cell
+        :param state: dict of visited cells
+        :param stack: list of cells being visited
+        :return: None
+        """
+        if state.get(idx):
+            return
+        if idx in state:
+            cycle: List[str] = stack[stack.index(idx):]
+            self.errors.append(FormulaError(f"Row {idx}: circular reference {' -> '.join(cycle + [idx])}"))
+            self._broken.update(cycle)
+            return
+
+        state[idx] = False
+        stack.append(idx)
+        for component in self.formulas[idx]:
+            if component in self.formulas:
+                self._visit(component, state, stack)
+        stack.pop()
+        state[idx] = True
+        self.order.append(idx)
+
+    def evaluate(self, get_value: Callable[[str], int]) -> Dict[str, int | None]:
+        """
+        Evaluate every autosum cell
+        :param get_value: callable returning the int value of an input row by idx
+        :return: dict of idx -> result, None for broken cells
+        """
+        self.values = {idx: None for idx in self.formulas}
+        for idx in self.order:
+            self.values[idx] = self._evaluate_cell(idx, get_value)
+        return self.values
+
+    def downstream(self, idx: str) -> List[str]:
+        """
+        Get the autosum cells depending on a row, directly or through other cells
+        :param idx: str idx of the changed row
+        :return: list of idx in evaluation order
+        """
+        if idx not in self._downstream:
+            seen: set = set()
+            stack: List[str] = [idx]
+            while stack:
+                for dependent in self.dependents.get(stack.pop(), ()):
+                    if dependent not in seen:
+                        seen.add(dependent)
+                        stack.append(dependent)
+            self._downstream[idx] = sorted(seen, key=self._position.get)
+        return self._downstream[idx]
+
+    def update(self, idx: str, get_value: Callable[[str], int]) -> Dict[str, int | None]:
+        """
+        Recalculate only the cells downstream of a changed row
+        :param idx: str idx of the changed row
+        :param get_value: callable returning the int value of an input row by idx
+        :return: dict of idx -> result for the cells whose value changed, in evaluation order
+        """
+        changed: Dict[str, int | None] = {}
+        for cell in self.downstream(idx):
+            value: int | None = self._evaluate_cell(cell, get_value)
+            if value != self.values.get(cell):
+                self.values[cell] = value
+                changed[cell] = value
+        return changed
+
+    def _evaluate_cell(self, idx: str, get_value: Callable[[str], int]) -> int | None:
+        """
+        Evaluate one autosum cell from already computed dependencies
+        :param idx: str idx of the cell
+        :param get_value: callable returning the int value of an input row by idx
+        :return: int result or None if the cell is broken
+        """
+        if idx in self._broken:
+            return None
+
+        result: int = 0
+        for component in self.formulas[idx]:
+            if component in self.formulas:
+                value: int | None = self.values.get(component)
+                if value is None:
+                    return None
+            else:
+                value: int = get_value(component)
+            result += value
+        return result
@@ -0,0 +1,63 @@
+import importlib
+import sys
+import threading
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module imported on first attribute access.
+    Heavy optional backends (pandas, pyqtgraph, PyPDF2, ...) are bound at module level with
+    lazy_import, so importing the modules using them costs nothing until the backend is needed.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the proxy, the module itself is not imported
+        :param name: full name of the module
+        """
+        super().__init__(name)
+        self.__dict__['_module'] = None
+        self.__dict__['_lock'] = threading.Lock()
+
+    def _load(self) -> types.ModuleType:
+        """
+        Import the module unless it is already imported
+        :return: ModuleType imported module
+        """
+        module = self.__dict__['_module']
+        if module is None:
+            # the proxy may be used from the file loading threads as well
+            with self.__dict__['_lock']:
+                module = self.__dict__['_module']
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__['_module'] = module
+        return module
+
+    @property
+    def loaded(self) -> bool:
+        return self.__dict__['_module'] is not None or self.__name__ in sys.modules
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> list:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.loaded else 'not loaded'
+        return f'<lazy module {self.__name__!r} ({state})>'
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Get a module which is imported when it is first used.
+    A module which is already imported is returned as it is.
+    :param name: full name of the module
+    :return: ModuleType the module or a LazyModule proxy of it
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
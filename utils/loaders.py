@@ -1,9 +1,66 @@
+import hashlib
 import os
 
 from PySide6 import QtCore
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache
 
-from config.cfg import EXE_DIR
+from config.cfg import EXE_DIR, ICON_SIZE, ICON_CACHE_DIR
+
+
+def load_scaled_pixmap(filename: str, size: int = ICON_SIZE, cache_dir: str | None = ICON_CACHE_DIR) -> QPixmap:
+    """
+    Load an image scaled to fit size x size pixels.
+    The scaled image is kept in QPixmapCache and saved to cache_dir, so the source is decoded
+    and scaled only once, the next runs read the small pre-scaled copy.
+    :param filename: Name of the image file
+    :param size: (Optional) size of the scaled image in pixels
+    :param cache_dir: (Optional) directory of the pre-scaled images, None to keep them in memory only
+    :return: QPixmap object, null if the file cannot be read
+    """
+    key: str = f'{size}:{filename}'
+    pixmap: QPixmap | None = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    try:
+        stat: os.stat_result = os.stat(filename)
+    except OSError:
+        return QPixmap()
+
+    cached_path: str | None = None
+    if cache_dir:
+        # a changed source gets a new entry, the stale one is never read again
+        digest: str = hashlib.sha1(
+            f'{os.path.abspath(filename)}|{size}|{stat.st_size}|{stat.st_mtime_ns}'.encode('utf-8')).hexdigest()
+        cached_path = os.path.join(cache_dir, f'{digest}.png')
+        pixmap = QPixmap(cached_path) if os.path.exists(cached_path) else None
+
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(filename)
+        if pixmap.isNull():
+            return pixmap
+        pixmap = pixmap.scaled(
+            size,
+            size,
+            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+            QtCore.Qt.TransformationMode.SmoothTransformation
+        )
+        if cached_path:
+            _save_pixmap(pixmap, cached_path)
+
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _save_pixmap(pixmap: QPixmap, path: str) -> None:
+    # the cache is only an optimisation, an unwritable directory just leaves it cold
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path: str = f'{path}.{os.getpid()}.tmp'
+        if pixmap.save(temp_path, 'PNG'):
+            os.replace(temp_path, path)
+    except OSError:
+        pass
 
 
 def load_icon(filename: str) -> QIcon:
@@ -12,12 +69,7 @@ def load_icon(filename: str) -> QIcon:
     :param filename: Name of the icon file
     :return: QIcon object
     """
-    pixmap = QPixmap(filename)
+    pixmap: QPixmap = load_scaled_pixmap(filename)
     if not pixmap.isNull():
-        return QIcon(pixmap.scaled(
-            30,
-            30,
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation
-        ))
+        return QIcon(pixmap)
     return QIcon()
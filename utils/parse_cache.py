@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+from typing import Any
+
+from config.cfg import PARSE_CACHE_DIR, PARSE_CACHE_MAX_BYTES
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed files.
+
+    An entry is keyed by the path, size and modification time of the source file, so a changed
+    file is parsed again and its old entries are left to the eviction. Entries are stored as json,
+    never as pickles, so an entry can not run code when it is read; the cache is kept in the directory
+    of the user, not in the project, and is shared by every project.
+    Once the cache exceeds max_bytes the least recently used entries are removed.
+    The total size is scanned once and then counted on every put, the directory is scanned again
+    only to evict, or every RESCAN_PUTS puts to take in the entries written by other instances.
+    """
+    RESCAN_PUTS: int = 256
+    # the eviction leaves room for the next entries, so a full cache is not scanned on every put
+    EVICT_TO: float = 0.9
+
+    def __init__(self, directory: str = PARSE_CACHE_DIR, max_bytes: int = PARSE_CACHE_MAX_BYTES) -> None:
+        """
+        Initialize the cache
+        :param directory: (Optional) directory of the cache entries
+        :param max_bytes: maximum total size of the entries
+        """
+        self.directory: str = directory
+        self.max_bytes: int = max_bytes
+        self._lock: threading.Lock = threading.Lock()
+        self._size: int | None = None  # total size of the entries, None until the directory is scanned
+        self._puts: int = 0
+
+    def get(self, file_path: str, part: str = '') -> Any | None:
+        """
+        Get the parsed representation of a file
+        :param file_path: path of the source file
+        :param part: (Optional) name of a part of the file, e.g. a page
+        :return: cached value or None if the file has not been cached in its current state
+        """
+        try:
+            entry_path: str = self._entry_path(file_path, part)
+            with open(entry_path, 'r', encoding='utf-8') as entry:
+                value = json.load(entry)
+            # the modification time of an entry is its last use
+            os.utime(entry_path)
+            return value
+        except (OSError, ValueError):
+            return None
+
+    def put(self, file_path: str, value: Any, part: str = '') -> None:
+        """
+        Store the parsed representation of a file
+        :param file_path: path of the source file
+        :param value: json serialisable value, tuples are read back as lists
+        :param part: (Optional) name of a part of the file, e.g. a page
+        :return: None
+        """
+        try:
+            entry_path: str = self._entry_path(file_path, part)
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path: str = f'{entry_path}.{uuid.uuid4().hex}.tmp'
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as entry:
+                    json.dump(value, entry, ensure_ascii=False, separators=(',', ':'))
+            except (TypeError, ValueError):
+                os.remove(temp_path)
+                return
+            replaced: int = os.path.getsize(entry_path) if os.path.exists(entry_path) else 0
+            os.replace(temp_path, entry_path)
+            added: int = os.path.getsize(entry_path) - replaced
+        except OSError:
+            return
+
+        with self._lock:
+            self._puts += 1
+            if self._size is not None and self._puts % self.RESCAN_PUTS:
+                self._size += added
+                if self._size <= self.max_bytes:
+                    return
+        self._evict()
+
+    def clear(self) -> None:
+        """
+        Remove every entry
+        :return: None
+        """
+        for name in self._entries():
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+        with self._lock:
+            self._size = 0
+
+    def _entry_path(self, file_path: str, part: str) -> str:
+        """
+        Get the path of the entry of a file in its current state
+        :param file_path: path of the source file
+        :param part: name of a part of the file
+        :return: str path of the entry
+        """
+        stat: os.stat_result = os.stat(file_path)
+        key: str = f'{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}|{part}'
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def _entries(self) -> list:
+        try:
+            return [name for name in os.listdir(self.directory) if name.endswith('.json')]
+        except OSError:
+            return []
+
+    def _evict(self) -> None:
+        """
+        Scan the entries and, above max_bytes, remove the least recently used ones down to EVICT_TO of it
+        :return: None
+        """
+        with self._lock:
+            entries: list = []
+            for name in self._entries():
+                try:
+                    stat: os.stat_result = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, name))
+
+            total: int = sum(size for _, size, _ in entries)
+            limit: int = self.max_bytes if total <= self.max_bytes else int(self.max_bytes * self.EVICT_TO)
+            for _, size, name in sorted(entries):
+                if total <= limit:
+                    break
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+                total -= size
+            self._size = total
@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+
+from config.cfg import PDF_CACHE_PAGES
+from utils.parse_cache import ParseCache
+
+
+class LazyPdfDocument:
+    """
+    PDF document whose pages are extracted on demand.
+    Only the page count is read when the document is opened, the text of a page is extracted
+    the first time it is requested and kept in a bounded LRU cache.
+    """
+
+    def __init__(self, path: str, cache_pages: int = PDF_CACHE_PAGES, parse_cache: ParseCache = None) -> None:
+        """
+        Open the document
+        :param path: path of the pdf file
+        :param cache_pages: maximum number of extracted pages kept in memory
+        :param parse_cache: (Optional) on-disk cache of the extracted pages
+        """
+        import pdfplumber
+
+        self.path: str = path
+        self.cache_pages: int = cache_pages
+        self.parse_cache: ParseCache | None = parse_cache
+        self._pdf = pdfplumber.open(path)
+        self.page_count: int = len(self._pdf.pages)
+        self._cache: OrderedDict = OrderedDict()
+        # pdfplumber documents are not thread safe, pages are extracted one at a time
+        self._lock: threading.Lock = threading.Lock()
+
+    def cached_text(self, number: int) -> str | None:
+        """
+        Get the text of a page if it has already been extracted
+        :param number: page number, starting from 0
+        :return: str text of the page or None
+        """
+        with self._lock:
+            text = self._cache.get(number)
+            if text is not None:
+                self._cache.move_to_end(number)
+            return text
+
+    def page_text(self, number: int) -> str:
+        """
+        Get the text of a page, extracting it if needed
+        :param number: page number, starting from 0
+        :return: str text of the page
+        """
+        with self._lock:
+            if number in self._cache:
+                self._cache.move_to_end(number)
+                return self._cache[number]
+
+            if self._pdf is None:
+                raise ValueError('Document is closed')
+
+            part: str = f'page-{number}'
+            text: str | None = self.parse_cache.get(self.path, part) if self.parse_cache else None
+            if text is None:
+                page = self._pdf.pages[number]
+                text = page.extract_text() or ''
+                # drop the layout objects parsed for the page, only the text is kept
+                page.close()
+                if self.parse_cache:
+                    self.parse_cache.put(self.path, text, part)
+
+            self._cache[number] = text
+            while len(self._cache) > self.cache_pages:
+                self._cache.popitem(last=False)
+            return text
+
+    def close(self) -> None:
+        """
+        Close the file of the document
+        :return: None
+        """
+        with self._lock:
+            if self._pdf is not None:
+                self._pdf.close()
+                self._pdf = None
+            self._cache.clear()
@@ -0,0 +1,144 @@
+import os
+import sys
+from functools import lru_cache
+from typing import Callable, Iterable, Tuple
+
+import fpdf.fpdf
+from fpdf import FPDF
+
+from utils.snapshot import AnswerSnapshot
+
+# the fonts are parsed once per process by the template below, so fpdf does not need its
+# pickle cache next to the ttf files (which is not writable in a bundled build anyway)
+fpdf.fpdf.FPDF_CACHE_MODE = 1
+
+FONT_REGULAR: str = 'Export'
+FONT_BOLD: str = 'Export-Bold'
+FONT_SIZE: int = 12
+LINE_HEIGHT: int = 10
+ROWS_PER_BATCH: int = 100
+
+
+class ExportPDF(FPDF):
+    """
+    PDF document of an exported questionnaire
+    """
+
+    def header(self) -> None:
+        """
+        Set header of pdf file
+        :return: None
+        """
+        self.set_font('Arial', 'B', FONT_SIZE)
+        self.cell(0, LINE_HEIGHT, 'Data from Textboxes', 0, 1, 'C')
+
+
+class GlyphSubset(list):
+    """
+    Glyphs used by a document font.
+    fpdf appends every rendered character to the subset list and then looks glyphs up in it
+    for each of the 65536 code points, which gets quadratic on long exports.
+    This list keeps every glyph once and looks them up through a set.
+    """
+
+    def __init__(self, glyphs: Iterable[int] = ()) -> None:
+        super().__init__()
+        self._glyphs: set = set()
+        for glyph in glyphs:
+            self.append(glyph)
+
+    def append(self, glyph: int) -> None:
+        if glyph not in self._glyphs:
+            self._glyphs.add(glyph)
+            super().append(glyph)
+
+    def __contains__(self, glyph: object) -> bool:
+        return glyph in self._glyphs
+
+    def __delitem__(self, index: int | slice) -> None:
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self._glyphs.difference_update(removed)
+
+
+def font_paths() -> Tuple[str, str]:
+    """
+    Get the regular and bold fonts of the export
+    :return: tuple of the regular and bold font paths
+    """
+    if sys.platform.startswith('win32'):
+        return 'C:\\Windows\\Fonts\\arial.ttf', 'C:\\Windows\\Fonts\\arialbd.ttf'
+
+    font_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'fonts')
+    return (os.path.normpath(os.path.join(font_dir, 'DejaVuSans.ttf')),
+            os.path.normpath(os.path.join(font_dir, 'DejaVuSansBold.ttf')))
+
+
+@lru_cache(maxsize=None)
+def template() -> ExportPDF:
+    """
+    Get the template document holding the parsed fonts, built once per process
+    :return: ExportPDF
+    """
+    regular_path, bold_path = font_paths()
+    for font_path in (regular_path, bold_path):
+        if not os.path.isfile(font_path):
+            raise FileNotFoundError(f"Font file not found: {font_path}")
+
+    pdf = ExportPDF()
+    pdf.add_font(FONT_REGULAR, '', regular_path, uni=True)
+    pdf.add_font(FONT_BOLD, '', bold_path, uni=True)
+    return pdf
+
+
+def new_document() -> ExportPDF:
+    """
+    Create a document with the fonts of the template already registered
+    :return: ExportPDF
+    """
+    base: ExportPDF = template()
+    pdf: ExportPDF = ExportPDF()
+    # the glyph metrics are shared, the subset of used glyphs and the object numbers belong to the document
+    pdf.fonts.update({key: dict(font, subset=GlyphSubset(font['subset'])) for key, font in base.fonts.items()})
+    pdf.font_files.update({key: dict(info) for key, info in base.font_files.items()})
+    return pdf
+
+
+def write_lines(pdf: ExportPDF, lines: Iterable[str]) -> None:
+    """
+    Write lines with the current font, several lines per multi_cell call
+    :param pdf: document to write to
+    :param lines: lines to write
+    :return: None
+    """
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) == ROWS_PER_BATCH:
+            pdf.multi_cell(0, LINE_HEIGHT, txt='\n'.join(batch))
+            batch.clear()
+    if batch:
+        pdf.multi_cell(0, LINE_HEIGHT, txt='\n'.join(batch))
+
+
+def render_snapshot(snapshot: AnswerSnapshot, progress: Callable[[int, int], None] = None) -> ExportPDF:
+    """
+    Render the answers and results of a snapshot
+    :param snapshot: answer snapshot of the form to render
+    :param progress: (Optional) callback called with the number of rendered rows and their total
+    :return: ExportPDF
+    """
+    pdf: ExportPDF = new_document()
+    pdf.add_page()
+
+    pdf.set_font(FONT_BOLD, '', FONT_SIZE)
+    pdf.cell(200, LINE_HEIGHT, txt="Data from Textboxes", ln=True, align='C')
+
+    pdf.set_font(FONT_REGULAR, '', FONT_SIZE)
+    write_lines(pdf, (f"{answer.idx} | {answer.name} | {answer.value}"
+                      for answer in snapshot.iter_rows(progress)))
+
+    pdf.add_page()
+    pdf.cell(200, LINE_HEIGHT, txt="Result Data", ln=True, align='C')
+    write_lines(pdf, (" | ".join(row) for row in snapshot.results))
+    return pdf
@@ -1,17 +1,24 @@
 import os
-import sys
-from typing import List
+from typing import Callable, List
 
-from PyPDF2 import PdfReader, PdfWriter
+from config.cfg import EXCEL_ROLLOVER_ROWS
+from utils.lazy_import import lazy_import
+from utils.snapshot import AnswerSnapshot
 
+PyPDF2 = lazy_import('PyPDF2')
 
-def save_to_word(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+PDF_SESSIONS_DIR: str = 'sessions'
+PDF_SESSIONS_INDEX: str = 'index.txt'
+EXCEL_PARTS_DIR: str = 'excel'
+
+
+def save_to_word(path: str, snapshot: AnswerSnapshot,
+                 progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
     Save to word data
     :param path: path to save to file
-    :param result_data: Data to save to word file
-    :param data: Data to save to word file
-    :param textboxes: Text boxes to save to word file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     try:
@@ -19,36 +26,26 @@ def save_to_word(path: str, data: List, textboxes: List, result_data: List[List[
     except ImportError:
         return False, Exception('docx module is not installed')
 
-    if data == []:
-        return False, Exception('Data cannot be empty')
-
-    data_ptr = data[0].get('mdth', None)
-    if not data_ptr:
+    if not snapshot.rows:
         return False, Exception('Data cannot be empty')
 
-    textboxes_ptr: List = textboxes
-    if not textboxes_ptr:
-        return False, Exception('Text boxes cannot be empty')
-
     document = Document()
     document.add_heading("РЕЗУЛЬТАТЫ", level=1)
 
     table_main = document.add_table(rows=1, cols=3)
 
-    for i, item in enumerate(data_ptr):
+    for answer in snapshot.iter_rows(progress):
         row_cells_main = table_main.add_row().cells
-        row_cells_main[0].text = item.get("idx", "")
-        row_cells_main[1].text = item.get("name", "")
-
-        if i < len(textboxes):
-            row_cells_main[2].text = textboxes[i].text()
+        row_cells_main[0].text = answer.idx
+        row_cells_main[1].text = answer.name
+        row_cells_main[2].text = answer.value
 
-    if result_data:
+    if snapshot.results:
         document.add_paragraph("\n")
         document.add_heading("Таблица результатов", level=2)
 
-        table_results = document.add_table(rows=len(result_data), cols=len(result_data[0]) if result_data else 0)
-        for row, row_data in enumerate(result_data):
+        table_results = document.add_table(rows=len(snapshot.results), cols=len(snapshot.results[0]))
+        for row, row_data in enumerate(snapshot.results):
             for col, value in enumerate(row_data):
                 cell = table_results.cell(row, col)
                 cell.text = str(value)
@@ -60,13 +57,13 @@ def save_to_word(path: str, data: List, textboxes: List, result_data: List[List[
         return True, None
 
 
-def append_to_word(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def append_to_word(path: str, snapshot: AnswerSnapshot,
+                   progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
        Save to word data
        :param path: path to save to file
-       :param result_data: Data to save to word file
-       :param data: Data to save to word file
-       :param textboxes: Text boxes to save to word file
+       :param snapshot: answer snapshot of the form to save
+       :param progress: (Optional) callback called with the number of exported rows and their total
        :return: True on success, False on failure + Exception
        """
     try:
@@ -79,7 +76,7 @@ def append_to_word(path: str, data: List, textboxes: List, result_data: List[Lis
             os.makedirs(path)
 
         if not os.path.exists(f'{path}/export/Untitled.docx'):
-            return save_to_word(path, data, textboxes, result_data)
+            return save_to_word(path, snapshot, progress)
 
         file_path = os.path.join(path, 'export', 'Untitled.docx')
 
@@ -89,17 +86,9 @@ def append_to_word(path: str, data: List, textboxes: List, result_data: List[Lis
         else:
             document = Document(file_path)
 
-        if data == []:
-            return False, Exception('Data cannot be empty')
-
-        data_ptr = data[0].get('mdth', None)
-        if not data_ptr:
+        if not snapshot.rows:
             return False, Exception('Data cannot be empty')
 
-        textboxes_ptr: List = textboxes
-        if not textboxes_ptr:
-            return False, Exception('Text boxes cannot be empty')
-
 
         document.add_heading("РЕЗУЛЬТАТЫ", level=1)
 
@@ -109,24 +98,22 @@ def append_to_word(path: str, data: List, textboxes: List, result_data: List[Lis
         hdr_cells[1].text = 'Показатель'
         hdr_cells[2].text = 'Значение'
 
-        for i, item in enumerate(data_ptr):
+        for answer in snapshot.iter_rows(progress):
             row_cells_main = table_main.add_row().cells
-            row_cells_main[0].text = item.get("idx", "")
-            row_cells_main[1].text = item.get("name", "")
+            row_cells_main[0].text = answer.idx
+            row_cells_main[1].text = answer.name
+            row_cells_main[2].text = answer.value
 
-            if i < len(textboxes):
-                row_cells_main[2].text = textboxes[i].text()
-
-        if result_data:
+        if snapshot.results:
             document.add_paragraph("\n")
             document.add_heading("Таблица результатов", level=2)
 
-            table_results = document.add_table(rows=1, cols=len(result_data[0]))
+            table_results = document.add_table(rows=1, cols=len(snapshot.results[0]))
             hdr_cells = table_results.rows[0].cells
-            for col, value in enumerate(result_data[0]):
+            for col, value in enumerate(snapshot.results[0]):
                 hdr_cells[col].text = f"Column {col + 1}"
 
-            for row_data in result_data:
+            for row_data in snapshot.results:
                 row_cells_results = table_results.add_row().cells
                 for col, value in enumerate(row_data):
                     row_cells_results[col].text = str(value)
@@ -137,12 +124,13 @@ def append_to_word(path: str, data: List, textboxes: List, result_data: List[Lis
         return False, Exception(e)
 
 
-def save_to_excel(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def save_to_excel(path: str, snapshot: AnswerSnapshot,
+                  progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
     Save data to excel file
     :param path: path to save to file
-    :param data: Data to save to excel file
-    :param textboxes: Text boxes to save to excel file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     try:
@@ -150,22 +138,14 @@ def save_to_excel(path: str, data: List, textboxes: List, result_data: List[List
     except ImportError:
         return False, Exception('Pandas is not installed')
 
-    if data == []:
+    if not snapshot.rows:
         return False, Exception('Data cannot be empty')
 
-    data_prt = data[0].get('mdth', None)
-    if not data_prt:
-        return False, Exception('Data cannot be empty')
-
-    textboxes_ptr: List = textboxes
-    if not textboxes_ptr:
-        return False, Exception('Text boxes cannot be empty')
-
-    data_list: List = [{'№ п/п': item.get("idx", ""), 'Показатель': item.get("name", ""),
-                        'data': textboxes_ptr[i].text()} for i, item in enumerate(data_prt)]
+    data_list: List = [{'№ п/п': answer.idx, 'Показатель': answer.name,
+                        'data': answer.value} for answer in snapshot.iter_rows(progress)]
     try:
         df_data = pd.DataFrame(data_list)
-        df_result = pd.DataFrame(result_data) if result_data else None
+        df_result = pd.DataFrame(snapshot.results) if snapshot.results else None
     except Exception as e:
         return False, Exception(e)
     else:
@@ -174,323 +154,317 @@ def save_to_excel(path: str, data: List, textboxes: List, result_data: List[List
                 df_data.to_excel(writer, sheet_name='Data', index=False)
                 if df_result is not None:
                     df_result.to_excel(writer, sheet_name='Result Data', index=False)
+            # the sessions appended before the save are superseded by it
+            _clear_excel_parts(path)
         except Exception as e:
             return False, Exception(e)
         else:
             return True, None
 
 
-def append_to_excel(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def append_to_excel(path: str, snapshot: AnswerSnapshot,
+                    progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
-    Save data to excel file
+    Append data to the rolling excel workbook.
+    Sessions are written in long format to part workbooks in export/excel, in write-only mode and from
+    the json lines sidecar of the part, so an append never loads Untitled.xlsx and only rewrites the
+    current part. A new part is started once the current one holds EXCEL_ROLLOVER_ROWS rows.
+    merge_excel_parts adds the sessions to Untitled.xlsx when it is needed
     :param path: path to save to file
-    :param data: Data to save to excel file
-    :param textboxes: Text boxes to save to excel file
-    :param result_data: Additional result data to save
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     try:
-        import pandas as pd
+        import json
+        from openpyxl import Workbook
     except ImportError:
-        return False, Exception('Pandas is not installed')
+        return False, Exception('openpyxl is not installed')
 
-    try:
-        if data == []:
-            return False, Exception('Data cannot be empty')
-
-        data_prt = data[0].get('mdth', None)
-        if not data_prt:
-            return False, Exception('Data cannot be empty')
+    parts_dir = os.path.join(path, 'export', EXCEL_PARTS_DIR)
+    if not os.path.exists(f'{path}/export/Untitled.xlsx') and not os.path.exists(parts_dir):
+        return save_to_excel(path, snapshot, progress)
 
-        textboxes_ptr: List = textboxes
-        if not textboxes_ptr:
-            return False, Exception('Text boxes cannot be empty')
-
-        data_list: List = [{'data': item.text()} for item in textboxes_ptr]
-
-        df_data = pd.DataFrame(data_list)
-        append_result = []
-        if result_data:
-            for item in result_data:
-                append_result.append(item[2])
-            df_result = pd.DataFrame(append_result) if append_result else pd.DataFrame()
-        else:
-            df_result = pd.DataFrame()
-            
-        if not os.path.exists(f'{path}/export/Untitled.xlsx'):
-            return save_to_excel(path, data, textboxes, result_data)
-        
-        try:
-            existing_df_data = pd.read_excel(f'{path}/export/Untitled.xlsx', sheet_name='Data')
-            existing_df_result = pd.read_excel(f'{path}/export/Untitled.xlsx', sheet_name='Result Data')
-        except FileNotFoundError:
-            existing_df_data = pd.DataFrame()
-            existing_df_result = pd.DataFrame()
-            
-        combined_df_data = pd.concat([existing_df_data, df_data], axis=1)
-        combined_df_result = pd.concat([existing_df_result, df_result], axis=1)
-
-        with pd.ExcelWriter(f'{path}/export/Untitled.xlsx', engine='openpyxl', mode='a',
-                            if_sheet_exists='replace') as writer:
-            combined_df_data.to_excel(writer, sheet_name='Data', index=False)
-            combined_df_result.to_excel(writer, sheet_name='Result Data', index=False)
+    if not snapshot.rows:
+        return False, Exception('Data cannot be empty')
 
+    try:
+        import time
+        import uuid
+
+        os.makedirs(parts_dir, exist_ok=True)
+        parts = _excel_parts(path)
+        part = parts[-1] if parts else os.path.join(parts_dir, 'part-0001')
+        sessions = _read_excel_part(part)
+
+        part_rows = sum(len(session['rows']) for session in sessions)
+        if sessions and part_rows + len(snapshot.rows) > EXCEL_ROLLOVER_ROWS:
+            part = os.path.join(parts_dir, f'part-{len(parts) + 1:04d}')
+            sessions = []
+
+        session = {
+            'session': f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}",
+            'rows': [[answer.idx, answer.name, answer.value] for answer in snapshot.iter_rows(progress)],
+            'results': [list(row) for row in snapshot.results],
+        }
+        with open(f'{part}.jsonl', mode='a', encoding='utf-8') as sidecar:
+            sidecar.write(json.dumps(session, ensure_ascii=False) + '\n')
+        sessions.append(session)
+
+        workbook = Workbook(write_only=True)
+        data_sheet = workbook.create_sheet('Data')
+        data_sheet.append(['Сессия', '№ п/п', 'Показатель', 'data'])
+        result_sheet = workbook.create_sheet('Result Data')
+        result_sheet.append(['Сессия', 0, 1, 2])
+        for item in sessions:
+            for row in item['rows']:
+                data_sheet.append([item['session']] + row)
+            for row in item['results']:
+                result_sheet.append([item['session']] + row)
+
+        workbook.save(f'{part}.xlsx.tmp')
+        os.replace(f'{part}.xlsx.tmp', f'{part}.xlsx')
         return True, None
     except Exception as e:
         return False, Exception(e)
 
 
-def save_to_pdf(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def merge_excel_parts(path: str, snapshot: AnswerSnapshot = None,
+                      progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
-    Save data to pdf file
-    :param path: path to save to file
-    :param data: Data to save to pdf file
-    :param textboxes: Text boxes to save to pdf file
-    :param result_data: Result data to save to pdf file
+    Merge the appended sessions into Untitled.xlsx, one column per session as append_to_excel did before
+    :param path: path of the project
+    :param snapshot: unused, the data is read from the parts
+    :param progress: (Optional) callback called with the number of merged parts and their total
     :return: True on success, False on failure + Exception
     """
     try:
-        from fpdf import FPDF
+        import pandas as pd
     except ImportError:
-        return False, Exception('FPDF is not installed')
-
-    if not data:
-        return False, Exception('Data cannot be empty')
-
-    data_prt = data[0].get('mdth', None)
-    if not data_prt:
-        return False, Exception('Data cannot be empty')
-
-    if not textboxes:
-        return False, Exception('Text boxes cannot be empty')
-
-    class PDF(FPDF):
-        """
-        PDF class for saving data to pdf file
-        """
-
-        def header(self) -> None:
-            """
-            Set header of pdf file
-            :return: None
-            """
-            self.set_font('Arial', 'B', 12)
-            self.cell(0, 10, 'Data from Textboxes', 0, 1, 'C')
-
-    pdf = PDF()
-    pdf.add_page()
+        return False, Exception('Pandas is not installed')
 
-    if sys.platform.startswith('win32'):
-        arial_path = 'C:\\Windows\\Fonts\\arial.ttf'
-        arial_bold_path = 'C:\\Windows\\Fonts\\arialbd.ttf'
+    parts = _excel_parts(path)
+    if not parts:
+        return True, None
 
-        # Check if font files exist
-        if not os.path.isfile(arial_path):
-            return False, FileNotFoundError(f"Font file not found: {arial_path}")
-        if not os.path.isfile(arial_bold_path):
-            return False, FileNotFoundError(f"Bold font file not found: {arial_bold_path}")
+    file_path = os.path.join(path, 'export', 'Untitled.xlsx')
+    try:
+        data_frames = []
+        result_frames = []
+        if os.path.exists(file_path):
+            sheets = pd.read_excel(file_path, sheet_name=None)
+            data_frames.append(sheets.get('Data', pd.DataFrame()))
+            result_frames.append(sheets.get('Result Data', pd.DataFrame()))
+
+        for done, part in enumerate(parts, 1):
+            for session in _read_excel_part(part):
+                data_frames.append(pd.DataFrame([{'data': row[2]} for row in session['rows']]))
+                result_frames.append(pd.DataFrame([row[2] for row in session['results'] if len(row) > 2]))
+            if progress:
+                progress(done, len(parts))
+
+        temp_path = os.path.join(path, 'export', 'Temp.xlsx')
+        with pd.ExcelWriter(temp_path, engine='openpyxl') as writer:
+            pd.concat(data_frames, axis=1).to_excel(writer, sheet_name='Data', index=False)
+            pd.concat(result_frames, axis=1).to_excel(writer, sheet_name='Result Data', index=False)
+        os.replace(temp_path, file_path)
+
+        _clear_excel_parts(path)
+    except Exception as e:
+        return False, Exception(e)
+    else:
+        return True, None
 
-        pdf.add_font('Arial', '', arial_path, uni=True)
-        pdf.add_font('Arial-Bold', '', arial_bold_path, uni=True)
-        pdf.set_font('Arial-Bold', '', 12)
 
-        pdf.add_font('Arial', '', arial_path, uni=True)
-        pdf.add_font('Arial-Bold', '', arial_bold_path, uni=True)
-        pdf.set_font('Arial-Bold', '', 12)
+def _excel_parts(path: str) -> List[str]:
+    """
+    Get the part workbooks of the rolling excel export, oldest first
+    :param path: path of the project
+    :return: list of part paths without extension
+    """
+    parts_dir = os.path.join(path, 'export', EXCEL_PARTS_DIR)
+    if not os.path.isdir(parts_dir):
+        return []
+    return [os.path.join(parts_dir, name[:-len('.jsonl')])
+            for name in sorted(os.listdir(parts_dir)) if name.endswith('.jsonl')]
 
-    if sys.platform.startswith('lin'):
-        current_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
-        font_dir = os.path.join(current_dir, 'fonts')
-        font_path = os.path.join(font_dir, 'DejaVuSans.ttf')
-        bold_font_path = os.path.join(font_dir, 'DejaVuSansBold.ttf')
 
-        # Debugging statements to ensure paths are correct
-        print(f"Current Directory: {current_dir}")
-        print(f"Font Directory: {font_dir}")
-        print(f"Regular Font Path: {font_path}")
-        print(f"Bold Font Path: {bold_font_path}")
+def _read_excel_part(part: str) -> List[dict]:
+    """
+    Read the sessions of a part from its json lines sidecar
+    :param part: part path without extension
+    :return: list of sessions
+    """
+    import json
 
-        # Check if font files exist
-        if not os.path.isfile(font_path):
-            return False, FileNotFoundError(f"Font file not found: {font_path}")
+    if not os.path.exists(f'{part}.jsonl'):
+        return []
 
-        if not os.path.isfile(bold_font_path):
-            return False, FileNotFoundError(f"Bold font file not found: {bold_font_path}")
+    sessions = []
+    with open(f'{part}.jsonl', mode='r', encoding='utf-8') as sidecar:
+        for line in sidecar:
+            try:
+                sessions.append(json.loads(line))
+            except json.JSONDecodeError:
+                # a line cut by a crash
+                continue
+    return sessions
 
-        pdf.add_font('DejaVu', '', font_path, uni=True)
-        pdf.add_font('DejaVu-Bold', '', bold_font_path, uni=True)
-        pdf.set_font('DejaVu-Bold', '', 12)
 
-    pdf.cell(200, 10, txt="Data from Textboxes", ln=True, align='C')
+def _clear_excel_parts(path: str) -> None:
+    """
+    Remove the part workbooks of the rolling excel export
+    :param path: path of the project
+    :return: None
+    """
+    import shutil
 
-    for i, item in enumerate(data_prt):
-        text = f"{item.get('idx', '')} | {item.get('name', '')} | {textboxes[i].text()}"
-        if sys.platform.startswith('win32'):
-            pdf.set_font('Arial', '', 12)
+    shutil.rmtree(os.path.join(path, 'export', EXCEL_PARTS_DIR), ignore_errors=True)
 
-        if sys.platform.startswith('lin'):
-            pdf.set_font('DejaVu', '', 12)
 
-        pdf.multi_cell(0, 10, txt=text)
+def _build_pdf(snapshot: AnswerSnapshot, progress: Callable[[int, int], None] = None) -> [object, Exception]:
+    """
+    Render the answers and results of a snapshot to a pdf document
+    :param snapshot: answer snapshot of the form to render
+    :param progress: (Optional) callback called with the number of rendered rows and their total
+    :return: FPDF document on success, None on failure + Exception
+    """
+    try:
+        from utils.pdf_render import render_snapshot
+    except ImportError:
+        return None, Exception('FPDF is not installed')
 
-    pdf.add_page()
-    if sys.platform.startswith('win32'):
-        pdf.set_font('Arial', '', 12)
+    try:
+        return render_snapshot(snapshot, progress), None
+    except FileNotFoundError as e:
+        return None, e
 
-    if sys.platform.startswith('lin'):
-        pdf.set_font('DejaVu', '', 12)
-    pdf.cell(200, 10, txt="Result Data", ln=True, align='C')
 
-    for row in result_data:
-        text = " | ".join(row)
-        if sys.platform.startswith('win32'):
-            pdf.set_font('Arial', '', 12)
+def save_to_pdf(path: str, snapshot: AnswerSnapshot,
+                progress: Callable[[int, int], None] = None) -> [bool, Exception]:
+    """
+    Save data to pdf file
+    :param path: path to save to file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
+    :return: True on success, False on failure + Exception
+    """
+    if not snapshot.rows:
+        return False, Exception('Data cannot be empty')
 
-        if sys.platform.startswith('lin'):
-            pdf.set_font('DejaVu', '', 12)
-        pdf.multi_cell(0, 10, txt=text)
+    pdf, error = _build_pdf(snapshot, progress)
+    if error:
+        return False, error
 
     try:
         output_dir = os.path.join(path, 'export')
         os.makedirs(output_dir, exist_ok=True)
         output_path = os.path.join(output_dir, 'Untitled.pdf')
         pdf.output(output_path)
+        # the sessions appended before the save are superseded by it
+        _clear_pdf_sessions(path)
     except Exception as e:
         return False, e
     else:
         return True, None
 
 
-def append_to_pdf(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def append_to_pdf(path: str, snapshot: AnswerSnapshot,
+                  progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
-    Save data to pdf file
+    Append data to pdf file.
+    The session is saved to its own file in export/sessions and listed in the sessions index,
+    the existing document is not read. merge_pdf_sessions builds Untitled.pdf when it is needed
     :param path: path to save to file
-    :param data: Data to save to pdf file
-    :param textboxes: Text boxes to save to pdf file
-    :param result_data: Result data to save to pdf file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
-    try:
-        from fpdf import FPDF
-    except ImportError:
-        return False, Exception('FPDF is not installed')
-
-    try:
-        if not data:
-            return False, Exception('Data cannot be empty')
-
-        data_prt = data[0].get('mdth', None)
-        if not data_prt:
-            return False, Exception('Data cannot be empty')
-
-        if not textboxes:
-            return False, Exception('Text boxes cannot be empty')
-
-        if not os.path.exists(f'{path}/export/Untitled.pdf'):
-            return save_to_pdf(path, data, textboxes, result_data)
-
-        class PDF(FPDF):
-            def header(self) -> None:
-                self.set_font('Arial', 'B', 12)
-                self.cell(0, 10, 'Data from Textboxes', 0, 1, 'C')
-
-        # Create new PDF or read existing one
-        pdf_path = os.path.join(path, 'export', 'Untitled.pdf')
-
-        pdf = PDF()
-        pdf.add_page()
+    sessions_dir = os.path.join(path, 'export', PDF_SESSIONS_DIR)
+    if not os.path.exists(f'{path}/export/Untitled.pdf') and not os.path.exists(sessions_dir):
+        return save_to_pdf(path, snapshot, progress)
 
-        if sys.platform.startswith('win32'):
-            arial_path = 'C:\\Windows\\Fonts\\arial.ttf'
-            arial_bold_path = 'C:\\Windows\\Fonts\\arialbd.ttf'
-
-            if not os.path.isfile(arial_path):
-                return False, FileNotFoundError(f"Font file not found: {arial_path}")
-            if not os.path.isfile(arial_bold_path):
-                return False, FileNotFoundError(f"Bold font file not found: {arial_bold_path}")
-
-            pdf.add_font('Arial', '', arial_path, uni=True)
-            pdf.add_font('Arial-Bold', '', arial_bold_path, uni=True)
-            pdf.set_font('Arial-Bold', '', 12)
-
-        elif sys.platform.startswith('lin'):
-            current_dir = os.path.abspath(os.path.dirname(__file__))
-            font_dir = os.path.join(current_dir, 'fonts')
-            font_path = os.path.join(font_dir, 'DejaVuSans.ttf')
-            bold_font_path = os.path.join(font_dir, 'DejaVuSansBold.ttf')
-
-            if not os.path.isfile(font_path):
-                return False, FileNotFoundError(f"Font file not found: {font_path}")
-
-            if not os.path.isfile(bold_font_path):
-                return False, FileNotFoundError(f"Bold font file not found: {bold_font_path}")
-
-            pdf.add_font('DejaVu', '', font_path, uni=True)
-            pdf.add_font('DejaVu-Bold', '', bold_font_path, uni=True)
-            pdf.set_font('DejaVu-Bold', '', 12)
-
-        pdf.cell(200, 10, txt="Data from Textboxes", ln=True, align='C')
-
-        for i, item in enumerate(data_prt):
-            text = f"{item.get('idx', '')} | {item.get('name', '')} | {textboxes[i].text()}"
-            if sys.platform.startswith('win32'):
-                pdf.set_font('Arial', '', 12)
-            elif sys.platform.startswith('lin'):
-                pdf.set_font('DejaVu', '', 12)
+    if not snapshot.rows:
+        return False, Exception('Data cannot be empty')
 
-            pdf.multi_cell(0, 10, txt=text)
+    pdf, error = _build_pdf(snapshot, progress)
+    if error:
+        return False, error
 
-        pdf.add_page()
-        if sys.platform.startswith('win32'):
-            pdf.set_font('Arial', '', 12)
-        elif sys.platform.startswith('lin'):
-            pdf.set_font('DejaVu', '', 12)
-        pdf.cell(200, 10, txt="Result Data", ln=True, align='C')
+    try:
+        import time
+        import uuid
 
-        for row in result_data:
-            text = " | ".join(row)
-            if sys.platform.startswith('win32'):
-                pdf.set_font('Arial', '', 12)
-            elif sys.platform.startswith('lin'):
-                pdf.set_font('DejaVu', '', 12)
-            pdf.multi_cell(0, 10, txt=text)
+        os.makedirs(sessions_dir, exist_ok=True)
+        session_name = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.pdf"
+        pdf.output(os.path.join(sessions_dir, session_name))
 
-        try:
-            if os.path.exists(pdf_path):
-                reader = PdfReader(pdf_path)
-                writer = PdfWriter()
+        with open(os.path.join(sessions_dir, PDF_SESSIONS_INDEX), mode='a', encoding='utf-8') as index:
+            index.write(session_name + '\n')
+    except Exception as e:
+        return False, e
+    else:
+        return True, None
 
-                for page in reader.pages:
-                    writer.add_page(page)
 
-                temp_pdf_path = os.path.join(path, 'export', 'Temp.pdf')
-                pdf.output(temp_pdf_path)
+def merge_pdf_sessions(path: str, snapshot: AnswerSnapshot = None,
+                       progress: Callable[[int, int], None] = None) -> [bool, Exception]:
+    """
+    Merge the appended sessions into Untitled.pdf, in the order of the sessions index
+    :param path: path of the project
+    :param snapshot: unused, the data is read from the session files
+    :param progress: (Optional) callback called with the number of merged sessions and their total
+    :return: True on success, False on failure + Exception
+    """
+    sessions_dir = os.path.join(path, 'export', PDF_SESSIONS_DIR)
+    index_path = os.path.join(sessions_dir, PDF_SESSIONS_INDEX)
+    if not os.path.exists(index_path):
+        return True, None
 
-                temp_reader = PdfReader(temp_pdf_path)
-                for page in temp_reader.pages:
+    pdf_path = os.path.join(path, 'export', 'Untitled.pdf')
+    try:
+        with open(index_path, mode='r', encoding='utf-8') as index:
+            sessions = [os.path.join(sessions_dir, name.strip()) for name in index if name.strip()]
+
+        writer = PyPDF2.PdfWriter()
+        documents = ([pdf_path] if os.path.exists(pdf_path) else []) + sessions
+        for done, document in enumerate(documents, 1):
+            if os.path.exists(document):
+                for page in PyPDF2.PdfReader(document).pages:
                     writer.add_page(page)
+            if progress:
+                progress(done, len(documents))
 
-                with open(pdf_path, 'wb') as f:
-                    writer.write(f)
+        temp_pdf_path = os.path.join(path, 'export', 'Temp.pdf')
+        with open(temp_pdf_path, 'wb') as f:
+            writer.write(f)
+        os.replace(temp_pdf_path, pdf_path)
 
-                os.remove(temp_pdf_path)
-            else:
-                pdf.output(pdf_path)
-        except Exception as e:
-            return False, e
-        else:
-            return True, None
+        _clear_pdf_sessions(path)
     except Exception as e:
         return False, e
+    else:
+        return True, None
 
 
-def save_to_csv(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def _clear_pdf_sessions(path: str) -> None:
+    """
+    Remove the appended pdf sessions and their index
+    :param path: path of the project
+    :return: None
+    """
+    import shutil
+
+    shutil.rmtree(os.path.join(path, 'export', PDF_SESSIONS_DIR), ignore_errors=True)
+
+
+def save_to_csv(path: str, snapshot: AnswerSnapshot,
+                progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
     Save data to csv file with csv format
     :param path: path to save to file
-    :param data: Data to save to csv file with csv format
-    :param textboxes: Text boxes to save to csv file with csv format
-    :param result_data: Result data to save to csv file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     try:
@@ -498,30 +472,22 @@ def save_to_csv(path: str, data: List, textboxes: List, result_data: List[List[s
     except ImportError:
         return False, Exception('CSV module is not installed')
 
-    if data == []:
-        return False, Exception('Data cannot be empty')
-
-    data_prt = data[0].get('mdth', None)
-    if not data_prt:
+    if not snapshot.rows:
         return False, Exception('Data cannot be empty')
 
-    textboxes_ptr: List = textboxes
-    if not textboxes_ptr:
-        return False, Exception('Text boxes cannot be empty')
-
     file = None
     try:
         file = open(f"{path}/export/Untitled.csv", mode='w', newline='', encoding='utf-8')
         writer = csv.writer(file)
 
         writer.writerow(['№ п/п', 'Показатель', 'Ответ субъекта'])
-        for i, item in enumerate(data_prt):
-            writer.writerow([item.get("idx", ""), item.get("name", ""), textboxes_ptr[i].text()])
+        for answer in snapshot.iter_rows(progress):
+            writer.writerow([answer.idx, answer.name, answer.value])
 
         writer.writerow([])
 
         writer.writerow(['Result Data'])
-        for row in result_data:
+        for row in snapshot.results:
             writer.writerow(row)
 
     except Exception as e:
@@ -533,13 +499,13 @@ def save_to_csv(path: str, data: List, textboxes: List, result_data: List[List[s
             file.close()
 
 
-def append_to_csv(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def append_to_csv(path: str, snapshot: AnswerSnapshot,
+                  progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
     Save data to csv file with csv format
     :param path: path to save to file
-    :param data: Data to save to csv file with csv format
-    :param textboxes: Text boxes to save to csv file with csv format
-    :param result_data: Result data to save to csv file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     try:
@@ -549,19 +515,11 @@ def append_to_csv(path: str, data: List, textboxes: List, result_data: List[List
 
     try:
         if not os.path.exists(f'{path}/export/Untitled.csv'):
-            return save_to_csv(path, data, textboxes, result_data)
-
-        if data == []:
-            return False, Exception('Data cannot be empty')
+            return save_to_csv(path, snapshot, progress)
 
-        data_prt = data[0].get('mdth', None)
-        if not data_prt:
+        if not snapshot.rows:
             return False, Exception('Data cannot be empty')
 
-        textboxes_ptr: List = textboxes
-        if not textboxes_ptr:
-            return False, Exception('Text boxes cannot be empty')
-
         output_dir = os.path.join(path, 'export')
         os.makedirs(output_dir, exist_ok=True)
         file_path = os.path.join(output_dir, 'Untitled.csv')
@@ -576,15 +534,15 @@ def append_to_csv(path: str, data: List, textboxes: List, result_data: List[List
                 # Write headers if file does not exist
                 writer.writerow(['№ п/п', 'Показатель', 'Ответ субъекта'])
 
-            # Write data from data_prt and textboxes
-            for i, item in enumerate(data_prt):
-                writer.writerow([item.get("idx", ""), item.get("name", ""), textboxes_ptr[i].text()])
+            # Write the answers of the form
+            for answer in snapshot.iter_rows(progress):
+                writer.writerow([answer.idx, answer.name, answer.value])
 
             writer.writerow([])  # Add a blank row for separation
 
             # Write result data
             writer.writerow(['Result Data'])
-            for row in result_data:
+            for row in snapshot.results:
                 writer.writerow(row)
 
         return True, None
@@ -592,46 +550,38 @@ def append_to_csv(path: str, data: List, textboxes: List, result_data: List[List
         return False, Exception(e)
 
 
-def save_to_txt(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def save_to_txt(path: str, snapshot: AnswerSnapshot,
+                progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
     Save data to txt file
     :param path: path to save to file
-    :param data: Data to save to txt file
-    :param textboxes: Text boxes to save to txt file
-    :param result_data: Result data to save to txt file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
-    if data == []:
-        return False, Exception('Data cannot be empty')
-
-    data_prt = data[0].get('mdth', None)
-    if not data_prt:
+    if not snapshot.rows:
         return False, Exception('Data cannot be empty')
 
-    textboxes_ptr: List = textboxes
-    if not textboxes_ptr:
-        return False, Exception('Text boxes cannot be empty')
-
     file = None
     try:
         file = open(f'{path}/export/Untitled.txt', mode='w', encoding='utf-8')
     except Exception as e:
         return False, Exception(e)
     else:
-        for i, item in enumerate(data_prt):
-            line = (f"№ п/п: {item.get('idx', '')}, "
-                    f"Показатель: {item.get('name', '')}, "
-                    f"Ответ субъекта: {textboxes[i].text()}\n")
+        for answer in snapshot.iter_rows(progress):
+            line = (f"№ п/п: {answer.idx}, "
+                    f"Показатель: {answer.name}, "
+                    f"Ответ субъекта: {answer.value}\n")
             try:
                 file.write(line)
             except Exception as e:
                 return False, Exception(e)
 
         file.write("\n")
-        if result_data:
+        if snapshot.results:
             file.write("Result Data:\n")
 
-            for row in result_data:
+            for row in snapshot.results:
                 line = " | ".join(row) + "\n"
 
                 try:
@@ -639,36 +589,27 @@ def save_to_txt(path: str, data: List, textboxes: List, result_data: List[List[s
                 except Exception as e:
                     return False, Exception(e)
 
-        else:
-            return True, None
+        return True, None
     finally:
         if file:
             file.close()
 
 
-def append_to_txt(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def append_to_txt(path: str, snapshot: AnswerSnapshot,
+                  progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
     Save data to txt file
     :param path: path to save to file
-    :param data: Data to save to txt file
-    :param textboxes: Text boxes to save to txt file
-    :param result_data: Result data to save to txt file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     if not os.path.exists(f'{path}/export/Untitled.txt'):
-        return save_to_txt(path, data, textboxes, result_data)
+        return save_to_txt(path, snapshot, progress)
 
-    if data == []:
+    if not snapshot.rows:
         return False, Exception('Data cannot be empty')
 
-    data_prt = data[0].get('mdth', None)
-    if not data_prt:
-        return False, Exception('Data cannot be empty')
-
-    textboxes_ptr: List = textboxes
-    if not textboxes_ptr:
-        return False, Exception('Text boxes cannot be empty')
-
     try:
         output_dir = os.path.join(path, 'export')
         os.makedirs(output_dir, exist_ok=True)
@@ -681,16 +622,16 @@ def append_to_txt(path: str, data: List, textboxes: List, result_data: List[List
             if not file_exists:
                 file.write("Data from Textboxes:\n")
 
-            for i, item in enumerate(data_prt):
-                line = (f"№ п/п: {item.get('idx', '')}, "
-                        f"Показатель: {item.get('name', '')}, "
-                        f"Ответ субъекта: {textboxes[i].text()}\n")
+            for answer in snapshot.iter_rows(progress):
+                line = (f"№ п/п: {answer.idx}, "
+                        f"Показатель: {answer.name}, "
+                        f"Ответ субъекта: {answer.value}\n")
                 file.write(line)
 
             file.write("\n")
-            if result_data:
+            if snapshot.results:
                 file.write("Result Data:\n")
-                for row in result_data:
+                for row in snapshot.results:
                     line = " | ".join(row) + "\n"
                     file.write(line)
 
@@ -699,13 +640,13 @@ def append_to_txt(path: str, data: List, textboxes: List, result_data: List[List
         return False, Exception(e)
 
 
-def save_to_xml(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def save_to_xml(path: str, snapshot: AnswerSnapshot,
+                progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
-    Save data and result_data to xml file
+    Save data and result data to xml file
     :param path: path to save to file
-    :param data: Data to save to xml file
-    :param textboxes: Text boxes to save to xml file
-    :param result_data: Result data to save to xml file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     try:
@@ -713,29 +654,21 @@ def save_to_xml(path: str, data: List, textboxes: List, result_data: List[List[s
     except ImportError:
         return False, Exception('XML is not installed')
 
-    if data == []:
+    if not snapshot.rows:
         return False, Exception('Data cannot be empty')
 
-    data_prt = data[0].get('mdth', None)
-    if not data_prt:
-        return False, Exception('Data cannot be empty')
-
-    textboxes_ptr: List = textboxes
-    if not textboxes_ptr:
-        return False, Exception('Text boxes cannot be empty')
-
     root = Element('root')
 
     data_element = SubElement(root, 'data')
-    for i, item in enumerate(data_prt):
+    for answer in snapshot.iter_rows(progress):
         entry = SubElement(data_element, 'entry')
-        SubElement(entry, 'number').text = item.get('idx', '')
-        SubElement(entry, 'indicator').text = item.get('name', '')
-        SubElement(entry, 'answer').text = textboxes_ptr[i].text()
+        SubElement(entry, 'number').text = answer.idx
+        SubElement(entry, 'indicator').text = answer.name
+        SubElement(entry, 'answer').text = answer.value
 
-    if result_data:
+    if snapshot.results:
         result_element = SubElement(root, 'result_data')
-        for row in result_data:
+        for row in snapshot.results:
             entry = SubElement(result_element, 'entry')
             SubElement(entry, 'field1').text = row[0] if len(row) > 0 else ''
             SubElement(entry, 'field2').text = row[1] if len(row) > 1 else ''
@@ -750,13 +683,13 @@ def save_to_xml(path: str, data: List, textboxes: List, result_data: List[List[s
         return True, None
 
 
-def append_to_xml(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def append_to_xml(path: str, snapshot: AnswerSnapshot,
+                  progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
-    Save data and result_data to xml file
+    Save data and result data to xml file
     :param path: path to save to file
-    :param data: Data to save to xml file
-    :param textboxes: Text boxes to save to xml file
-    :param result_data: Result data to save to xml file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     try:
@@ -765,19 +698,11 @@ def append_to_xml(path: str, data: List, textboxes: List, result_data: List[List
         return False, Exception('XML is not installed')
 
     if not os.path.exists(f'{path}/export/Untitled.xml'):
-        return save_to_xml(path, data, textboxes, result_data)
+        return save_to_xml(path, snapshot, progress)
 
-    if data == []:
+    if not snapshot.rows:
         return False, Exception('Data cannot be empty')
 
-    data_prt = data[0].get('mdth', None)
-    if not data_prt:
-        return False, Exception('Data cannot be empty')
-
-    textboxes_ptr: List = textboxes
-    if not textboxes_ptr:
-        return False, Exception('Text boxes cannot be empty')
-
     output_dir = os.path.join(path, 'export')
     os.makedirs(output_dir, exist_ok=True)
     file_path = os.path.join(output_dir, 'Untitled.xml')
@@ -793,17 +718,17 @@ def append_to_xml(path: str, data: List, textboxes: List, result_data: List[List
         if data_element is None:
             data_element = ET.SubElement(root, 'data')
 
-        for i, item in enumerate(data_prt):
+        for answer in snapshot.iter_rows(progress):
             entry = ET.SubElement(data_element, 'entry')
-            ET.SubElement(entry, 'number').text = item.get('idx', '')
-            ET.SubElement(entry, 'indicator').text = item.get('name', '')
-            ET.SubElement(entry, 'answer').text = textboxes_ptr[i].text()
+            ET.SubElement(entry, 'number').text = answer.idx
+            ET.SubElement(entry, 'indicator').text = answer.name
+            ET.SubElement(entry, 'answer').text = answer.value
 
-        if result_data:
+        if snapshot.results:
             result_element = root.find('result_data')
             if result_element is None:
                 result_element = ET.SubElement(root, 'result_data')
-            for row in result_data:
+            for row in snapshot.results:
                 entry = ET.SubElement(result_element, 'entry')
                 ET.SubElement(entry, 'field1').text = row[0] if len(row) > 0 else ''
                 ET.SubElement(entry, 'field2').text = row[1] if len(row) > 1 else ''
@@ -816,13 +741,13 @@ def append_to_xml(path: str, data: List, textboxes: List, result_data: List[List
         return False, Exception(e)
 
 
-def save_to_json(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def save_to_json(path: str, snapshot: AnswerSnapshot,
+                 progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
     Save data to json file with json format
     :param path: path to save to file
-    :param data: Data to save to json file with json format
-    :param textboxes: Text boxes to save to json file with json format
-    :param result_data: Result data to save to json file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     try:
@@ -830,22 +755,15 @@ def save_to_json(path: str, data: List, textboxes: List, result_data: List[List[
     except ImportError:
         return False, Exception('JSON is not installed')
 
-    if data == []:
+    if not snapshot.rows:
         return False, Exception('Data cannot be empty')
 
-    data_prt = data[0].get('mdth', None)
-    if not data_prt:
-        return False, Exception('Data cannot be empty')
-
-    textboxes_ptr: List = textboxes
-    if not textboxes_ptr:
-        return False, Exception('Text boxes cannot be empty')
-
     # Prepare data
-    data_list = [{'№ п/п': item.get("idx", ""), 'Показатель': item.get("name", ""),
-                  'data': textboxes_ptr[i].text()} for i, item in enumerate(data_prt)]
+    data_list = [{'№ п/п': answer.idx, 'Показатель': answer.name,
+                  'data': answer.value} for answer in snapshot.iter_rows(progress)]
 
-    result_list = [{'Field1': row[0], 'Field2': row[1], 'Field3': row[2]} for row in result_data] if result_data else []
+    result_list = [{'Field1': row[0], 'Field2': row[1], 'Field3': row[2]}
+                   for row in snapshot.results] if snapshot.results else []
 
     combined_data = {'data': data_list, 'result_data': result_list}
 
@@ -857,6 +775,9 @@ def save_to_json(path: str, data: List, textboxes: List, result_data: List[List[
     else:
         try:
             json.dump(combined_data, file, indent=4, ensure_ascii=False)
+            # the session log only keeps the appends made after the last save
+            if os.path.exists(f'{path}/export/Untitled.jsonl'):
+                os.remove(f'{path}/export/Untitled.jsonl')
         except Exception as e:
             return False, Exception(e)
         else:
@@ -866,13 +787,13 @@ def save_to_json(path: str, data: List, textboxes: List, result_data: List[List[
             file.close()
 
 
-def append_to_json(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def append_to_json(path: str, snapshot: AnswerSnapshot,
+                   progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
     Save data to json file with json format
     :param path: path to save to file
-    :param data: Data to save to json file with json format
-    :param textboxes: Text boxes to save to json file with json format
-    :param result_data: Result data to save to json file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     try:
@@ -881,19 +802,11 @@ def append_to_json(path: str, data: List, textboxes: List, result_data: List[Lis
         return False, Exception('JSON is not installed')
 
     if not os.path.exists(f'{path}/export/Untitled.json'):
-        return save_to_json(path, data, textboxes, result_data)
+        return save_to_json(path, snapshot, progress)
 
-    if data == []:
+    if not snapshot.rows:
         return False, Exception('Data cannot be empty')
 
-    data_prt = data[0].get('mdth', None)
-    if not data_prt:
-        return False, Exception('Data cannot be empty')
-
-    textboxes_ptr: List = textboxes
-    if not textboxes_ptr:
-        return False, Exception('Text boxes cannot be empty')
-
     output_dir = os.path.join(path, 'export')
     os.makedirs(output_dir, exist_ok=True)
     file_path = os.path.join(output_dir, 'Untitled.json')
@@ -906,11 +819,11 @@ def append_to_json(path: str, data: List, textboxes: List, result_data: List[Lis
                 existing_data = json.load(f)
 
         # Prepare new data to add
-        data_list = [{'№ п/п': item.get("idx", ""), 'Показатель': item.get("name", ""),
-                      'data': textboxes_ptr[i].text()} for i, item in enumerate(data_prt)]
+        data_list = [{'№ п/п': answer.idx, 'Показатель': answer.name,
+                      'data': answer.value} for answer in snapshot.iter_rows(progress)]
 
         result_list = [{'Field1': row[0], 'Field2': row[1], 'Field3': row[2]} for row in
-                       result_data] if result_data else []
+                       snapshot.results] if snapshot.results else []
 
         combined_data = {'data': data_list, 'result_data': result_list}
 
@@ -925,13 +838,101 @@ def append_to_json(path: str, data: List, textboxes: List, result_data: List[Lis
         return False, Exception(e)
 
 
-def save_to_html(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def append_to_jsonl(path: str, snapshot: AnswerSnapshot,
+                    progress: Callable[[int, int], None] = None) -> [bool, Exception]:
+    """
+    Append data to the json lines session log, one line per session.
+    The log is written with a single write and never read back, use compact_json_log to get the json file
+    :param path: path to save to file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
+    :return: True on success, False on failure + Exception
+    """
+    try:
+        import json
+    except ImportError:
+        return False, Exception('JSON is not installed')
+
+    if not snapshot.rows:
+        return False, Exception('Data cannot be empty')
+
+    data_list = [{'№ п/п': answer.idx, 'Показатель': answer.name,
+                  'data': answer.value} for answer in snapshot.iter_rows(progress)]
+
+    result_list = [{'Field1': row[0], 'Field2': row[1], 'Field3': row[2]}
+                   for row in snapshot.results] if snapshot.results else []
+
+    line = json.dumps({'data': data_list, 'result_data': result_list}, ensure_ascii=False) + '\n'
+
+    try:
+        output_dir = os.path.join(path, 'export')
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, 'Untitled.jsonl'), mode='a', encoding='utf-8') as file:
+            file.write(line)
+            file.flush()
+            os.fsync(file.fileno())
+    except Exception as e:
+        return False, Exception(e)
+    else:
+        return True, None
+
+
+def compact_json_log(path: str, snapshot: AnswerSnapshot = None,
+                     progress: Callable[[int, int], None] = None) -> [bool, Exception]:
+    """
+    Fold the json lines session log into the json file, giving the same file as append_to_json
+    :param path: path to save to file
+    :param snapshot: unused, the data is read from the session log
+    :param progress: (Optional) callback called with the number of replayed sessions and their total
+    :return: True on success, False on failure + Exception
+    """
+    try:
+        import json
+    except ImportError:
+        return False, Exception('JSON is not installed')
+
+    log_path = os.path.join(path, 'export', 'Untitled.jsonl')
+    file_path = os.path.join(path, 'export', 'Untitled.json')
+    if not os.path.exists(log_path):
+        return False, Exception('Session log not found')
+
+    try:
+        combined_data = {}
+        if os.path.exists(file_path):
+            with open(file_path, mode='r', encoding='utf-8') as f:
+                combined_data = json.load(f)
+
+        with open(log_path, mode='r', encoding='utf-8') as f:
+            lines = [line for line in f if line.strip()]
+
+        for done, line in enumerate(lines, 1):
+            try:
+                combined_data.update(json.loads(line))
+            except json.JSONDecodeError:
+                # a line cut by a crash can only be the last one
+                if done != len(lines):
+                    raise
+            if progress:
+                progress(done, len(lines))
+
+        temp_path = file_path + '.tmp'
+        with open(temp_path, mode='w', encoding='utf-8') as file:
+            json.dump(combined_data, file, indent=4, ensure_ascii=False)
+        os.replace(temp_path, file_path)
+        os.remove(log_path)
+    except Exception as e:
+        return False, Exception(e)
+    else:
+        return True, None
+
+
+def save_to_html(path: str, snapshot: AnswerSnapshot,
+                 progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
     Save data to html file with html format with html format
     :param path: path to save to file
-    :param data: Data to save to html file with html format
-    :param textboxes: Text boxes to save to html file with html format
-    :param result_data: Result data to save to html file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     try:
@@ -939,23 +940,15 @@ def save_to_html(path: str, data: List, textboxes: List, result_data: List[List[
     except ImportError:
         return False, Exception('Pandas is not installed')
 
-    if data == []:
+    if not snapshot.rows:
         return False, Exception('Data cannot be empty')
 
-    data_prt = data[0].get('mdth', None)
-    if not data_prt:
-        return False, Exception('Data cannot be empty')
-
-    textboxes_ptr: List = textboxes
-    if not textboxes_ptr:
-        return False, Exception('Text boxes cannot be empty')
-
     # Prepare data
-    data_list = [{'№ п/п': item.get("idx", ""), 'Показатель': item.get("name", ""),
-                  'Ответ субъекта': textboxes_ptr[i].text()} for i, item in enumerate(data_prt)]
+    data_list = [{'№ п/п': answer.idx, 'Показатель': answer.name,
+                  'Ответ субъекта': answer.value} for answer in snapshot.iter_rows(progress)]
     data_df = pd.DataFrame(data_list)
     data_html = data_df.to_html(index=False)
-    result_df = pd.DataFrame(result_data) if result_data else pd.DataFrame()
+    result_df = pd.DataFrame(snapshot.results) if snapshot.results else pd.DataFrame()
     result_html = result_df.to_html(index=False)
     try:
         with open(f'{path}/export/Untitled.html', mode='w', encoding='utf-8') as file:
@@ -971,13 +964,13 @@ def save_to_html(path: str, data: List, textboxes: List, result_data: List[List[
         return True, None
 
 
-def append_to_html(path: str, data: List, textboxes: List, result_data: List[List[str]]) -> [bool, Exception]:
+def append_to_html(path: str, snapshot: AnswerSnapshot,
+                   progress: Callable[[int, int], None] = None) -> [bool, Exception]:
     """
     Save data to html file with html format
     :param path: path to save to file
-    :param data: Data to save to html file with html format
-    :param textboxes: Text boxes to save to html file with html format
-    :param result_data: Result data to save to html file
+    :param snapshot: answer snapshot of the form to save
+    :param progress: (Optional) callback called with the number of exported rows and their total
     :return: True on success, False on failure + Exception
     """
     try:
@@ -986,30 +979,22 @@ def append_to_html(path: str, data: List, textboxes: List, result_data: List[Lis
         return False, Exception('Pandas is not installed')
 
     if not os.path.exists(f'{path}/export/Untitled.html'):
-        return save_to_html(path, data, textboxes, result_data)
+        return save_to_html(path, snapshot, progress)
 
-    if data == []:
+    if not snapshot.rows:
         return False, Exception('Data cannot be empty')
 
-    data_prt = data[0].get('mdth', None)
-    if not data_prt:
-        return False, Exception('Data cannot be empty')
-
-    textboxes_ptr: List = textboxes
-    if not textboxes_ptr:
-        return False, Exception('Text boxes cannot be empty')
-
     output_dir = os.path.join(path, 'export')
     os.makedirs(output_dir, exist_ok=True)
     file_path = os.path.join(output_dir, 'Untitled.html')
 
     # Prepare data
-    data_list = [{'№ п/п': item.get("idx", ""), 'Показатель': item.get("name", ""),
-                  'Ответ субъекта': textboxes_ptr[i].text()} for i, item in enumerate(data_prt)]
+    data_list = [{'№ п/п': answer.idx, 'Показатель': answer.name,
+                  'Ответ субъекта': answer.value} for answer in snapshot.iter_rows(progress)]
     data_df = pd.DataFrame(data_list)
     data_html = data_df.to_html(index=False)
 
-    result_df = pd.DataFrame(result_data) if result_data else pd.DataFrame()
+    result_df = pd.DataFrame(snapshot.results) if snapshot.results else pd.DataFrame()
     result_html = result_df.to_html(index=False)
 
     try:
@@ -1027,6 +1012,74 @@ def append_to_html(path: str, data: List, textboxes: List, result_data: List[Lis
         return False, Exception(e)
 
 
+SAVE_ALL_EXPORTERS: dict = {
+    'word': save_to_word,
+    'excel': save_to_excel,
+    'pdf': save_to_pdf,
+    'csv': save_to_csv,
+    'json': save_to_json,
+    'html': save_to_html,
+    'txt': save_to_txt,
+    'xml': save_to_xml,
+}
+
+
+def _export_worker(name: str, path: str, snapshot: AnswerSnapshot) -> [bool, str]:
+    """
+    Run one exporter of ``export_all`` in a worker process
+    :param name: name of the format, a key of SAVE_ALL_EXPORTERS
+    :param path: path to save to file
+    :param snapshot: answer snapshot of the form to save
+    :return: True on success, False on failure + error message
+    """
+    try:
+        success, error = SAVE_ALL_EXPORTERS[name](path, snapshot)
+    except Exception as e:
+        success, error = False, e
+    return success, str(error) if error else None
+
+
+def export_all(path: str, snapshot: AnswerSnapshot,
+               progress: Callable[[int, int], None] = None) -> [bool, Exception]:
+    """
+    Save data to every format at once, each exporter running in its own worker process
+    :param path: path to save to file
+    :param snapshot: answer snapshot of the form to save, shared by every exporter
+    :param progress: (Optional) callback called with the number of saved formats and their total
+    :return: True on success, False on failure + Exception listing the failed formats
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    if not snapshot.rows:
+        return False, Exception('Data cannot be empty')
+
+    errors: List[str] = []
+    total: int = len(SAVE_ALL_EXPORTERS)
+    # spawn works the same way on every platform and in a PyInstaller build
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=min(total, os.cpu_count() or 1), mp_context=context) as executor:
+        futures = {executor.submit(_export_worker, name, path, snapshot): name for name in SAVE_ALL_EXPORTERS}
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    success, error = future.result()
+                except Exception as e:
+                    success, error = False, str(e)
+                if not success:
+                    errors.append(f'{futures[future]}: {error}')
+                if progress:
+                    progress(done, total)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    if errors:
+        return False, Exception('; '.join(errors))
+    return True, None
+
+
 def generate_mdth_file(data, filename: str, mode: str = "w", encoding: str = "utf-8") -> [bool, Exception]:
     """
     Generate markdown file from data
@@ -0,0 +1,47 @@
+from typing import Callable, Iterator, List, NamedTuple, Tuple
+
+
+class AnswerRow(NamedTuple):
+    """
+    One answered row of a questionnaire
+    """
+    idx: str
+    name: str
+    value: str
+
+
+class AnswerSnapshot(NamedTuple):
+    """
+    Immutable snapshot of a filled questionnaire: the answers of every row and
+    the computed result table. It does not reference any Qt object, so it can be
+    exported from a worker thread, another process or a test.
+    """
+    rows: Tuple[AnswerRow, ...]
+    results: Tuple[Tuple[str, ...], ...]
+
+    @classmethod
+    def create(cls, rows: List[dict], answers: List[str], result_data: List[List[str]]) -> 'AnswerSnapshot':
+        """
+        Create a snapshot from the questionnaire rows and their answers
+        :param rows: list of dicts with "idx" and "name" keys (``mdth`` content)
+        :param answers: list of answers, one per row
+        :param result_data: list of rows of the result table
+        :return: AnswerSnapshot
+        """
+        return cls(
+            rows=tuple(AnswerRow(item.get("idx", ""), item.get("name", ""), answer)
+                       for item, answer in zip(rows, answers)),
+            results=tuple(tuple(str(value) for value in row) for row in result_data or [])
+        )
+
+    def iter_rows(self, progress: Callable[[int, int], None] = None) -> Iterator[AnswerRow]:
+        """
+        Iterate over the answered rows, reporting the progress after each row
+        :param progress: (Optional) callback called with the number of processed rows and their total
+        :return: iterator of AnswerRow
+        """
+        total: int = len(self.rows)
+        for done, row in enumerate(self.rows, 1):
+            yield row
+            if progress is not None:
+                progress(done, total)
@@ -0,0 +1,189 @@
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from typing import Any, Callable, List
+
+from config.cfg import APP_CACHE_DIR, PROBE_MAX_AGE, STARTUP_PROFILE_RUNS
+
+# the phases of the start-up are timed from the import of this module, main imports it first
+STARTED: float = time.perf_counter()
+
+PROBES_PATH: str = os.path.join(APP_CACHE_DIR, 'probes.json')
+PROFILE_PATH: str = os.path.join(APP_CACHE_DIR, 'startup.jsonl')
+
+
+def _write_atomic(path: str, text: str) -> None:
+    # the files are only an optimisation, an unwritable directory just leaves them out
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path: str = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+class ProbeCache:
+    """
+    Results of environment probes kept between runs.
+    An entry is used while the key it was probed with (e.g. the path and mtime of an executable)
+    is unchanged and it is not older than max_age seconds.
+    """
+
+    def __init__(self, path: str = PROBES_PATH, max_age: float = PROBE_MAX_AGE) -> None:
+        """
+        Initialize the cache, the file is read on first use
+        :param path: path of the json file of the cache
+        :param max_age: (Optional) seconds for which a probed value is trusted
+        """
+        self.path: str = path
+        self.max_age: float = max_age
+        self._entries: dict | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        _write_atomic(self.path, json.dumps(self._entries, ensure_ascii=False, indent=1))
+
+    def probe(self, name: str, key: str, function: Callable[[], Any]) -> Any:
+        """
+        Get the value of a probe, running it if the cached value is missing, stale or of another key
+        :param name: name of the probe
+        :param key: state of the environment the value depends on
+        :param function: probe returning a json serialisable value
+        :return: value of the probe
+        """
+        with self._lock:
+            entry: dict | None = self._load().get(name)
+            if entry and entry.get('key') == key and time.time() - entry.get('time', 0) <= self.max_age:
+                return entry['value']
+
+        value = function()
+        with self._lock:
+            self._load()[name] = {'key': key, 'time': time.time(), 'value': value}
+            self._save()
+        return value
+
+    def due(self, name: str, interval: float) -> bool:
+        """
+        Check whether a periodic task is to be run
+        :param name: name of the task
+        :param interval: seconds between the runs of the task
+        :return: bool True if the task has not been run for interval seconds
+        """
+        with self._lock:
+            entry: dict | None = self._load().get(name)
+            return not entry or time.time() - entry.get('time', 0) >= interval
+
+    def done(self, name: str) -> None:
+        """
+        Record a run of a periodic task
+        :param name: name of the task
+        :return: None
+        """
+        with self._lock:
+            self._load()[name] = {'time': time.time()}
+            self._save()
+
+
+def _runs(*command: str) -> bool:
+    try:
+        subprocess.run(command, check=True, capture_output=True, timeout=10)
+        return True
+    except (subprocess.SubprocessError, OSError):
+        return False
+
+
+def python_installed(cache: ProbeCache = None) -> bool:
+    """
+    Check whether python is installed, the result is cached for the interpreter found in PATH
+    :param cache: (Optional) cache of the probes, the shared one by default
+    :return: bool True if python can be run
+    """
+    executable: str | None = shutil.which('python')
+    if executable is None:
+        return False
+    try:
+        stat: os.stat_result = os.stat(executable)
+    except OSError:
+        return False
+
+    # another interpreter or an updated one is probed again
+    key: str = f'{os.path.realpath(executable)}|{stat.st_size}|{stat.st_mtime_ns}'
+    return (cache or probes).probe('python_installed', key, lambda: _runs(executable, '--version'))
+
+
+class StartupProfile:
+    """
+    Timings of the start-up phases in milliseconds from STARTED.
+    The timings of every start are appended to a json lines file, so start-up regressions are measurable.
+    """
+
+    def __init__(self, started: float = STARTED, path: str = PROFILE_PATH) -> None:
+        """
+        Initialize the profile
+        :param started: perf_counter value the phases are timed from
+        :param path: path of the json lines file of the timings
+        """
+        self.started: float = started
+        self.path: str = path
+        self.phases: dict = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def mark(self, phase: str) -> float:
+        """
+        Record the end of a phase, a phase is recorded only the first time it ends
+        :param phase: name of the phase
+        :return: float milliseconds from the start
+        """
+        with self._lock:
+            if phase not in self.phases:
+                self.phases[phase] = round((time.perf_counter() - self.started) * 1000, 1)
+            return self.phases[phase]
+
+    def save(self, keep: int = STARTUP_PROFILE_RUNS) -> None:
+        """
+        Append the timings of this start to the file, only the last starts are kept
+        :param keep: (Optional) number of starts kept
+        :return: None
+        """
+        with self._lock:
+            record: dict = {'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'phases': dict(self.phases)}
+        lines: List[str] = [json.dumps(run) for run in self.load(self.path)]
+        lines.append(json.dumps(record))
+        _write_atomic(self.path, '\n'.join(lines[-keep:]) + '\n')
+
+    @staticmethod
+    def load(path: str = PROFILE_PATH) -> List[dict]:
+        """
+        Read the recorded starts
+        :param path: path of the json lines file of the timings
+        :return: list of records with the time of the start and its phases
+        """
+        records: List[dict] = []
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            pass
+        return records
+
+
+probes: ProbeCache = ProbeCache()
+profile: StartupProfile = StartupProfile()
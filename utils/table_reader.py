@@ -0,0 +1,188 @@
+import itertools
+import os
+from typing import Iterator, List
+
+from config.cfg import TABLE_CHUNK_ROWS
+from utils.lazy_import import lazy_import
+
+pd = lazy_import('pandas')
+
+Columns = List[List[str]]
+
+
+class TableReader:
+    """
+    Reader of a csv or excel file, chunk by chunk.
+    Each chunk is returned column by column with the values already converted to display strings,
+    only the header and the first chunk are read when the file is opened. A chunk read before can be
+    read again by its number, so no rows have to be kept: a csv file is read from the saved offset
+    of the chunk, an xlsx sheet is parsed anew up to it.
+    Legacy .xls files have no streaming reader, their sheet is read at once and kept in memory.
+    """
+
+    def __init__(self, path: str, chunk_rows: int = TABLE_CHUNK_ROWS) -> None:
+        """
+        Open the file and read its first chunk
+        :param path: path of the csv, xlsx or xls file
+        :param chunk_rows: number of rows of a chunk
+        """
+        self.path: str = path
+        self.chunk_rows: int = chunk_rows
+        self.columns: List[str] = []
+        self.exhausted: bool = False
+        self._workbook = None
+        self._csv = None
+        self._frame: pd.DataFrame | None = None
+        self._header_row: int = 1
+        self._rows: Iterator | None = None
+        # byte offsets of the csv chunks, found by a scan of the lines which is continued on demand
+        self._offsets: List[int] = []
+        self._scan: tuple = (0, -1, False)  # position, records before it without the header, inside quotes
+
+        extension: str = os.path.splitext(path)[1].lower()
+        if extension == '.csv':
+            self._open_csv()
+        elif extension == '.xlsx':
+            self._open_xlsx()
+        else:
+            # legacy formats are not streamed, the sheet is read at once
+            self._frame = pd.read_excel(path).fillna('')
+            self.columns = [str(column) for column in self._frame.columns]
+            self._rows = iter(self._frame.itertuples(index=False, name=None))
+
+        self._buffered: Columns | None = self._read()
+
+    def read_chunk(self) -> Columns | None:
+        """
+        Read the next chunk
+        :return: list of the columns of the chunk or None at the end of the file
+        """
+        if self._buffered is not None:
+            chunk, self._buffered = self._buffered, None
+            return chunk
+        return self._read()
+
+    def read_chunk_at(self, number: int) -> Columns | None:
+        """
+        Read a chunk again by its number
+        :param number: number of the chunk, the first one is 0
+        :return: list of the columns of the chunk or None if the file has no such chunk or is closed
+        """
+        start: int = number * self.chunk_rows
+        if self._csv is not None:
+            offset: int | None = self._csv_offset(number)
+            if offset is None:
+                return None
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                # the columns are taken by position, the header is not read again
+                frame: pd.DataFrame = pd.read_csv(f, header=None, nrows=self.chunk_rows,
+                                                  dtype=str, keep_default_na=False)
+            return [frame[column].tolist() for column in frame.columns] if len(frame) else None
+        if self._workbook is not None:
+            first: int = self._header_row + 1 + start
+            rows: list = list(self._workbook.active.iter_rows(min_row=first, max_row=first + self.chunk_rows - 1,
+                                                              values_only=True))
+            return self._to_columns(rows)
+        if self._frame is not None:
+            return self._to_columns(list(
+                self._frame.iloc[start:start + self.chunk_rows].itertuples(index=False, name=None)))
+        return None
+
+    def close(self) -> None:
+        """
+        Close the file
+        :return: None
+        """
+        self.exhausted = True
+        self._buffered = None
+        self._rows = None
+        self._frame = None
+        if self._csv is not None:
+            self._csv.close()
+            self._csv = None
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+
+    def _open_csv(self) -> None:
+        # every value is kept as written in the file, empty cells stay empty
+        self._csv = pd.read_csv(self.path, chunksize=self.chunk_rows, dtype=str, keep_default_na=False)
+
+    def _csv_offset(self, number: int) -> int | None:
+        """
+        Find the byte offset of a csv chunk, the lines are scanned up to it once
+        :param number: number of the chunk
+        :return: offset of the first row of the chunk or None if the file has no such chunk
+        """
+        if number < len(self._offsets):
+            return self._offsets[number]
+
+        position, records, quoted = self._scan
+        with open(self.path, 'rb') as f:
+            f.seek(position)
+            while len(self._offsets) <= number:
+                line: bytes = f.readline()
+                if not line:
+                    break
+                # blank lines between the rows are skipped by pandas as well
+                if not quoted and line.strip():
+                    if records >= 0 and records % self.chunk_rows == 0:
+                        self._offsets.append(position)
+                    records += 1
+                # a value with a line break is quoted, escaped quotes come in pairs
+                if line.count(b'"') % 2:
+                    quoted = not quoted
+                position += len(line)
+        self._scan = position, records, quoted
+        return self._offsets[number] if number < len(self._offsets) else None
+
+    def _open_xlsx(self) -> None:
+        from openpyxl import load_workbook
+
+        self._workbook = load_workbook(self.path, read_only=True, data_only=True)
+        self._header_row = self._workbook.active.min_row
+        self._rows = self._workbook.active.iter_rows(values_only=True)
+        header: tuple = next(self._rows, ())
+        self.columns = ['' if value is None else str(value) for value in header]
+
+    def _read(self) -> Columns | None:
+        """
+        Read the next chunk from the file
+        :return: list of the columns of the chunk or None at the end of the file
+        """
+        if self.exhausted:
+            return None
+
+        if self._csv is not None:
+            try:
+                frame: pd.DataFrame = next(self._csv)
+            except StopIteration:
+                frame = None
+            if frame is not None:
+                self.columns = self.columns or [str(column) for column in frame.columns]
+                return [frame[column].tolist() for column in frame.columns]
+            self.exhausted = True
+            return None
+
+        rows: list = list(itertools.islice(self._rows, self.chunk_rows)) if self._rows is not None else []
+        chunk: Columns | None = self._to_columns(rows)
+        if chunk is None:
+            self.exhausted = True
+        return chunk
+
+    def _to_columns(self, rows: list) -> Columns | None:
+        """
+        Convert rows of an excel sheet to the columns of a chunk
+        :param rows: list of tuples of the cell values
+        :return: list of the columns or None if there are no rows
+        """
+        if not rows:
+            return None
+
+        width: int = len(self.columns)
+        chunk: Columns = [[] for _ in range(width)]
+        for row in rows:
+            for column, value in zip(chunk, itertools.chain(row, itertools.repeat(None, width - len(row)))):
+                column.append('' if value is None else str(value))
+        return chunk
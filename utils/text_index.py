@@ -0,0 +1,139 @@
+import mmap
+import os
+import threading
+
+from config.cfg import LINE_INDEX_CHUNK_BYTES
+from utils.lazy_import import lazy_import
+
+np = lazy_import('numpy')
+
+
+class MappedTextFile:
+    """
+    Read-only text file mapped in memory and accessed line by line.
+    The offsets of the lines are found by build_index, which may run on a worker thread
+    while the lines already indexed are read.
+    """
+
+    def __init__(self, path: str, encoding: str = 'utf-8') -> None:
+        """
+        Map the file
+        :param path: path of the text file
+        :param encoding: encoding of the file
+        """
+        self.path: str = path
+        self.encoding: str = encoding
+        self.size: int = os.path.getsize(path)
+        self._file = open(path, 'rb')
+        # an empty file cannot be mapped
+        self._map: mmap.mmap | None = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self._starts: np.ndarray = np.zeros(1, dtype=np.int64)
+        self._indexed: int = 0
+        self._complete: bool = not self.size
+        self._closed: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def complete(self) -> bool:
+        return self._complete
+
+    @property
+    def line_count(self) -> int:
+        """
+        Get the number of lines indexed so far
+        :return: int number of lines
+        """
+        with self._lock:
+            return self._line_count()
+
+    def build_index(self, progress=None) -> int:
+        """
+        Find the start of every line of the file
+        :param progress: (Optional) callback called with the number of lines indexed after each chunk
+        :return: int number of lines
+        """
+        while True:
+            with self._lock:
+                if self._closed or self._complete:
+                    return self._line_count()
+                start: int = self._indexed
+                # the chunk is copied so no buffer of the map outlives the lock
+                chunk: bytes = self._map[start:start + LINE_INDEX_CHUNK_BYTES]
+
+            newlines: np.ndarray = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 10) + (start + 1)
+
+            with self._lock:
+                if self._closed:
+                    return 0
+                self._starts = np.concatenate((self._starts, newlines.astype(np.int64)))
+                self._indexed = start + len(chunk)
+                if self._indexed >= self.size:
+                    self._complete = True
+                count: int = self._line_count()
+
+            if progress:
+                progress(count)
+
+    def line(self, number: int) -> str:
+        """
+        Get a line without its line break
+        :param number: line number, starting from 0
+        :return: str text of the line
+        """
+        with self._lock:
+            if self._closed or not 0 <= number < self._line_count():
+                return ''
+            begin: int = int(self._starts[number])
+            end: int = int(self._starts[number + 1]) - 1 if number + 1 < len(self._starts) else self.size
+            raw: bytes = self._map[begin:end]
+        return raw.rstrip(b'\r').decode(self.encoding, errors='replace')
+
+    def line_of(self, offset: int) -> int:
+        """
+        Get the line containing a byte offset
+        :param offset: byte offset in the file
+        :return: int line number
+        """
+        with self._lock:
+            return int(np.searchsorted(self._starts, offset, side='right')) - 1
+
+    def find(self, text: str, from_line: int = 0) -> int:
+        """
+        Find the first indexed line containing a text, searching from a line to the end and then from the start
+        :param text: text to find
+        :param from_line: line number to start the search from
+        :return: int line number or -1 if the text is not found
+        """
+        needle: bytes = text.encode(self.encoding)
+        if not needle:
+            return -1
+
+        with self._lock:
+            if self._closed or not self._line_count():
+                return -1
+            end: int = self.size if self._complete else int(self._starts[-1])
+            begin: int = int(self._starts[min(max(from_line, 0), len(self._starts) - 1)])
+            offset: int = self._map.find(needle, begin, end)
+            if offset < 0:
+                offset = self._map.find(needle, 0, end)
+        return self.line_of(offset) if offset >= 0 else -1
+
+    def close(self) -> None:
+        """
+        Unmap and close the file, a running build_index stops after its current chunk
+        :return: None
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._map is not None:
+                self._map.close()
+            self._file.close()
+
+    def _line_count(self) -> int:
+        if self._complete:
+            # a final line break does not start another line
+            ends_with_break: bool = bool(len(self._starts) > 1 and self._starts[-1] == self.size)
+            return len(self._starts) - 1 if ends_with_break else len(self._starts) if self.size else 0
+        return len(self._starts) - 1
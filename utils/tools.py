@@ -7,6 +7,7 @@ def check_configuration():
 
     if os.path.exists(config_file_path):
         yield True
+        return
 
     try:
         from utils.configuration_config_mdt import ConfigurationMDTH
@@ -19,9 +20,16 @@ def check_configuration():
 
 
 def remove_pycache_dirs(start_path='.'):
-    for root, dirs, files in os.walk(start_path):
-        for dir_name in dirs:
-            if dir_name == '__pycache__':
-                pycache_path = os.path.join(root, dir_name)
-                shutil.rmtree(pycache_path)
-                yield f"Removed: {pycache_path}"
+    # the progress is counted in top-level directories
+    top_dirs = [entry.path for entry in os.scandir(start_path) if entry.is_dir(follow_symlinks=False)]
+    for done, top_dir in enumerate(top_dirs):
+        if os.path.basename(top_dir) == '__pycache__':
+            shutil.rmtree(top_dir, ignore_errors=True)
+            yield f"Removed: {top_dir}"
+        for root, dirs, files in os.walk(top_dir):
+            for dir_name in dirs:
+                if dir_name == '__pycache__':
+                    pycache_path = os.path.join(root, dir_name)
+                    shutil.rmtree(pycache_path, ignore_errors=True)
+                    yield f"Removed: {pycache_path}"
+        yield done + 1, len(top_dirs)